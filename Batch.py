@@ -0,0 +1,326 @@
+from Cache import BuildCache, SpecCache
+from Output import BackgroundWriter, FileSink
+from Parser import Parser, add_cache_arguments
+from argparse import ArgumentParser
+from concurrent.futures import ProcessPoolExecutor
+from fnmatch import fnmatch
+from glob import glob
+from time import perf_counter
+import json
+import os
+import sys
+
+# The build cache, spec cache and sink of a worker process
+worker_cache = None
+worker_spec_cache = None
+worker_sink = None
+worker_memory_budget = None
+worker_generators = None
+
+
+def read_entries(path):
+    """
+    Reads a file listing one entry per line
+
+    :param path: The path of the file
+    :return: A generator of the entries
+    """
+    with open(path, 'rt') as file:
+        for line in file:
+            entry = line.strip()
+            # Skip blank lines and comments
+            if entry and not entry.startswith('#'):
+                yield entry
+
+
+def collect_spec_files(sources, manifests=(), pattern='*.txt'):
+    """
+    Collects the spec files named by a set of sources
+
+    :param sources: Spec file paths, directories or glob patterns
+    :param manifests: Manifest files listing one source per line
+    :param pattern: The pattern spec files found in a directory must match
+    :return: The spec file paths in order without duplicates
+    """
+    sources = list(sources)
+    for manifest in manifests:
+        manifest_directory = os.path.dirname(manifest)
+        sources.extend(os.path.join(manifest_directory, source) for source in read_entries(manifest))
+
+    spec_files = dict()
+    for source in sources:
+        if os.path.isdir(source):
+            for directory, directories, files in os.walk(source):
+                directories.sort()
+                for name in sorted(files):
+                    if fnmatch(name, pattern):
+                        spec_files[os.path.join(directory, name)] = None
+        elif os.path.isfile(source):
+            spec_files[source] = None
+        else:
+            matches = sorted(glob(source, recursive=True))
+            if not matches:
+                raise FileNotFoundError(f'No spec files match {source}')
+            for match in matches:
+                if os.path.isfile(match):
+                    spec_files[match] = None
+
+    return list(spec_files)
+
+
+def initialise_worker(manifest_file, write_if_changed, background_writes, spec_cache_directory=None,
+                      memory_budget=None):
+    """
+    Loads the build cache and opens the sink once per worker process, the generators are created as the worker
+    needs them
+
+    :param manifest_file: The manifest of the build cache, there's no cache if it's None
+    :param write_if_changed: Whether files are only written if their content changed
+    :param background_writes: The queue size of a background writer, files are written inline if it's None
+    :param spec_cache_directory: The directory of the spec cache, there's no spec cache if it's None
+    :param memory_budget: The characters of each section the generators hold in memory, there's no limit if it's
+    None
+    """
+    global worker_cache, worker_spec_cache, worker_sink, worker_memory_budget, worker_generators
+    worker_memory_budget = memory_budget
+    worker_generators = dict()
+    worker_cache = BuildCache(manifest_file) if manifest_file else None
+    worker_spec_cache = SpecCache(spec_cache_directory) if spec_cache_directory else None
+    worker_sink = FileSink(write_if_changed=write_if_changed)
+    if background_writes:
+        worker_sink = BackgroundWriter(worker_sink, background_writes)
+
+
+def compile_spec(spec_file):
+    """
+    Compiles a single spec file, this runs inside a worker process
+
+    :param spec_file: The spec file
+    :return: The result of compiling the spec file
+    """
+    start = perf_counter()
+    files_written, files_skipped = worker_sink.files_written, worker_sink.files_skipped
+    parser = Parser(spec_file, cache=worker_cache, sink=worker_sink, spec_cache=worker_spec_cache,
+                    memory_budget=worker_memory_budget)
+    result = dict(file=spec_file, success=True, error=None)
+    try:
+        try:
+            parser.parse_file()
+        finally:
+            if isinstance(worker_sink, BackgroundWriter):
+                worker_sink.flush()
+    except Exception as error:
+        result.update(success=False, error=f'{type(error).__name__}: {error}')
+    result.update(seconds=perf_counter() - start, skipped_classes=parser.skipped_classes,
+                  files_written=worker_sink.files_written - files_written,
+                  files_skipped=worker_sink.files_skipped - files_skipped)
+    if worker_cache:
+        updates = worker_cache.take_updates()
+        # A spec file is only cached once everything it generated is known to be written
+        result['cache_updates'] = updates if result['success'] else dict()
+    return result
+
+
+def generate_class(class_node):
+    """
+    Generates a single parsed class, this runs inside a worker process
+
+    :param class_node: The parsed class
+    :return: The error if it couldn't be generated, None otherwise
+    """
+    generator = worker_generators.get(class_node.language)
+    if generator is None:
+        generator = Parser.create_generator(class_node.language, worker_sink, worker_memory_budget)
+        worker_generators[class_node.language] = generator
+    try:
+        class_node.generate(generator)
+        return None
+    except Exception as error:
+        return f'{type(error).__name__}: {error}'
+
+
+def check_spec(spec_file):
+    """
+    Validates a single spec file without generating it, this runs inside a worker process
+
+    :param spec_file: The spec file
+    :return: The result of checking the spec file
+    """
+    start = perf_counter()
+    try:
+        errors = Parser(spec_file).check()
+    except Exception as error:
+        errors = [f'{type(error).__name__}: {error}']
+    return dict(file=spec_file, success=not errors, errors=errors, seconds=perf_counter() - start)
+
+
+def check_specs(spec_files, workers=None):
+    """
+    Validates a set of spec files across a process pool
+
+    :param spec_files: The spec files
+    :param workers: The number of worker processes, defaults to the number of CPUs
+    :return: The result for each spec file in the order given
+    """
+    workers = workers or os.cpu_count() or 1
+    chunk_size = max(1, len(spec_files) // (workers * 4))
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(check_spec, spec_files, chunksize=chunk_size))
+
+
+def compile_specs(spec_files, workers=None, cache=None, write_if_changed=False, background_writes=None,
+                  spec_cache=None, memory_budget=None):
+    """
+    Compiles a set of spec files across a process pool
+
+    :param spec_files: The spec files
+    :param workers: The number of worker processes, defaults to the number of CPUs
+    :param cache: The build cache, the entries recorded by the workers are merged into it
+    :param write_if_changed: Whether files are only written if their content changed
+    :param background_writes: The queue size of each worker's background writer, files are written inline if
+    it's None
+    :param spec_cache: The spec cache the workers load unchanged spec files from
+    :param memory_budget: The characters of each section the generators hold in memory, there's no limit if it's
+    None
+    :return: The result for each spec file in the order given
+    """
+    workers = workers or os.cpu_count() or 1
+    chunk_size = max(1, len(spec_files) // (workers * 4))
+    manifest_file = cache.manifest_file if cache else None
+    spec_cache_directory = spec_cache.directory if spec_cache else None
+    with ProcessPoolExecutor(max_workers=workers, initializer=initialise_worker,
+                             initargs=(manifest_file, write_if_changed, background_writes,
+                                       spec_cache_directory, memory_budget)) as executor:
+        results = list(executor.map(compile_spec, spec_files, chunksize=chunk_size))
+
+    for result in results:
+        updates = result.pop('cache_updates', None)
+        if updates:
+            cache.merge(updates)
+    return results
+
+
+def summarise(results, seconds):
+    """
+    Builds a combined summary of a batch run
+
+    :param results: The per file results
+    :param seconds: The total run time
+    :return: The summary
+    """
+    failed = [result for result in results if not result['success']]
+    return dict(total=len(results), succeeded=len(results) - len(failed), failed=len(failed),
+                skipped_classes=sum(result['skipped_classes'] for result in results),
+                files_written=sum(result['files_written'] for result in results),
+                files_skipped=sum(result['files_skipped'] for result in results), seconds=seconds,
+                results=results)
+
+
+def check(spec_files, workers=None, summary_file=None):
+    """
+    Validates a set of spec files and prints every error
+
+    :param spec_files: The spec files
+    :param workers: The number of worker processes
+    :param summary_file: The file the JSON summary is written to, there's no summary if it's None
+    :return: The exit status
+    """
+    start = perf_counter()
+    results = check_specs(spec_files, workers)
+    seconds = perf_counter() - start
+    failed = [result for result in results if not result['success']]
+    for result in failed:
+        for error in result['errors']:
+            print(f'{result["file"]}: {error}')
+    print(f'{len(results) - len(failed)} of {len(results)} spec files valid, '
+          f'{sum(len(result["errors"]) for result in failed)} errors found in {seconds:.3f}s')
+
+    if summary_file:
+        with open(summary_file, 'wt') as file:
+            json.dump(dict(total=len(results), succeeded=len(results) - len(failed), failed=len(failed),
+                           seconds=seconds, results=results), file, indent=2)
+
+    return 1 if failed else 0
+
+
+def add_source_arguments(argument_parser):
+    """
+    Adds the options naming the spec files and the worker processes they are compiled by to a command line
+
+    :param argument_parser: The argument parser
+    """
+    argument_parser.add_argument('sources', nargs='*', help='Spec files, directories or glob patterns')
+    argument_parser.add_argument('-m', '--manifest', action='append', default=[],
+                                 help='A file listing one spec file, directory or glob per line')
+    argument_parser.add_argument('-p', '--pattern', default='*.txt',
+                                 help='The pattern spec files in a directory must match')
+    argument_parser.add_argument('-j', '--workers', type=int, help='The number of worker processes')
+    argument_parser.add_argument('-s', '--summary', help='The file the JSON summary is written to')
+
+
+def source_spec_files(argument_parser, arguments):
+    """
+    Collects the spec files named by the options of a command line
+
+    :param argument_parser: The argument parser, it exits with a usage error if no spec files are named
+    :param arguments: The parsed arguments
+    :return: The spec file paths in order without duplicates
+    """
+    if not arguments.sources and not arguments.manifest:
+        argument_parser.error('No spec files given')
+    return collect_spec_files(arguments.sources, arguments.manifest, arguments.pattern)
+
+
+def main():
+    argument_parser = ArgumentParser(description='Compiles many spec files across a process pool')
+    add_source_arguments(argument_parser)
+    argument_parser.add_argument('--check', action='store_true',
+                                 help='Only validate the spec files, reporting every error without generating')
+    add_cache_arguments(argument_parser, '.codegen-cache.json', 'Skip classes unchanged since the last run')
+    # Like the cache manifest, each value below has an option of its own apart from its bare flag
+    argument_parser.add_argument('--spec-cache', action='store_const', const='.codegen-specs',
+                                 help='Load the parsed classes of unchanged spec files from .codegen-specs')
+    argument_parser.add_argument('--spec-cache-dir', dest='spec_cache', metavar='DIRECTORY',
+                                 help='Load parsed classes as --spec-cache does, from this directory')
+    argument_parser.add_argument('--memory-budget', type=int, metavar='CHARACTERS',
+                                 help='Spill the sections of a class to temporary files once they hold more than this')
+    argument_parser.add_argument('-w', '--write-if-changed', action='store_true',
+                                 help='Only write files whose content changed, keeping the mtime of the rest')
+    argument_parser.add_argument('-b', '--background-writes', action='store_const', const=64,
+                                 help='Write files on a background thread while the next classes are generated')
+    argument_parser.add_argument('--queue-size', dest='background_writes', type=int, metavar='QUEUE_SIZE',
+                                 help='Write files in the background as --background-writes does, with up to this '
+                                      'many files queued')
+    arguments = argument_parser.parse_args()
+
+    spec_files = source_spec_files(argument_parser, arguments)
+    if arguments.check:
+        return check(spec_files, arguments.workers, arguments.summary)
+
+    cache = BuildCache(arguments.cache) if arguments.cache else None
+    start = perf_counter()
+    spec_cache = SpecCache(arguments.spec_cache) if arguments.spec_cache else None
+    results = compile_specs(spec_files, arguments.workers, cache, arguments.write_if_changed,
+                            arguments.background_writes, spec_cache, arguments.memory_budget)
+    summary = summarise(results, perf_counter() - start)
+    if cache:
+        cache.save()
+
+    for result in results:
+        if result['success']:
+            print(f'OK {result["file"]}')
+        else:
+            print(f'FAILED {result["file"]}: {result["error"]}')
+    print(f'{summary["succeeded"]} of {summary["total"]} spec files compiled in {summary["seconds"]:.3f}s, '
+          f'{summary["skipped_classes"]} unchanged classes skipped, {summary["files_written"]} files written, '
+          f'{summary["files_skipped"]} unchanged files skipped')
+
+    if arguments.summary:
+        with open(arguments.summary, 'wt') as file:
+            json.dump(summary, file, indent=2)
+
+    return 1 if summary['failed'] else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,600 @@
+from Generator import Java
+from Output import NullSink
+from Parameter import Parameter
+from Parser import Parser
+from Pool import GeneratorPool
+from argparse import ArgumentParser
+from contextlib import contextmanager, redirect_stdout
+from tempfile import TemporaryDirectory
+from time import perf_counter
+import gc
+import io
+import json
+import os
+import platform
+import tracemalloc
+
+SPEC_TYPES = ('int', 'str', 'bool', 'double', 'char', 'long', 'Object')
+
+
+@contextmanager
+def scratch_directory():
+    """
+    Runs the body inside a temporary working directory with the generator's progress output silenced
+    """
+    cwd = os.getcwd()
+    with TemporaryDirectory() as directory:
+        os.chdir(directory)
+        try:
+            with redirect_stdout(io.StringIO()):
+                yield directory
+        finally:
+            os.chdir(cwd)
+
+
+def time_member_generation(member_count, generate_comments=True):
+    """
+    Times generating a class with a number of each kind of member
+
+    :param member_count: The number of variables, constructors and methods generated
+    :param generate_comments: Whether comments should be generated or not
+    :return: The time taken in seconds
+    """
+    generator = Java('Scaling', generate_comments)
+    start = perf_counter()
+    generator.class_name('Scaling')
+    for index in range(member_count):
+        generator.variable(True, True, True, 'PRI', Parameter('int', f'value{index}'))
+        generator.constructor(Parameter(f'Type{index}', f'argument{index}'))
+        generator.method('PUB', 'str', f'method{index}', Parameter('str', 'name'))
+    generator.end()
+    return perf_counter() - start
+
+
+def member_scaling(member_counts, repeats=3):
+    """
+    Measures how generation time grows with the member count of a class, linear growth shows as a
+    steady time per member
+
+    :param member_counts: The member counts measured
+    :param repeats: The number of runs per member count, the fastest is kept
+    :return: The measurement for each member count
+    """
+    results = list()
+    with scratch_directory():
+        for member_count in member_counts:
+            seconds = min(time_member_generation(member_count) for _ in range(repeats))
+            results.append(dict(members=member_count, seconds=seconds,
+                                microseconds_per_member=seconds / member_count * 1e6))
+    return results
+
+
+def synthesize_spec(class_name, members, parameters, generate_comments=True):
+    """
+    Synthesizes the spec of a class using every command
+
+    :param class_name: The name of the class
+    :param members: The number of class variables, constants and methods
+    :param parameters: The number of parameters of each method and the constructor
+    :param generate_comments: Whether comments should be generated or not
+    :return: The lines of the spec
+    """
+    parameter_list = ','.join(f'{SPEC_TYPES[index % len(SPEC_TYPES)]}:parameter{index}'
+                              for index in range(parameters))
+    lines = [f'JAVA {class_name}{" GC" if generate_comments else ""}', f'C {class_name}', 'S Base',
+             'I First,Second']
+    for index in range(members):
+        data_type = SPEC_TYPES[index % len(SPEC_TYPES)]
+        lines.append(f'CV {data_type} variable{index} GS')
+        lines.append(f'CT {data_type} CONSTANT{index} {index}')
+        lines.append(f'M PUB {data_type} method{index} {parameter_list}'.rstrip())
+    lines.append(f'CR {parameter_list}'.rstrip())
+    lines.append('E')
+    return lines
+
+
+def write_specs(directory, classes, members, parameters, classes_per_file=1):
+    """
+    Writes the spec files of the synthesized classes
+
+    :param directory: The directory the spec files are written to
+    :param classes: The number of classes
+    :param members: The number of class variables, constants and methods per class
+    :param parameters: The number of parameters per method and constructor
+    :param classes_per_file: The number of classes in each spec file
+    :return: The paths of the spec files
+    """
+    spec_files = list()
+    for first in range(0, classes, classes_per_file):
+        spec_file = os.path.join(directory, f'Synthetic{first}.txt')
+        with open(spec_file, 'wt') as file:
+            for index in range(first, min(first + classes_per_file, classes)):
+                file.write('\n'.join(synthesize_spec(f'Synthetic{index}', members, parameters)) + '\n')
+        spec_files.append(spec_file)
+    return spec_files
+
+
+def peak_memory(function):
+    """
+    Measures the peak memory allocated while running a function, this is a separate run from the timed one
+    as tracing allocations slows everything down
+
+    :param function: The function
+    :return: The peak memory in bytes
+    """
+    tracemalloc.start()
+    try:
+        function()
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def throughput(seconds, **counts):
+    """
+    Builds the throughput figures of a phase
+
+    :param seconds: The time taken by the phase
+    :param counts: The amount of each unit handled by the phase, such as lines, bytes or calls
+    :return: The throughput figures
+    """
+    result = dict(seconds=seconds, **counts)
+    for unit, count in counts.items():
+        result[f'{unit}_per_second'] = count / seconds if seconds else None
+    return result
+
+
+def phase_benchmark(classes, members, parameters, classes_per_file=1):
+    """
+    Times the parse, generate and write phases over synthesized spec files
+
+    :param classes: The number of classes
+    :param members: The number of class variables, constants and methods per class
+    :param parameters: The number of parameters per method and constructor
+    :param classes_per_file: The number of classes in each spec file
+    :return: The measurements of each phase
+    """
+    with scratch_directory() as directory:
+        spec_files = write_specs(directory, classes, members, parameters, classes_per_file)
+        spec_size = sum(os.path.getsize(spec_file) for spec_file in spec_files)
+        spec_lines = classes * (members * 3 + 6)
+
+        def parse():
+            return [class_node for spec_file in spec_files for class_node in Parser(spec_file).parse()]
+
+        def parse_file():
+            for spec_file in spec_files:
+                Parser(spec_file).parse_file()
+
+        start = perf_counter()
+        class_nodes = parse()
+        parse_seconds = perf_counter() - start
+
+        # Time each generator method on its own, members of a kind are generated in the same order as a full run
+        method_seconds = dict()
+        method_calls = dict()
+        end_seconds = 0
+        for class_node in class_nodes:
+            generator = Java(class_node.file_name, class_node.generate_comments)
+            for member in class_node.members:
+                start = perf_counter()
+                member.generate(generator)
+                elapsed = perf_counter() - start
+                method_seconds[member.kind] = method_seconds.get(member.kind, 0) + elapsed
+                method_calls[member.kind] = method_calls.get(member.kind, 0) + 1
+            start = perf_counter()
+            generator.end()
+            end_seconds += perf_counter() - start
+
+        output_size = sum(os.path.getsize(f'{class_node.file_name}.java') for class_node in class_nodes)
+
+        start = perf_counter()
+        parse_file()
+        parse_file_seconds = perf_counter() - start
+
+        return dict(
+            python=platform.python_version(),
+            classes=classes, members=members, parameters=parameters, classes_per_file=classes_per_file,
+            spec_lines=spec_lines, spec_bytes=spec_size, output_bytes=output_size,
+            parse=dict(throughput(parse_seconds, lines=spec_lines, bytes=spec_size),
+                       peak_memory_bytes=peak_memory(parse)),
+            methods={kind: throughput(method_seconds[kind], calls=method_calls[kind]) for kind in method_seconds},
+            end=throughput(end_seconds, calls=len(class_nodes), bytes=output_size),
+            parse_file=dict(throughput(parse_file_seconds, lines=spec_lines, bytes=output_size),
+                            peak_memory_bytes=peak_memory(parse_file)))
+
+
+class DictParameter:
+    """
+    The parameter as it was before it used slots and interned strings, kept as the baseline of the parameter
+    memory benchmark
+    """
+
+    def __init__(self, data_type, name, value=None):
+        self._data_type = data_type
+        self._name = name
+        self._value = value
+
+
+def parameter_memory(count, parameter_classes=(DictParameter, Parameter)):
+    """
+    Measures the memory held by parameters as the parser creates them, every type and name is a fresh string
+    split from a line of input
+
+    :param count: The number of parameters
+    :param parameter_classes: The parameter implementations compared
+    :return: The measurement for each implementation
+    """
+    parameter_lists = [','.join(f'{SPEC_TYPES[(index + offset) % len(SPEC_TYPES)]}:argument{offset}'
+                                for offset in range(4)) for index in range(len(SPEC_TYPES))]
+    results = dict()
+    for parameter_class in parameter_classes:
+        tracemalloc.start()
+        start = perf_counter()
+        parameters = list()
+        while len(parameters) < count:
+            for value in parameter_lists[len(parameters) % len(parameter_lists)].split(','):
+                data_type, name = value.split(':')
+                parameters.append(parameter_class(data_type, name))
+        seconds = perf_counter() - start
+        size = tracemalloc.get_traced_memory()[0]
+        tracemalloc.stop()
+        results[parameter_class.__name__] = dict(parameters=len(parameters), bytes=size,
+                                                 bytes_per_parameter=size / len(parameters), seconds=seconds)
+        del parameters
+    return results
+
+
+class LegacyJava(Java):
+    """
+    Java emission as it was before the templates were compiled, kept as the baseline of the emission
+    microbenchmark, every method the emission goes through is frozen here so later changes to Java don't change
+    what the baseline measures
+    """
+    types = dict(bool='boolean', str='String')
+    levels = dict(PUB='public', PRI='private', PRO='protected')
+
+    def comment(self):
+        comment = '\n\t/**\n\t *\n\t */'
+        return comment
+
+    def method(self, access_level, return_type, name, *args):
+        language_level = self.lookup_level(access_level)
+        language_return_type = self.lookup_type(return_type)
+        no_return = '\n\n\t'
+        if language_return_type in ('byte', 'short', 'int', 'float', 'double', 'long'):
+            return_value = '0'
+        elif language_return_type == 'boolean':
+            return_value = 'false'
+        elif language_return_type == 'char':
+            return_value = "''"
+        else:
+            return_value = 'null'
+
+        return_statement = f'\n\t\treturn {return_value};\n\t'
+        method = ''
+
+        if self._generate_comments:
+            method += self.comment()
+        method += f'\n\t{language_level} {language_return_type} {name}' \
+                  f'({self.build_parameter_list(args)})\n\t' + '{' + \
+                  f'{no_return if language_return_type == "void" else return_statement}' + '}\n'
+
+        self.add_to_output(self.METHOD, method)
+
+    def variable(self, mutable, generate_getter, generate_setter, access_level, values):
+        language_access_level = self.lookup_level(access_level)
+        parameter_type = self.lookup_type(values.data_type)
+        variable = ''
+
+        if self._generate_comments:
+            variable += self.comment() + '\n'
+        variable += f'\t{language_access_level} {"" if mutable else "static final "}{parameter_type} ' \
+                    + f'{values.name}{" = " + values.value if values.value else ""};\n'
+        self.add_to_output(self.VARIABLE, variable)
+        if generate_getter:
+            self.method('PUB', f'{parameter_type}', f'get{values.name.capitalize()}')
+        if generate_setter:
+            self.method('PUB', 'void', f'set{values.name.capitalize()}', Parameter(f'{parameter_type}', 'value'))
+
+    def fragments(self):
+        fragments = list()
+        for key in self.SECTIONS:
+            section = self._output.get(key)
+            if not section:
+                continue
+            if key in self.BUFFERED_SECTIONS:
+                fragments.extend(section)
+            else:
+                fragments.append(section)
+        return fragments
+
+    def add_to_output(self, key, output):
+        section = self._output.get(key)
+        if section is None:
+            self._output[key] = [output]
+        else:
+            section.append(output)
+
+    def lookup_type(self, key):
+        lookup_type = self.types.get(key)
+        data_type = lookup_type if lookup_type else key
+        return data_type
+
+    def lookup_level(self, key):
+        lookup_level = self.levels.get(key)
+        access_level = lookup_level if lookup_level else ''
+        return access_level
+
+    def build_parameter_list(self, parameters):
+        parameter_list = ''
+        for parameter in parameters:
+            data_type = self.lookup_type(parameter.data_type)
+            parameter_list += f'{data_type} {parameter.name}'
+
+            if parameters.index(parameter) < len(parameters) - 1:
+                parameter_list += ', '
+
+        return parameter_list
+
+
+def emission_benchmark(count, repeats=5, generator_classes=(LegacyJava, Java)):
+    """
+    Times emitting methods and variables with getters and setters, checking every implementation emits the
+    same output
+
+    :param count: The number of members emitted per kind
+    :param repeats: The number of runs, the fastest is kept
+    :param generator_classes: The generator implementations compared
+    :return: The time per member of each implementation
+    """
+    members = [(SPEC_TYPES[index % len(SPEC_TYPES)], f'member{index}') for index in range(count)]
+    parameters = (Parameter('int', 'first'), Parameter('str', 'second'))
+    results = dict()
+    outputs = dict()
+    for generator_class in generator_classes:
+        timings = dict(method=float('inf'), variable=float('inf'))
+        for _ in range(repeats):
+            generator = generator_class('Emission', True)
+            start = perf_counter()
+            for data_type, name in members:
+                generator.method('PUB', data_type, name, *parameters)
+            timings['method'] = min(timings['method'], perf_counter() - start)
+            start = perf_counter()
+            for data_type, name in members:
+                generator.variable(True, True, True, 'PRI', Parameter(data_type, name))
+            timings['variable'] = min(timings['variable'], perf_counter() - start)
+        outputs[generator_class.__name__] = generator.fragments()
+        results[generator_class.__name__] = {f'{kind}_microseconds': seconds / count * 1e6
+                                             for kind, seconds in timings.items()}
+
+    baseline, *others = generator_classes
+    for generator_class in others:
+        if outputs[generator_class.__name__] != outputs[baseline.__name__]:
+            raise AssertionError(f'{generator_class.__name__} output differs from {baseline.__name__}')
+        results[generator_class.__name__].update(
+            {f'{kind}_speedup': results[baseline.__name__][f'{kind}_microseconds'] /
+             results[generator_class.__name__][f'{kind}_microseconds'] for kind in ('method', 'variable')})
+    return results
+
+
+class QuadraticJava(Java):
+    """
+    Parameter list and interface emission as it was before the lists were joined in one pass, each separator
+    was placed by searching the list for the current item, kept as the baseline of the signature benchmark
+    """
+
+    def interface(self, *args):
+        class_value = self.class_value()
+        class_value += ' implements '
+        for interface in args:
+            class_value += interface
+            if args.index(interface) < len(args) - 1:
+                class_value += ', '
+        self._output[self.CLASS] = class_value + '\n{\n'
+
+    def build_parameter_list(self, parameters):
+        parameter_list = ''
+        for parameter in parameters:
+            data_type = self.lookup_type(parameter.data_type)
+            parameter_list += f'{data_type} {parameter.name}'
+
+            if parameters.index(parameter) < len(parameters) - 1:
+                parameter_list += ', '
+
+        return parameter_list
+
+
+def signature_benchmark(counts, repeats=3):
+    """
+    Times emitting an interface list and a parameter list against their length, a linear implementation shows
+    as a steady time per item
+
+    :param counts: The numbers of interfaces and parameters measured
+    :param repeats: The number of runs per count, the fastest is kept
+    :return: The measurement for each count
+    """
+    results = list()
+    for count in counts:
+        interfaces = tuple(f'Interface{index}' for index in range(count))
+        parameters = tuple(Parameter(SPEC_TYPES[index % len(SPEC_TYPES)], f'parameter{index}')
+                           for index in range(count))
+        result = dict(count=count)
+        outputs = dict()
+        for generator_class in (QuadraticJava, Java):
+            interface_seconds = parameter_seconds = float('inf')
+            for _ in range(repeats):
+                generator = generator_class('Signatures', False)
+                generator.class_name('Signatures')
+                start = perf_counter()
+                generator.interface(*interfaces)
+                interface_seconds = min(interface_seconds, perf_counter() - start)
+                start = perf_counter()
+                parameter_list = generator.build_parameter_list(parameters)
+                parameter_seconds = min(parameter_seconds, perf_counter() - start)
+            outputs[generator_class.__name__] = (generator.fragments(), parameter_list)
+            result[generator_class.__name__] = dict(interface_microseconds_per_item=interface_seconds / count * 1e6,
+                                                    parameter_microseconds_per_item=parameter_seconds / count * 1e6)
+        if outputs['Java'] != outputs['QuadraticJava']:
+            raise AssertionError('Java output differs from QuadraticJava')
+        results.append(result)
+    return results
+
+
+def spill_benchmark(member_counts, memory_budget=1 << 20):
+    """
+    Measures the peak memory of generating and writing one huge class against its member count, with the
+    sections held in memory and with them spilled to temporary files within a memory budget
+
+    :param member_counts: The member counts measured
+    :param memory_budget: The characters of each section held in memory before they are spilled
+    :return: The measurement for each member count
+    """
+    results = list()
+    with scratch_directory():
+        for member_count in member_counts:
+            result = dict(members=member_count)
+            for label, budget in (('in_memory', None), ('spilled', memory_budget)):
+                generator = Java('Spill', True)
+                generator.memory_budget = budget
+
+                def generate():
+                    generator.reset()
+                    generator.class_name('Spill')
+                    for index in range(member_count):
+                        generator.variable(True, True, True, 'PRI', Parameter('int', f'value{index}'))
+                        generator.method('PUB', 'str', f'method{index}', Parameter('str', 'name'))
+                    generator.end()
+
+                start = perf_counter()
+                generate()
+                seconds = perf_counter() - start
+                result[label] = dict(seconds=seconds, peak_memory_bytes=peak_memory(generate),
+                                     output_bytes=os.path.getsize('Spill.java'))
+            results.append(result)
+    return results
+
+
+def churn_benchmark(classes, members, parameters):
+    """
+    Measures the time and allocation churn per class of generating many classes with a new generator for each
+    class, one generator reset between classes and generators checked out of a pool, the churn is the transient
+    memory allocated above the baseline while a class is generated and the garbage collections it triggers
+
+    :param classes: The number of classes
+    :param members: The number of class variables, constants and methods per class
+    :param parameters: The number of parameters per method and constructor
+    :return: The measurements of each strategy
+    """
+    lines = [line for index in range(classes)
+             for line in synthesize_spec(f'Churn{index}', members, parameters, generate_comments=index % 2 == 0)]
+    class_nodes = list(Parser('<churn>').parse_lines(line.split() for line in lines))
+    sink = NullSink()
+    shared = Java('', False)
+    shared.sink = sink
+    pool = GeneratorPool()
+
+    def fresh(class_node):
+        generator = Java('', False)
+        generator.sink = sink
+        class_node.generate(generator)
+
+    def reset(class_node):
+        class_node.generate(shared)
+
+    def pooled(class_node):
+        pool.generate(class_node, sink)
+
+    results = dict(classes=classes, members=members, parameters=parameters)
+    with redirect_stdout(io.StringIO()):
+        for name, generate in (('fresh', fresh), ('reset', reset), ('pooled', pooled)):
+            # Warm up so every strategy starts with its generators and memos built
+            for class_node in class_nodes[:2]:
+                generate(class_node)
+            collections = gc.get_stats()[0]['collections']
+            start = perf_counter()
+            for class_node in class_nodes:
+                generate(class_node)
+            seconds = perf_counter() - start
+            collections = gc.get_stats()[0]['collections'] - collections
+
+            tracemalloc.start()
+            transient = 0
+            for class_node in class_nodes:
+                baseline = tracemalloc.get_traced_memory()[0]
+                tracemalloc.reset_peak()
+                generate(class_node)
+                transient += tracemalloc.get_traced_memory()[1] - baseline
+            tracemalloc.stop()
+            results[name] = dict(microseconds_per_class=seconds / classes * 1e6,
+                                 transient_bytes_per_class=transient / classes,
+                                 gc_collections_per_thousand_classes=collections / classes * 1000)
+    results['pool'] = dict(created=pool.created, reused=pool.reused)
+    return results
+
+
+def main():
+    argument_parser = ArgumentParser(description='Benchmarks the code generator')
+    benchmarks = argument_parser.add_subparsers(dest='benchmark', required=True)
+
+    scaling = benchmarks.add_parser('scaling', help='Generation time against class member count')
+    scaling.add_argument('-m', '--members', type=int, nargs='+', default=[1000, 2000, 4000, 8000, 16000],
+                         help='The member counts measured')
+    scaling.add_argument('-r', '--repeats', type=int, default=3, help='The runs per member count')
+
+    phases = benchmarks.add_parser('phases', help='Parse, generate and write phases over synthesized specs')
+    phases.add_argument('-c', '--classes', type=int, default=100, help='The number of classes')
+    phases.add_argument('-m', '--members', type=int, default=50,
+                        help='The number of class variables, constants and methods per class')
+    phases.add_argument('-p', '--parameters', type=int, default=3,
+                        help='The number of parameters per method and constructor')
+    phases.add_argument('-f', '--classes-per-file', type=int, default=1, help='The number of classes per spec file')
+
+    parameters = benchmarks.add_parser('parameters', help='Memory held by parameters against the dict baseline')
+    parameters.add_argument('-n', '--count', type=int, default=200000, help='The number of parameters')
+
+    emission = benchmarks.add_parser('emission', help='Java member emission against the untemplated baseline')
+    emission.add_argument('-n', '--count', type=int, default=20000, help='The number of members per kind')
+    emission.add_argument('-r', '--repeats', type=int, default=5, help='The number of runs')
+
+    signatures = benchmarks.add_parser('signatures', help='Interface and parameter list emission against their length')
+    signatures.add_argument('-n', '--counts', type=int, nargs='+', default=[100, 200, 400, 800, 1600],
+                            help='The numbers of interfaces and parameters measured')
+    signatures.add_argument('-r', '--repeats', type=int, default=3, help='The runs per count')
+
+    spill = benchmarks.add_parser('spill', help='Peak memory of a huge class held in memory against spilled')
+    spill.add_argument('-m', '--members', type=int, nargs='+', default=[10000, 40000, 160000],
+                       help='The member counts measured')
+    spill.add_argument('-b', '--memory-budget', type=int, default=1 << 20,
+                       help='The characters of each section held in memory before they are spilled')
+
+    churn = benchmarks.add_parser('churn', help='Time and allocation churn per class of fresh, reset and pooled '
+                                                'generators')
+    churn.add_argument('-c', '--classes', type=int, default=2000, help='The number of classes')
+    churn.add_argument('-m', '--members', type=int, default=10,
+                       help='The number of class variables, constants and methods per class')
+    churn.add_argument('-p', '--parameters', type=int, default=2,
+                       help='The number of parameters per method and constructor')
+
+    arguments = argument_parser.parse_args()
+    if arguments.benchmark == 'scaling':
+        results = member_scaling(arguments.members, arguments.repeats)
+    elif arguments.benchmark == 'phases':
+        results = phase_benchmark(arguments.classes, arguments.members, arguments.parameters,
+                                  arguments.classes_per_file)
+    elif arguments.benchmark == 'parameters':
+        results = parameter_memory(arguments.count)
+    elif arguments.benchmark == 'emission':
+        results = emission_benchmark(arguments.count, arguments.repeats)
+    elif arguments.benchmark == 'signatures':
+        results = signature_benchmark(arguments.counts, arguments.repeats)
+    elif arguments.benchmark == 'spill':
+        results = spill_benchmark(arguments.members, arguments.memory_budget)
+    elif arguments.benchmark == 'churn':
+        results = churn_benchmark(arguments.classes, arguments.members, arguments.parameters)
+
+    print(json.dumps(results, indent=2))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,315 @@
+from Model import ClassNode, MemberNode
+from Output import replace_file
+from Parameter import Parameter
+from hashlib import sha256
+from operator import itemgetter
+import json
+import marshal
+import os
+
+
+class BuildCache:
+    """
+    An on-disk manifest of the content hash of every generated class, classes whose spec block is unchanged
+    since the last run are skipped
+    """
+    FORMAT = 2
+
+    def __init__(self, manifest_file='.codegen-cache.json', options=None):
+        """
+        Constructs a build cache, loading the manifest if it exists
+
+        :param manifest_file: The name of the manifest file
+        :param options: The generation options, a change of options invalidates every entry
+        """
+        self._manifest_file = manifest_file
+        self._options = dict(options or {})
+        self._entries = dict()
+        self._updates = dict()
+
+        if os.path.exists(manifest_file):
+            # A corrupt manifest, or one not written by this cache, is treated as empty and replaced on save
+            try:
+                with open(manifest_file, 'rt') as file:
+                    manifest = json.load(file)
+            except (ValueError, UnicodeDecodeError):
+                manifest = dict()
+            if not isinstance(manifest, dict):
+                manifest = dict()
+            if manifest.get('format') == self.FORMAT and manifest.get('options') == self._options:
+                self._entries = manifest.get('classes', dict())
+
+    @property
+    def manifest_file(self):
+        return self._manifest_file
+
+    def digest(self, generator_class, block):
+        """
+        Hashes a class block together with the generator that outputs it
+
+        :param generator_class: The generator class of the block's language
+        :param block: The bytes of the block, from its language command to its end command
+        :return: The hex digest
+        """
+        content_hash = sha256()
+        content_hash.update(f'{generator_class.__name__}\0{generator_class.version}\0'.encode())
+        content_hash.update(json.dumps(self._options, sort_keys=True).encode())
+        content_hash.update(block)
+        return content_hash.hexdigest()
+
+    def is_fresh(self, output_file, digest):
+        """
+        Checks whether an output file was generated from a block with the same digest
+
+        :param output_file: The output file of the block
+        :param digest: The digest of the block
+        :return: True if the output file is up to date
+        """
+        return self._entries.get(output_file) == digest and os.path.exists(output_file)
+
+    def update(self, output_file, digest):
+        """
+        Records the digest of the block an output file was generated from
+
+        :param output_file: The output file
+        :param digest: The digest of the block
+        """
+        self._entries[output_file] = digest
+        self._updates[output_file] = digest
+
+    def take_updates(self):
+        """
+        Takes the entries recorded since the updates were last taken
+
+        :return: The updates
+        """
+        updates = self._updates
+        self._updates = dict()
+        return updates
+
+    def merge(self, updates):
+        """
+        Merges the updates recorded by another cache, such as one in a worker process
+
+        :param updates: The updates
+        """
+        for output_file, digest in updates.items():
+            self.update(output_file, digest)
+
+    def save(self):
+        """
+        Writes the manifest, replacing the previous one atomically
+        """
+        temporary_file = f'{self._manifest_file}.tmp'
+        with open(temporary_file, 'wt') as file:
+            json.dump(dict(format=self.FORMAT, options=self._options, classes=self._entries), file,
+                      indent=1, sort_keys=True)
+        os.replace(temporary_file, self._manifest_file)
+
+
+class CachedClassNode(ClassNode):
+    """
+    A class loaded from the spec cache, it drives generators straight from its encoded members instead of
+    rebuilding a member node for each of them, and builds each distinct parameter once for every class of its entry
+    """
+    __slots__ = ('_encoded_members', '_parameters')
+
+    def __init__(self, language, file_name, generate_comments, line_number, encoded_members, parameters):
+        """
+        Constructs a cached class node
+
+        :param language: The language command that opened the class
+        :param file_name: The name of the output file
+        :param generate_comments: Whether comments should be generated or not
+        :param line_number: The line of the input the class was opened on
+        :param encoded_members: The kind, line number, leading arguments and parameter fields of each member
+        :param parameters: The parameters already built, by their fields, shared by the classes of an entry
+        """
+        self.language = language
+        self.file_name = file_name
+        self.generate_comments = generate_comments
+        self.line_number = line_number
+        self._encoded_members = encoded_members
+        self._parameters = parameters
+
+    @property
+    def members(self):
+        """
+        Builds the member nodes of the class, generating the class doesn't need them
+
+        :return: The member nodes
+        """
+        return [MemberNode(kind, arguments + tuple(map(self.parameter, fields)), line_number)
+                for kind, line_number, arguments, fields in self._encoded_members]
+
+    def parameter(self, fields):
+        """
+        Gets the parameter with some fields, building it the first time it is used
+
+        :param fields: The data type, name and value of the parameter
+        :return: The parameter
+        """
+        parameter = self._parameters.get(fields)
+        if parameter is None:
+            parameter = self._parameters.setdefault(fields, Parameter(*fields))
+        return parameter
+
+    def generate_members(self, generator):
+        """
+        Drives a generator with every member of the class in order
+
+        :param generator: The generator
+        :raises ValueError: If a member conflicts with another member of the class
+        """
+        parameter = self.parameter
+        for kind, line_number, arguments, fields in self._encoded_members:
+            try:
+                if fields:
+                    arguments += tuple(map(parameter, fields))
+                getattr(generator, kind)(*arguments)
+            except ValueError as error:
+                raise ValueError(f'{error} on line: {line_number}') from error
+
+
+class SpecCache:
+    """
+    A directory holding the parsed classes of each spec file in binary, an unchanged spec file is loaded with a
+    single read instead of being tokenized and parsed again, the classes are stored as plain tuples with marshal so
+    loading an entry never runs code, and the loaded classes generate straight from those tuples
+    """
+    FORMAT = 3
+    # The kinds of member an entry may hold, each is the name of the generator method it drives
+    MEMBER_KINDS = frozenset((MemberNode.CLASS_NAME, MemberNode.SUPERCLASS, MemberNode.INTERFACE,
+                              MemberNode.VARIABLE, MemberNode.CONSTANT, MemberNode.CONSTRUCTOR, MemberNode.METHOD))
+
+    def __init__(self, directory='.codegen-specs'):
+        """
+        Constructs a spec cache
+
+        :param directory: The directory the parsed spec files are stored in
+        """
+        self._directory = directory
+        # Entries written by another format or version of the parser and model are never read
+        self._version = f'{self.FORMAT}.{ClassNode.version}'
+
+    @property
+    def directory(self):
+        return self._directory
+
+    def cache_file(self, spec_file):
+        """
+        Gets the file the parsed classes of a spec file are stored in
+
+        :param spec_file: The spec file
+        :return: The path of the cache file
+        """
+        name = sha256(f'{self._version}\0{os.path.abspath(spec_file)}'.encode()).hexdigest()
+        return os.path.join(self._directory, f'{name}.marshal')
+
+    @staticmethod
+    def encode_member(member):
+        """
+        Encodes a member as a plain tuple, the parameters of a member always come after its other arguments so they
+        are kept apart as their fields
+
+        :param member: The member
+        :return: The kind, line number, leading arguments and parameter fields of the member
+        """
+        arguments = member.arguments
+        first = len(arguments)
+        while first and isinstance(arguments[first - 1], Parameter):
+            first -= 1
+        return (member.kind, member.line_number, arguments[:first],
+                tuple((argument.data_type, argument.name, argument.value) for argument in arguments[first:]))
+
+    def encode(self, classes):
+        """
+        Encodes parsed classes as plain tuples
+
+        :param classes: The parsed classes
+        :return: The encoded classes
+        """
+        return tuple((class_node.language, class_node.file_name, class_node.generate_comments,
+                      class_node.line_number, tuple(map(self.encode_member, class_node.members)))
+                     for class_node in classes)
+
+    def decode(self, data):
+        """
+        Wraps encoded classes in cached class nodes, their members are only checked here and are decoded as they
+        are generated
+
+        :param data: The encoded classes
+        :return: The parsed classes
+        :raises ValueError: If the encoding isn't one of parsed classes
+        """
+        parameters = dict()
+        classes = list()
+        for language, file_name, generate_comments, line_number, members in data:
+            unknown = set(map(itemgetter(0), members)).difference(self.MEMBER_KINDS)
+            if unknown:
+                raise ValueError(f'Unknown member kinds: {", ".join(map(repr, sorted(unknown)))}')
+            classes.append(CachedClassNode(language, file_name, generate_comments, line_number, members, parameters))
+        return classes
+
+    def load(self, spec_file):
+        """
+        Loads the parsed classes of a spec file if they are fresh, a spec file whose mtime and size are unchanged
+        is fresh and one whose mtime changed is only fresh if its content hashes the same
+
+        :param spec_file: The spec file
+        :return: The parsed classes, None if they aren't cached or are stale
+        """
+        try:
+            with open(self.cache_file(spec_file), 'rb') as file:
+                data = file.read()
+        except FileNotFoundError:
+            return None
+
+        # Unmarshalling only builds tuples, a stale entry's classes are never rebuilt
+        try:
+            version, mtime, size, digest, encoded = marshal.loads(data)
+        except (EOFError, ValueError, TypeError):
+            return None
+        if version != self._version:
+            return None
+        status = os.stat(spec_file)
+        touched = mtime != status.st_mtime_ns
+        if size != status.st_size:
+            return None
+        if touched:
+            with open(spec_file, 'rb') as file:
+                if sha256(file.read()).digest() != digest:
+                    return None
+        try:
+            classes = self.decode(encoded)
+        except (ValueError, TypeError):
+            return None
+
+        # Record the new mtime of a touched but unchanged spec file so it isn't hashed again
+        if touched:
+            self.write_entry(spec_file, status, digest, encoded)
+        return classes
+
+    def store(self, spec_file, status, digest, classes):
+        """
+        Stores the parsed classes of a spec file, replacing the previous entry atomically
+
+        :param spec_file: The spec file
+        :param status: The status of the spec file taken before it was read
+        :param digest: The digest of the content that was parsed
+        :param classes: The parsed classes
+        """
+        self.write_entry(spec_file, status, digest, self.encode(classes))
+
+    def write_entry(self, spec_file, status, digest, encoded):
+        """
+        Writes the entry of a spec file, replacing the previous entry atomically
+
+        :param spec_file: The spec file
+        :param status: The status of the spec file taken before it was read
+        :param digest: The digest of the content that was parsed
+        :param encoded: The encoded classes
+        """
+        entry = (self._version, status.st_mtime_ns, status.st_size, digest, encoded)
+        os.makedirs(self._directory, exist_ok=True)
+        replace_file(self.cache_file(spec_file), marshal.dumps(entry))
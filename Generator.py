@@ -1,12 +1,28 @@
 from abc import ABC, abstractmethod
+from Output import FileSink, SectionBuffer, SignatureIndex
 from Parameter import Parameter
 
 
 class Generator(ABC):
+    # Bump the version whenever a change alters the generated output
+    version = '1'
+    extension = None
+    # Whether the completion of each document is printed, turned off when generating for a library caller
+    announce = True
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls.compile_templates()
+
     def __init__(self, file_name, generate_comments):
         self._file_name = file_name
-        self._generate_comments = generate_comments
+        self._generate_comments = bool(generate_comments)
         self._output = dict()
+        self._signatures = set()
+        self._sink = FileSink()
+        self._memory_budget = None
+        self._buffered = 0
+        self._spilled = False
 
     @abstractmethod
     def method(self, access_level, return_type, name):
@@ -20,6 +36,60 @@ class Generator(ABC):
     def end(self):
         pass
 
+    @classmethod
+    def compile_templates(cls):
+        """
+        Compiles the emission templates of a generator class, called once when the class is defined
+        """
+        pass
+
+    def reset(self):
+        """
+        Discards the output and member signatures of the previous document so the generator can be reused
+        """
+        self.clear_output()
+        # Without a memory budget the signatures are held in a plain set, with one they're indexed so they can spill
+        signatures = self._signatures
+        if self._memory_budget is None:
+            if isinstance(signatures, SignatureIndex):
+                signatures.close()
+                self._signatures = set()
+            else:
+                signatures.clear()
+        elif isinstance(signatures, SignatureIndex):
+            signatures.clear(self._memory_budget)
+        else:
+            self._signatures = SignatureIndex(self._memory_budget)
+        self._buffered = 0
+        self._spilled = False
+
+    def clear_output(self):
+        """
+        Discards the output of the previous document
+        """
+        self._output = dict()
+
+    def declare(self, kind, name, parameter_types=None):
+        """
+        Records the signature of a member in the index of the document
+
+        :param kind: The kind of member, members of different kinds never conflict
+        :param name: The name of the member
+        :param parameter_types: The language types of the member's parameters as a tuple, None if it takes no
+        parameters
+        :raises ValueError: If the document already has a member with the same signature
+        """
+        # The tuple is only formatted as text if the index spills or the member is a duplicate
+        signature = (kind, name, parameter_types)
+        signatures = self._signatures
+        if type(signatures) is set:
+            if signature not in signatures:
+                signatures.add(signature)
+                return
+        elif signatures.add(signature):
+            return
+        raise ValueError(f'Duplicate {SignatureIndex.describe(signature)} in {self._file_name}')
+
     @property
     def file_name(self):
         return self._file_name
@@ -34,7 +104,29 @@ class Generator(ABC):
 
     @generate_comments.setter
     def generate_comments(self, value):
-        self._generate_comments = value
+        self._generate_comments = bool(value)
+
+    @property
+    def sink(self):
+        return self._sink
+
+    @sink.setter
+    def sink(self, value):
+        self._sink = value
+
+    @property
+    def memory_budget(self):
+        return self._memory_budget
+
+    @memory_budget.setter
+    def memory_budget(self, value):
+        # The characters of each section and of the member signatures held in memory before they are spilled to
+        # temporary files, the signatures' budget applies from the next document
+        self._memory_budget = value
+
+    @property
+    def output_file(self):
+        return f'{self._file_name}.{self.extension}'
 
 
 class ObjectOriented(Generator):
@@ -74,8 +166,17 @@ class Java(ObjectOriented):
     CONSTRUCTOR = 'constructor'
     METHOD = 'method'
     CLASS_END = 'class_end'
+    extension = 'java'
+    SECTIONS = (HEADER, CLASS, VARIABLE, CONSTRUCTOR, METHOD, CLASS_END)
+    BUFFERED_SECTIONS = frozenset((VARIABLE, CONSTRUCTOR, METHOD))
     types = dict(bool='boolean', str='String')
     levels = dict(PUB='public', PRI='private', PRO='protected')
+    return_values = dict(byte='0', short='0', int='0', float='0', double='0', long='0', boolean='false', char="''")
+    header_comment_template = '/**\n *\n */\n'
+    comment_template = '\n\t/**\n\t *\n\t */'
+    constant_modifiers = 'static final '
+    getter_prefix = 'get'
+    setter_prefix = 'set'
 
     def __init__(self, file_name, generate_comments):
         """
@@ -92,8 +193,7 @@ class Java(ObjectOriented):
 
         :return: A header comment
         """
-        comment = '/**\n *\n */\n'
-        return comment
+        return self.header_comment_template
 
     def comment(self):
         """
@@ -101,8 +201,7 @@ class Java(ObjectOriented):
 
         :return: A comment
         """
-        comment = '\n\t/**\n\t *\n\t */'
-        return comment
+        return self.comment_template
 
     def class_name(self, name):
         """
@@ -114,7 +213,7 @@ class Java(ObjectOriented):
         if self._generate_comments:
             self._output[self.HEADER] = self.header_comment()
         if name != self._file_name:
-            raise ValueError()
+            raise ValueError(f'Class name {name} doesn\'t match the file name {self._file_name}')
         self._output[self.CLASS] = f'public class {name} ' + '\n{\n'
 
     def superclass(self, name):
@@ -134,13 +233,9 @@ class Java(ObjectOriented):
         :param args: The interface names
         :return: A Java class definition with a interfaces
         """
-        class_value = self.class_value()
-        class_value += ' implements '
         for interface in args:
-            class_value += interface
-            if args.index(interface) < len(args) - 1:
-                class_value += ', '
-        self._output[self.CLASS] = class_value + '\n{\n'
+            self.declare('interface', interface)
+        self._output[self.CLASS] = f'{self.class_value()} implements {", ".join(args)}' + '\n{\n'
 
     def class_value(self):
         """
@@ -152,6 +247,61 @@ class Java(ObjectOriented):
         class_value = class_value[0:len(class_value) - 4]
         return class_value
 
+    @classmethod
+    def compile_templates(cls):
+        """
+        Builds the comment preceding each member indexed by whether comments are generated, and starts the
+        memo of return types
+        """
+        cls.member_comments = ('', cls.comment_template)
+        cls.variable_comments = ('', cls.comment_template + '\n')
+        cls.return_signatures = dict()
+
+    @staticmethod
+    def format_method(comment, access_level, return_type, name, parameter_list, body):
+        """
+        Formats a method definition
+
+        :return: The method preceded by its comment
+        """
+        return f'{comment}\n\t{access_level} {return_type} {name}({parameter_list})\n\t{{{body}}}\n'
+
+    @staticmethod
+    def format_constructor(comment, class_name, parameter_list):
+        """
+        Formats a constructor definition
+
+        :return: The constructor preceded by its comment
+        """
+        return f'{comment}\n\tpublic {class_name}({parameter_list})\n\t{{\n\n\t}}\n'
+
+    @staticmethod
+    def format_variable(comment, access_level, modifiers, variable_type, name, initialiser):
+        """
+        Formats a variable declaration
+
+        :return: The variable preceded by its comment
+        """
+        return f'{comment}\t{access_level} {modifiers}{variable_type} {name}{initialiser};\n'
+
+    def return_signature(self, return_type):
+        """
+        Looks up the Java return type and method body of a parser return type, memoized per generator class
+
+        :param return_type: The parser return type
+        :return: The Java return type and the body of a method returning it
+        """
+        signature = self.return_signatures.get(return_type)
+        if signature is None:
+            language_return_type = self.lookup_type(return_type)
+            if language_return_type == 'void':
+                body = '\n\n\t'
+            else:
+                body = f'\n\t\treturn {self.return_values.get(language_return_type, "null")};\n\t'
+            signature = (language_return_type, body)
+            self.return_signatures[return_type] = signature
+        return signature
+
     def constructor(self, *args):
         """
         Generates a constructors
@@ -159,11 +309,10 @@ class Java(ObjectOriented):
         :param args: The arguments for the constructor
         :return: A Java constructor definition
         """
-        constructor = ''
-        if self._generate_comments:
-            constructor += self.comment()
-        constructor += f'\n\tpublic {self._file_name}({self.build_parameter_list(args)})\n\t' + '{\n\n\t}\n'
-        self.add_to_output(self.CONSTRUCTOR, constructor)
+        parameter_types, parameter_list = self.parameter_list(args)
+        self.declare(self.CONSTRUCTOR, self._file_name, parameter_types)
+        self.add_to_output(self.CONSTRUCTOR, self.format_constructor(
+            self.member_comments[self._generate_comments], self._file_name, parameter_list))
 
     def method(self, access_level, return_type, name, *args):
         """
@@ -175,28 +324,12 @@ class Java(ObjectOriented):
         :param args: The arguments of the method
         :return: A Java method definition
         """
-        language_level = self.lookup_level(access_level)
-        language_return_type = self.lookup_type(return_type)
-        no_return = '\n\n\t'
-        if language_return_type in ('byte', 'short', 'int', 'float', 'double', 'long'):
-            return_value = '0'
-        elif language_return_type == 'boolean':
-            return_value = 'false'
-        elif language_return_type == 'char':
-            return_value = "''"
-        else:
-            return_value = 'null'
-
-        return_statement = f'\n\t\treturn {return_value};\n\t'
-        method = ''
-
-        if self._generate_comments:
-            method += self.comment()
-        method += f'\n\t{language_level} {language_return_type} {name}' \
-                  f'({self.build_parameter_list(args)})\n\t' + '{' + \
-                  f'{no_return if language_return_type == "void" else return_statement}' + '}\n'
-
-        self.add_to_output(self.METHOD, method)
+        parameter_types, parameter_list = self.parameter_list(args)
+        self.declare(self.METHOD, name, parameter_types)
+        language_return_type, body = self.return_signatures.get(return_type) or self.return_signature(return_type)
+        self.add_to_output(self.METHOD, self.format_method(
+            self.member_comments[self._generate_comments], self.levels.get(access_level, ''), language_return_type,
+            name, parameter_list, body))
 
     def constant(self, access_level, values):
         """
@@ -219,54 +352,140 @@ class Java(ObjectOriented):
         :param values: The values of the variable
         :return: A Java variable
         """
-        language_access_level = self.lookup_level(access_level)
         parameter_type = self.lookup_type(values.data_type)
-        variable = ''
-
-        if self._generate_comments:
-            variable += self.comment() + '\n'
-        variable += f'\t{language_access_level} {"" if mutable else "static final "}{parameter_type} ' \
-                    + f'{values.name}{" = " + values.value if values.value else ""};\n'
-        self.add_to_output(self.VARIABLE, variable)
-        if generate_getter:
-            self.method('PUB', f'{parameter_type}', f'get{values.name.capitalize()}')
-        if generate_setter:
-            self.method('PUB', 'void', f'set{values.name.capitalize()}', Parameter(f'{parameter_type}', 'value'))
+        self.declare(self.VARIABLE, values.name)
+        self.add_to_output(self.VARIABLE, self.format_variable(
+            self.variable_comments[self._generate_comments], self.levels.get(access_level, ''),
+            '' if mutable else self.constant_modifiers, parameter_type, values.name,
+            f' = {values.value}' if values.value else ''))
+
+        if generate_getter or generate_setter:
+            comment = self.member_comments[self._generate_comments]
+            public = self.levels['PUB']
+            capitalized_name = values.name.capitalize()
+            if generate_getter:
+                getter_name = f'{self.getter_prefix}{capitalized_name}'
+                self.declare(self.METHOD, getter_name, ())
+                getter_type, body = self.return_signature(parameter_type)
+                self.add_to_output(self.METHOD, self.format_method(comment, public, getter_type, getter_name, '', body))
+            if generate_setter:
+                setter_name = f'{self.setter_prefix}{capitalized_name}'
+                setter_type = self.lookup_type(parameter_type)
+                self.declare(self.METHOD, setter_name, (setter_type,))
+                self.add_to_output(self.METHOD, self.format_method(
+                    comment, public, 'void', setter_name, f'{setter_type} value', self.return_signature('void')[1]))
 
     def end(self):
         """
         Completes the document and outputs it
         """
         self._output[self.CLASS_END] = '}'
-        with open(f'{self._file_name}.java', 'wt') as file:
-            if self._output.get(self.HEADER):
-                file.write(self._output[self.HEADER])
-            if self._output.get(self.CLASS):
-                file.write(self._output[self.CLASS])
-            if self._output.get(self.VARIABLE):
-                file.write(self._output[self.VARIABLE])
-            if self._output.get(self.CONSTRUCTOR):
-                file.write(self._output[self.CONSTRUCTOR])
-            if self._output.get(self.METHOD):
-                file.write(self._output[self.METHOD])
-            if self._output.get(self.CLASS_END):
-                file.write(self._output[self.CLASS_END])
-
-        print('Output Complete')
+        # A spilled document is streamed back from its temporary files as the sink writes it
+        self._sink.write(self.output_file, self.chunks() if self._spilled else self.fragments())
+
+        if self.announce:
+            print('Output Complete')
+
+    def clear_output(self):
+        """
+        Empties the sections of the previous document in place so their buffers are reused, fragments() copies
+        the sections so a sink still holding the previous document is unaffected, spilled sections are left to the
+        sink as it may still be reading them
+        """
+        if self._spilled:
+            self._output = dict()
+            return
+        output = self._output
+        # A section is only reused if it's the kind of buffer the memory budget calls for
+        spilling = self._memory_budget is not None
+        for key in self.SECTIONS:
+            section = output.get(key)
+            if section is None:
+                continue
+            if key in self.BUFFERED_SECTIONS and isinstance(section, SectionBuffer) == spilling:
+                section.clear()
+            else:
+                del output[key]
+
+    def fragments(self):
+        """
+        Collects the fragments of the document in output order
+
+        :return: The fragments of the document
+        """
+        fragments = list()
+        for key in self.SECTIONS:
+            section = self._output.get(key)
+            if not section:
+                continue
+            if key in self.BUFFERED_SECTIONS:
+                fragments.extend(section)
+            else:
+                fragments.append(section)
+        return fragments
+
+    def chunks(self):
+        """
+        Reads the document back in output order without holding all of it in memory, the sections spilled to
+        temporary files are copied in chunks, the sections are captured when this is called so a sink reading the
+        chunks on another thread after the generator has moved on to the next document still reads this one
+
+        :return: A generator of the chunks of the document
+        """
+        sections = list()
+        for key in self.SECTIONS:
+            section = self._output.get(key)
+            if not section:
+                continue
+            sections.append(section if key in self.BUFFERED_SECTIONS else (section,))
+        return self.read_sections(sections)
+
+    @staticmethod
+    def read_sections(sections):
+        """
+        Reads captured sections back in order
+
+        :param sections: The sections, each an iterable of its chunks
+        :return: A generator of the chunks of the sections
+        """
+        for section in sections:
+            yield from section
 
     def add_to_output(self, key, output):
         """
-        Adds a value to a section of the output
+        Adds a value to a section of the output, buffered sections collect their fragments in a list
+        so that the document is only joined once when it is output, within a memory budget they are
+        spilled to temporary files whenever the fragments held in memory exceed it
 
         :param key: The section of the output
         :param output: The value being added
         """
-        all_key = self._output.get(key)
-        if all_key:
-            all_key += output
-            self._output[key] = all_key
-        else:
-            self._output[key] = output
+        section = self._output.get(key)
+        if self._memory_budget is None:
+            if section is None:
+                self._output[key] = [output]
+            else:
+                section.append(output)
+            return
+
+        if section is None:
+            section = SectionBuffer()
+            self._output[key] = section
+        section.append(output)
+        self._buffered += len(output)
+        if self._buffered > self._memory_budget:
+            self.spill()
+
+    def spill(self):
+        """
+        Moves the fragments of every buffered section held in memory to the section's temporary file
+        """
+        for key in self.BUFFERED_SECTIONS:
+            section = self._output.get(key)
+            if section is not None:
+                section.spill()
+        self._buffered = 0
+        self._spilled = True
 
     def lookup_type(self, key):
         """
@@ -290,6 +509,25 @@ class Java(ObjectOriented):
         access_level = lookup_level if lookup_level else ''
         return access_level
 
+    def parameter_list(self, parameters):
+        """
+        Looks up the Java type of each parameter and joins the parameters into a parameter list in a single pass
+
+        :param parameters: The parameters
+        :return: The Java types and the parameter list
+        """
+        if not parameters:
+            return (), ''
+        types = self.types
+        parameter_types = list()
+        entries = list()
+        for parameter in parameters:
+            data_type = parameter.data_type
+            data_type = types.get(data_type) or data_type
+            parameter_types.append(data_type)
+            entries.append(f'{data_type} {parameter.name}')
+        return tuple(parameter_types), ', '.join(entries)
+
     def build_parameter_list(self, parameters):
         """
         Builds a parameter list from a set of parameters
@@ -297,15 +535,44 @@ class Java(ObjectOriented):
         :param parameters: The parameters
         :return: The parameter list
         """
-        parameter_list = ''
-        for parameter in parameters:
-            data_type = self.lookup_type(parameter.data_type)
-            parameter_list += f'{data_type} {parameter.name}'
+        return self.parameter_list(parameters)[1]
+
+
+class CSharp(Java):
+    """
+    A C# backend, the class layout matches Java so only the syntax that differs is overridden
+    """
+    extension = 'cs'
+    types = dict(bool='bool', str='string', Object='object', Integer='int')
+    return_values = dict(byte='0', short='0', int='0', float='0', double='0', long='0', bool='false', char="'\\0'")
+    header_comment_template = '/// <summary>\n/// </summary>\n'
+    comment_template = '\n\t/// <summary>\n\t/// </summary>'
+    constant_modifiers = 'const '
+    getter_prefix = 'Get'
+    setter_prefix = 'Set'
 
-            if parameters.index(parameter) < len(parameters) - 1:
-                parameter_list += ', '
+    def superclass(self, name):
+        """
+        Generates a class definition with a base class
+
+        :param name: The name of the base class
+        :return: A C# class definition with a base class
+        """
+        class_value = self.class_value()
+        self._output[self.CLASS] = f'{class_value} : {name} ' + '\n{\n'
 
-        return parameter_list
+    def interface(self, *args):
+        """
+        Generates a class definition with interfaces, after the base class if there is one
+
+        :param args: The interface names
+        :return: A C# class definition with interfaces
+        """
+        for interface in args:
+            self.declare('interface', interface)
+        class_value = self.class_value().rstrip()
+        separator = ', ' if ' : ' in class_value else ' : '
+        self._output[self.CLASS] = f'{class_value}{separator}{", ".join(args)}' + '\n{\n'
 
 
 if __name__ == '__main__':
@@ -320,8 +587,4 @@ if __name__ == '__main__':
     x.variable(True, True, True, 'PRI', Parameter('int', 'secondVariable', '10'))
     x.method('PUB', 'str', 'testMethod', Parameter('str', 'test'), Parameter('Object', 'anotherTest'))
     x.end()
-    print(x._output[x.CLASS], end='')
-    print(x._output[x.VARIABLE], end='')
-    print(x._output[x.CONSTRUCTOR], end='')
-    print(x._output[x.METHOD], end='')
-    print(x._output[x.CLASS_END], end='')
+    print(''.join(x.fragments()), end='')
@@ -0,0 +1,393 @@
+from Cache import SpecCache
+from Output import BackgroundWriter, FileSink
+from Parser import Parser
+from Pool import GeneratorPool
+from Render import render
+from Stream import read_frames, stream
+from TypeGraph import build
+from argparse import ArgumentParser
+from contextlib import redirect_stdout
+from difflib import unified_diff
+from tempfile import TemporaryDirectory
+from time import perf_counter, sleep
+import io
+import os
+import shutil
+import sys
+
+GOLDEN_DIRECTORY = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'golden')
+# Every parser type, the mapped and unmapped ones and every type with a default return value
+TYPES = ('byte', 'short', 'int', 'long', 'float', 'double', 'boolean', 'bool', 'char', 'str', 'String', 'Object',
+         'Integer', 'Custom')
+ACCESS_LEVELS = ('PUB', 'PRI', 'PRO')
+ACCESSOR_OPTIONS = ('', 'G', 'S', 'GS', 'SG')
+CONSTANT_VALUES = dict(byte='1', short='2', int='3', long='4L', float='5.0f', double='6.0', boolean='true', bool='false',
+                       char="'c'", str='"text"', String='"text"', Object='null', Integer='7', Custom='null')
+
+# Classes extending each other across an inheritance cycle, an unknown superclass and a class that fails to generate
+GRAPH_SPEC = ['JAVA Base', 'C Base', 'E',
+              'JAVA Derived', 'C Derived', 'S Base', 'E',
+              'JAVA CycleFirst', 'C CycleFirst', 'S CycleSecond', 'E',
+              'JAVA CycleSecond', 'C CycleSecond', 'S CycleFirst', 'E',
+              'JAVA AfterCycle', 'C AfterCycle', 'S CycleFirst', 'E',
+              'JAVA Orphan', 'C Orphan', 'S Missing', 'E',
+              'JAVA AfterOrphan', 'C AfterOrphan', 'I Orphan', 'E',
+              'JAVA Broken', 'C Broken', 'M PUB void run', 'M PUB void run', 'E',
+              'JAVA AfterBroken', 'C AfterBroken', 'S Broken', 'E',
+              'JAVA AfterAfterBroken', 'C AfterAfterBroken', 'S AfterBroken', 'E']
+# How the type graph must leave each class of the graph spec
+GRAPH_OUTCOMES = dict(Base='generated', Derived='generated', CycleFirst='blocked', CycleSecond='blocked',
+                      AfterCycle='blocked', Orphan='blocked', AfterOrphan='blocked', Broken='failed',
+                      AfterBroken='failed', AfterAfterBroken='failed')
+# The errors the graph spec must report
+GRAPH_ERRORS = ('Inheritance cycle CycleFirst.java -> CycleSecond.java -> CycleFirst.java', 'Unknown type Missing')
+
+
+def members_spec(language, class_name, generate_comments):
+    """
+    Builds the spec of a class using every kind of member with every type, access level and getter/setter option
+
+    :param language: The language command
+    :param class_name: The name of the class
+    :param generate_comments: Whether comments are generated
+    :return: The lines of the spec
+    """
+    lines = [f'{language} {class_name}{" GC" if generate_comments else ""}', f'C {class_name}', 'S Base',
+             'I First,Second']
+    for data_type in TYPES:
+        for option in ACCESSOR_OPTIONS:
+            lines.append(f'CV {data_type} {data_type.lower()}{option.lower() or "plain"} {option}'.rstrip())
+        lines.append(f'CT {data_type} {data_type.upper()}_CONSTANT {CONSTANT_VALUES[data_type]}')
+    lines.append('CR')
+    lines.append('CR ' + ','.join(f'{data_type}:{data_type.lower()}Argument' for data_type in TYPES))
+    for access_level in ACCESS_LEVELS:
+        for return_type in TYPES + ('void',):
+            lines.append(f'M {access_level} {return_type} {access_level.lower()}{return_type.capitalize()}')
+        lines.append(f'M {access_level} int {access_level.lower()}Parameters int:first,str:second,Custom:third')
+    lines.append('E')
+    return lines
+
+
+def headers_spec(language, generate_comments):
+    """
+    Builds a spec of several classes, one for each combination of superclass and interfaces
+
+    :param language: The language command
+    :param generate_comments: Whether comments are generated
+    :return: The lines of the spec
+    """
+    suffix = 'Commented' if generate_comments else 'Plain'
+    headers = dict(Bare=[], Extends=['S Base'], Implements=['I First'], ImplementsMany=['I First,Second,Third'],
+                   ExtendsImplements=['S Base', 'I First,Second'])
+    lines = list()
+    for name, header in headers.items():
+        class_name = f'{name}{suffix}'
+        lines.append(f'{language} {class_name}{" GC" if generate_comments else ""}')
+        lines.append(f'C {class_name}')
+        lines.extend(header)
+        lines.append('E')
+    return lines
+
+
+def classes_spec(language, generate_comments, count=4):
+    """
+    Builds a spec of several classes with members, so every class of the spec fills and spills its sections
+
+    :param language: The language command
+    :param generate_comments: Whether comments are generated
+    :param count: The number of classes
+    :return: The lines of the spec
+    """
+    suffix = 'Commented' if generate_comments else 'Plain'
+    lines = list()
+    for index in range(count):
+        class_name = f'Class{index}{suffix}'
+        lines.append(f'{language} {class_name}{" GC" if generate_comments else ""}')
+        lines.append(f'C {class_name}')
+        lines.append(f'CV int value{index} GS')
+        lines.append(f'CT str NAME{index} "{class_name}"')
+        lines.append(f'CR int:value{index}')
+        lines.append(f'M PUB str describe{index} int:first,str:second')
+        lines.append('E')
+    return lines
+
+
+def corpus():
+    """
+    Builds the corpus of specs, covering every command and option in every language with and without comments
+
+    :return: The lines of each spec by the name of its spec file
+    """
+    specs = dict()
+    for language, generator_class in Parser.generator_commands.items():
+        for generate_comments in (False, True):
+            suffix = f'{generator_class.__name__}{"Commented" if generate_comments else "Plain"}'
+            specs[f'members_{suffix}.txt'] = members_spec(language, f'Members{suffix}', generate_comments)
+            specs[f'headers_{suffix}.txt'] = headers_spec(language, generate_comments)
+            specs[f'classes_{suffix}.txt'] = classes_spec(language, generate_comments)
+    return specs
+
+
+class LaggingSink(FileSink):
+    """
+    A file sink that waits before reading each document, so behind a background writer the generator has already
+    moved on to the next document by the time a document is read
+    """
+
+    def __init__(self, directory, lag=0.005):
+        """
+        Constructs a lagging sink
+
+        :param directory: The directory the files are written to
+        :param lag: The seconds waited before each document is read
+        """
+        super().__init__(directory)
+        self._lag = lag
+
+    def write(self, file_name, fragments):
+        sleep(self._lag)
+        return super().write(file_name, fragments)
+
+
+def read_directory(directory):
+    """
+    Reads every file of a directory
+
+    :param directory: The directory
+    :return: The content of each file by its name
+    """
+    documents = dict()
+    for name in sorted(os.listdir(directory)):
+        with open(os.path.join(directory, name), 'rb') as file:
+            documents[name] = file.read()
+    return documents
+
+
+def generate_files(spec_file, background_writes=None, **options):
+    """
+    Generates a spec file through the parser and file sink, as Parser.py does
+
+    :param spec_file: The spec file
+    :param background_writes: The queue size of a background writer, files are written inline if it's None
+    :param options: The options of the parser
+    :return: The content of each generated file by its name
+    """
+    with TemporaryDirectory() as directory, redirect_stdout(io.StringIO()):
+        sink = FileSink(directory)
+        if background_writes:
+            sink = BackgroundWriter(LaggingSink(directory), background_writes)
+        try:
+            Parser(spec_file, sink=sink, **options).parse_file()
+        finally:
+            if background_writes:
+                sink.close()
+        return read_directory(directory)
+
+
+def generate_cached(spec_file):
+    """
+    Generates a spec file from the classes loaded from a spec cache, as Parser.py --spec-cache does once the spec
+    file was parsed
+
+    :param spec_file: The spec file
+    :return: The content of each generated file by its name
+    """
+    with TemporaryDirectory() as directory:
+        spec_cache = SpecCache(directory)
+        generate_files(spec_file, spec_cache=spec_cache)
+        return generate_files(spec_file, spec_cache=spec_cache)
+
+
+def generate_stream(spec_file):
+    """
+    Generates a spec file through the framed stream, as Stream.py does
+
+    :param spec_file: The spec file
+    :return: The content of each generated file by its name
+    """
+    output = io.BytesIO()
+    with open(spec_file, 'rb') as file:
+        stream(file, output, framed=True)
+    output.seek(0)
+    return dict(read_frames(output))
+
+
+def generate_memory(spec_file, **options):
+    """
+    Generates a spec file in memory, as Render.render does
+
+    :param spec_file: The spec file
+    :param options: The options of the render
+    :return: The content of each generated file by its name
+    """
+    with open(spec_file, 'rb') as file:
+        return render(file, encoding='utf-8', **options)
+
+
+# Shared by every spec so the pooled path reuses generators across documents
+POOL = GeneratorPool()
+# Every generation path whose output must match the golden output
+PATHS = dict(files=generate_files,
+             spilled=lambda spec_file: generate_files(spec_file, memory_budget=1),
+             spilled_background=lambda spec_file: generate_files(spec_file, background_writes=4, memory_budget=1),
+             spec_cached=generate_cached,
+             memory=generate_memory,
+             pooled=lambda spec_file: generate_memory(spec_file, pool=POOL),
+             stream=generate_stream)
+
+
+def update(golden_directory=GOLDEN_DIRECTORY):
+    """
+    Writes the corpus and its golden outputs, generated through the file path
+
+    :param golden_directory: The directory of the corpus
+    """
+    spec_directory = os.path.join(golden_directory, 'specs')
+    expected_directory = os.path.join(golden_directory, 'expected')
+    for directory in (spec_directory, expected_directory):
+        if os.path.isdir(directory):
+            shutil.rmtree(directory)
+        os.makedirs(directory)
+    for name, lines in corpus().items():
+        spec_file = os.path.join(spec_directory, name)
+        with open(spec_file, 'wt') as file:
+            file.write('\n'.join(lines) + '\n')
+        output_directory = os.path.join(expected_directory, os.path.splitext(name)[0])
+        os.makedirs(output_directory)
+        for file_name, data in generate_files(spec_file).items():
+            with open(os.path.join(output_directory, file_name), 'wb') as file:
+                file.write(data)
+
+
+def compare(expected, actual):
+    """
+    Compares generated files against their golden outputs
+
+    :param expected: The golden content of each file by its name
+    :param actual: The generated content of each file by its name
+    :return: A description of each difference
+    """
+    differences = list()
+    for file_name in sorted(expected.keys() - actual.keys()):
+        differences.append(f'{file_name} is missing')
+    for file_name in sorted(actual.keys() - expected.keys()):
+        differences.append(f'{file_name} is unexpected')
+    for file_name in sorted(expected.keys() & actual.keys()):
+        if expected[file_name] != actual[file_name]:
+            diff = unified_diff(expected[file_name].decode().splitlines(), actual[file_name].decode().splitlines(),
+                                f'golden/{file_name}', file_name, lineterm='', n=1)
+            differences.append('\n'.join(list(diff)[:20]))
+    return differences
+
+
+def verify(golden_directory=GOLDEN_DIRECTORY, paths=PATHS):
+    """
+    Generates every spec of the corpus through every path and compares the output to the golden output byte for
+    byte
+
+    :param golden_directory: The directory of the corpus
+    :param paths: The generation paths checked
+    :return: The differences of each path and spec file
+    """
+    spec_directory = os.path.join(golden_directory, 'specs')
+    failures = dict()
+    for name in sorted(os.listdir(spec_directory)):
+        spec_file = os.path.join(spec_directory, name)
+        expected = read_directory(os.path.join(golden_directory, 'expected', os.path.splitext(name)[0]))
+        for path, generate in paths.items():
+            try:
+                differences = compare(expected, generate(spec_file))
+            except Exception as error:
+                differences = [f'{type(error).__name__}: {error}']
+            if differences:
+                failures[f'{path} {name}'] = differences
+    return failures
+
+
+def throughput(golden_directory=GOLDEN_DIRECTORY, rounds=20):
+    """
+    Measures the throughput of parsing and generating the corpus in memory, the fastest round is kept
+
+    :param golden_directory: The directory of the corpus
+    :param rounds: The number of rounds
+    :return: The spec lines parsed and generated per second
+    """
+    spec_directory = os.path.join(golden_directory, 'specs')
+    specs = list()
+    for name in sorted(os.listdir(spec_directory)):
+        with open(os.path.join(spec_directory, name), 'rb') as file:
+            specs.append(file.read())
+    lines = sum(spec.count(b'\n') for spec in specs)
+    fastest = float('inf')
+    for _ in range(rounds):
+        start = perf_counter()
+        for spec in specs:
+            render(spec)
+        fastest = min(fastest, perf_counter() - start)
+    return lines / fastest
+
+
+def verify_graph():
+    """
+    Builds the graph spec through the type graph and checks every class in a cycle, referring to an unknown type or
+    failing to generate is left out together with its dependents, while the other classes are still generated
+
+    :return: The description of each unexpected outcome
+    """
+    working_directory = os.getcwd()
+    with TemporaryDirectory() as directory:
+        spec_file = os.path.join(directory, 'graph.txt')
+        with open(spec_file, 'wt') as file:
+            file.write('\n'.join(GRAPH_SPEC) + '\n')
+        # The type graph writes its files to the working directory
+        os.chdir(directory)
+        try:
+            summary = build([spec_file], workers=1)
+        finally:
+            os.chdir(working_directory)
+
+    differences = list()
+    for class_name, expected in GRAPH_OUTCOMES.items():
+        name = f'{class_name}.java'
+        outcome = next((outcome for outcome in ('generated', 'blocked', 'failed') if name in summary[outcome]),
+                       'missing')
+        if outcome != expected:
+            differences.append(f'{name} is {outcome} instead of {expected}')
+    for error in GRAPH_ERRORS:
+        if not any(error in message for message in summary['errors']):
+            differences.append(f'No error reports {error}')
+    return differences
+
+
+def main():
+    argument_parser = ArgumentParser(description='Checks every generation path reproduces the golden output of the '
+                                                 'spec corpus byte for byte and keeps above a throughput floor')
+    argument_parser.add_argument('--update', action='store_true',
+                                 help='Regenerate the corpus and its golden outputs from the current generator')
+    argument_parser.add_argument('-f', '--min-lines-per-second', type=float, default=50000,
+                                 help='The throughput floor, in spec lines parsed and generated per second')
+    argument_parser.add_argument('-r', '--rounds', type=int, default=20, help='The rounds of the throughput check')
+    arguments = argument_parser.parse_args()
+
+    if arguments.update:
+        update()
+        print(f'Golden outputs written to {GOLDEN_DIRECTORY}')
+        return 0
+
+    failures = verify()
+    graph_differences = verify_graph()
+    if graph_differences:
+        failures['type graph'] = graph_differences
+    for failure, differences in failures.items():
+        print(f'FAILED {failure}')
+        for difference in differences:
+            print(difference)
+    lines_per_second = throughput(rounds=arguments.rounds)
+    too_slow = lines_per_second < arguments.min_lines_per_second
+    print(f'{len(failures)} failures, {lines_per_second:.0f} spec lines per second '
+          f'({"below" if too_slow else "above"} the floor of {arguments.min_lines_per_second:.0f})')
+    return 1 if failures or too_slow else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
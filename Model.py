@@ -0,0 +1,120 @@
+from sys import getsizeof
+
+
+class MemberNode:
+    """
+    A single command of a class, the kind is the name of the generator method the command drives and
+    the arguments are passed to it unchanged
+    """
+    __slots__ = ('kind', 'arguments', 'line_number')
+
+    CLASS_NAME = 'class_name'
+    SUPERCLASS = 'superclass'
+    INTERFACE = 'interface'
+    VARIABLE = 'variable'
+    CONSTANT = 'constant'
+    CONSTRUCTOR = 'constructor'
+    METHOD = 'method'
+
+    def __init__(self, kind, arguments, line_number):
+        """
+        Constructs a member node
+
+        :param kind: The kind of member
+        :param arguments: The arguments of the generator method
+        :param line_number: The line of the input the member was declared on
+        """
+        self.kind = kind
+        self.arguments = arguments
+        self.line_number = line_number
+
+    def generate(self, generator):
+        """
+        Drives the generator with the member
+
+        :param generator: The generator
+        """
+        getattr(generator, self.kind)(*self.arguments)
+
+    def __repr__(self):
+        return f'MemberNode({self.kind!r}, {self.arguments!r}, {self.line_number!r})'
+
+
+class ClassNode:
+    """
+    A class parsed from the input, everything between a language command and its end command
+    """
+    __slots__ = ('language', 'file_name', 'generate_comments', 'members', 'line_number')
+    # Bump the version whenever a change to the parser or the model alters the parsed classes
+    version = '1'
+
+    def __init__(self, language, file_name, generate_comments, line_number):
+        """
+        Constructs a class node
+
+        :param language: The language command that opened the class
+        :param file_name: The name of the output file
+        :param generate_comments: Whether comments should be generated or not
+        :param line_number: The line of the input the class was opened on
+        """
+        self.language = language
+        self.file_name = file_name
+        self.generate_comments = generate_comments
+        self.members = list()
+        self.line_number = line_number
+
+    def add(self, kind, line_number, *arguments):
+        """
+        Adds a member to the class
+
+        :param kind: The kind of member
+        :param line_number: The line of the input the member was declared on
+        :param arguments: The arguments of the generator method
+        """
+        self.members.append(MemberNode(kind, arguments, line_number))
+
+    def generate(self, generator):
+        """
+        Drives a generator with the class and completes its output, the generator is reset first so
+        one generator can output many classes
+
+        :param generator: Any ObjectOriented generator
+        :raises ValueError: If a member conflicts with another member of the class
+        """
+        generator.reset()
+        generator.file_name = self.file_name
+        generator.generate_comments = self.generate_comments
+        self.generate_members(generator)
+        generator.end()
+
+    def generate_members(self, generator):
+        """
+        Drives a generator with every member of the class in order
+
+        :param generator: The generator
+        :raises ValueError: If a member conflicts with another member of the class
+        """
+        for member in self.members:
+            try:
+                member.generate(generator)
+            except ValueError as error:
+                raise ValueError(f'{error} on line: {member.line_number}') from error
+
+    def memory_size(self):
+        """
+        Measures the memory held by the class, strings shared with other classes are counted too
+
+        :return: The size in bytes
+        """
+        size = getsizeof(self) + getsizeof(self.members)
+        for member in self.members:
+            size += getsizeof(member) + getsizeof(member.arguments)
+            for argument in member.arguments:
+                size += getsizeof(argument)
+                if hasattr(argument, '__dict__'):
+                    size += getsizeof(argument.__dict__)
+        return size
+
+    def __repr__(self):
+        return f'ClassNode({self.language!r}, {self.file_name!r}, {self.generate_comments!r}, ' \
+               f'{len(self.members)} members)'
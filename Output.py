@@ -0,0 +1,617 @@
+from abc import ABC, abstractmethod
+from hashlib import sha256
+from queue import Queue
+from tempfile import TemporaryFile
+from threading import Lock, Thread
+from uuid import uuid4
+from zipfile import ZIP_DEFLATED, ZipFile, ZipInfo
+import os
+import sqlite3
+
+
+def file_digest(path, block_size=1 << 16):
+    """
+    Hashes the content of a file
+
+    :param path: The path of the file
+    :param block_size: The size of each read
+    :return: The digest
+    """
+    content_hash = sha256()
+    with open(path, 'rb') as file:
+        for block in iter(lambda: file.read(block_size), b''):
+            content_hash.update(block)
+    return content_hash.digest()
+
+
+def file_holds(path, size, digest):
+    """
+    Checks whether a file already holds some content, comparing sizes before hashing
+
+    :param path: The path of the file
+    :param size: The size of the content in bytes
+    :param digest: The digest of the content
+    :return: True if the file holds the content
+    """
+    try:
+        if os.path.getsize(path) != size:
+            return False
+        return file_digest(path) == digest
+    except FileNotFoundError:
+        return False
+
+
+def replace_file(path, data, if_changed=False):
+    """
+    Writes a file atomically by writing a temporary file beside it and renaming it over the original
+
+    :param path: The path of the file
+    :param data: The content of the file, as bytes or an iterable of blocks of bytes that is streamed to the
+    temporary file
+    :param if_changed: Whether the original is kept and the temporary file dropped when it already holds the
+    content
+    :return: True if the file was replaced, False if it already held the content
+    """
+    if isinstance(data, bytes):
+        data = (data,)
+    directory, name = os.path.split(path)
+    temporary_file = os.path.join(directory, f'.{name}.{uuid4().hex}.tmp')
+    # Created like any other new file so the umask applies, then given the permissions of the file it replaces
+    descriptor = os.open(temporary_file, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o666)
+    try:
+        content_hash = sha256()
+        with os.fdopen(descriptor, 'wb') as file:
+            for block in data:
+                file.write(block)
+                if if_changed:
+                    content_hash.update(block)
+            size = file.tell()
+        if if_changed and file_holds(path, size, content_hash.digest()):
+            os.unlink(temporary_file)
+            return False
+        if os.path.exists(path):
+            os.chmod(temporary_file, os.stat(path).st_mode & 0o7777)
+        os.replace(temporary_file, path)
+    except BaseException:
+        os.unlink(temporary_file)
+        raise
+    return True
+
+
+class SectionBuffer:
+    """
+    The fragments of a section of a document, kept in memory until they are spilled to a temporary file so that
+    huge documents can be generated within a memory budget
+    """
+    __slots__ = ('_fragments', '_size', '_file')
+
+    def __init__(self):
+        """
+        Constructs an empty section buffer
+        """
+        self._fragments = list()
+        self._size = 0
+        self._file = None
+
+    @property
+    def size(self):
+        return self._size
+
+    @property
+    def spilled(self):
+        return self._file is not None
+
+    def append(self, fragment):
+        """
+        Adds a fragment to the end of the section
+
+        :param fragment: The fragment
+        """
+        self._fragments.append(fragment)
+        self._size += len(fragment)
+
+    def spill(self):
+        """
+        Moves the fragments held in memory to the end of the section's temporary file
+        """
+        if not self._fragments:
+            return
+        if self._file is None:
+            self._file = TemporaryFile('w+t', encoding='utf-8', newline='')
+        self._file.writelines(self._fragments)
+        self._fragments = list()
+        self._size = 0
+
+    def chunks(self, chunk_size=1 << 16):
+        """
+        Reads the section back in order, the spilled part is copied from its temporary file in chunks which is
+        closed and deleted once it has been read
+
+        :param chunk_size: The number of characters in each chunk read from the temporary file
+        :return: A generator of the chunks and fragments of the section
+        """
+        file = self._file
+        if file is not None:
+            try:
+                file.seek(0)
+                yield from iter(lambda: file.read(chunk_size), '')
+            finally:
+                file.close()
+        yield from self._fragments
+
+    def clear(self):
+        """
+        Empties a section whose fragments are all still in memory so it can be reused
+        """
+        self._fragments.clear()
+        self._size = 0
+
+    def __iter__(self):
+        return self.chunks()
+
+    def __bool__(self):
+        return bool(self._fragments) or self._file is not None
+
+
+class SignatureIndex:
+    """
+    The member signatures of a document, held in a set until they outgrow a memory budget and then moved to a
+    temporary database on disk so that huge documents are still checked for duplicate members exactly, a signature
+    is a tuple of the member's kind, name and parameter types, which are None if the member takes no parameters
+    """
+
+    def __init__(self, memory_budget=None):
+        """
+        Constructs an empty signature index
+
+        :param memory_budget: The characters of signatures held in memory before they are spilled, there's no
+        limit if it's None
+        """
+        self._memory_budget = memory_budget
+        self._signatures = set()
+        self._size = 0
+        self._database = None
+
+    @property
+    def spilled(self):
+        return self._database is not None
+
+    @staticmethod
+    def describe(signature):
+        """
+        Formats a signature as text, the key it's stored under once the index is spilled
+
+        :param signature: The signature
+        :return: The text of the signature
+        """
+        kind, name, parameter_types = signature
+        if parameter_types is None:
+            return f'{kind} {name}'
+        return f'{kind} {name}({",".join(parameter_types)})'
+
+    def add(self, signature):
+        """
+        Adds a signature to the index
+
+        :param signature: The signature
+        :return: False if the index already held the signature
+        """
+        if self._database is not None:
+            try:
+                self._database.execute('INSERT INTO signatures VALUES (?)', (self.describe(signature),))
+            except sqlite3.IntegrityError:
+                return False
+            return True
+
+        if signature in self._signatures:
+            return False
+        self._signatures.add(signature)
+        if self._memory_budget is not None:
+            kind, name, parameter_types = signature
+            self._size += len(name) + (sum(map(len, parameter_types)) if parameter_types else 0)
+            if self._size > self._memory_budget:
+                self.spill()
+        return True
+
+    def spill(self):
+        """
+        Moves the signatures to a temporary database, which is deleted once the index is closed
+        """
+        # An empty name opens a private database in a temporary file
+        self._database = sqlite3.connect('', check_same_thread=False)
+        self._database.execute('CREATE TABLE signatures (signature TEXT PRIMARY KEY) WITHOUT ROWID')
+        self._database.executemany('INSERT INTO signatures VALUES (?)',
+                                   ((self.describe(signature),) for signature in self._signatures))
+        self._signatures = set()
+        self._size = 0
+
+    def close(self):
+        """
+        Discards the signatures, deleting the temporary database if they were spilled
+        """
+        if self._database is not None:
+            self._database.close()
+            self._database = None
+        self._signatures.clear()
+        self._size = 0
+
+    def clear(self, memory_budget=None):
+        """
+        Discards the signatures so the index can be reused for another document
+
+        :param memory_budget: The characters of signatures held in memory before they are spilled, there's no
+        limit if it's None
+        """
+        self.close()
+        self._memory_budget = memory_budget
+
+
+class Sink(ABC):
+    """
+    Where generators output their documents, a sink counts the files it writes and the unchanged files it skips
+    """
+    files_written = 0
+    files_skipped = 0
+
+    @abstractmethod
+    def write(self, file_name, fragments):
+        """
+        Outputs a document
+
+        :param file_name: The name of the file
+        :param fragments: The fragments of the document in order
+        :return: True if the document was output, False if it was unchanged
+        """
+        pass
+
+    def close(self):
+        """
+        Completes the output, sinks that write as they go have nothing to complete
+        """
+        pass
+
+    def discard(self):
+        """
+        Abandons the output of a failed run, sinks that write as they go keep what they wrote
+        """
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if exc_type is None:
+            self.close()
+        else:
+            self.discard()
+
+
+class FileSink(Sink):
+    """
+    Writes each generated document to its own file
+    """
+
+    def __init__(self, directory='', write_if_changed=False):
+        """
+        Constructs a file sink
+
+        :param directory: The directory the files are written to, created if it doesn't exist
+        :param write_if_changed: Whether a file is only written if its content changed, keeping its mtime
+        otherwise
+        """
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._directory = directory
+        self._write_if_changed = write_if_changed
+        # The counters are shared by the generators of every language when a parse fans out
+        self._lock = Lock()
+        self.files_written = 0
+        self.files_skipped = 0
+
+    def write(self, file_name, fragments):
+        """
+        Writes a document
+
+        :param file_name: The name of the file
+        :param fragments: The fragments of the document in order, any iterable of them
+        :return: True if the file was written, False if it was unchanged
+        """
+        path = self.path(file_name)
+        if not self._write_if_changed:
+            with open(path, 'wt') as file:
+                file.writelines(fragments)
+            with self._lock:
+                self.files_written += 1
+            return True
+
+        # Streamed into a temporary file while hashed, so a spilled document is never joined in memory
+        if not replace_file(path, (fragment.encode() for fragment in fragments), if_changed=True):
+            with self._lock:
+                self.files_skipped += 1
+            return False
+        with self._lock:
+            self.files_written += 1
+        return True
+
+    def path(self, file_name):
+        """
+        Gets the path a document is written to
+
+        :param file_name: The name of the file
+        :return: The path
+        """
+        return os.path.join(self._directory, file_name)
+
+
+class ShardedSink(FileSink):
+    """
+    Writes each generated document to its own file in a tree of shard directories named by a hash of the file
+    name, so no directory grows past a few thousand files however many classes are generated
+    """
+
+    def __init__(self, directory='', depth=2, width=2, write_if_changed=False):
+        """
+        Constructs a sharded sink
+
+        :param directory: The root of the tree
+        :param depth: The number of levels of shard directories
+        :param width: The number of hex digits naming each shard directory
+        :param write_if_changed: Whether a file is only written if its content changed, keeping its mtime
+        otherwise
+        """
+        super().__init__(directory, write_if_changed)
+        self._depth = depth
+        self._width = width
+        self._directories = set()
+
+    def path(self, file_name):
+        """
+        Gets the path a document is written to, creating its shard directory the first time it is used
+
+        :param file_name: The name of the file
+        :return: The path
+        """
+        digest = sha256(file_name.encode()).hexdigest()
+        directory = os.path.join(self._directory, *(digest[level * self._width:(level + 1) * self._width]
+                                                    for level in range(self._depth)))
+        if directory not in self._directories:
+            os.makedirs(directory, exist_ok=True)
+            self._directories.add(directory)
+        return os.path.join(directory, file_name)
+
+
+class ArchiveSink(Sink):
+    """
+    Streams every generated document into a single zip or jar archive in one pass, the archive is written beside
+    its path and only replaces it once it is closed
+    """
+    # A fixed timestamp keeps the archive byte for byte identical across runs while the documents are unchanged
+    date_time = (1980, 1, 1, 0, 0, 0)
+    jar_manifest = 'Manifest-Version: 1.0\r\nCreated-By: Basic-Code-Generator\r\n\r\n'
+
+    def __init__(self, path, compression=ZIP_DEFLATED, compress_level=None):
+        """
+        Constructs an archive sink and opens its archive, a path ending in .jar gets a jar manifest
+
+        :param path: The path of the archive
+        :param compression: The zipfile compression method
+        :param compress_level: The compression level, the method's default if it's None
+        """
+        self._path = path
+        self._compression = compression
+        self._compress_level = compress_level
+        self._lock = Lock()
+        directory, name = os.path.split(path)
+        self._temporary_file = os.path.join(directory, f'.{name}.{uuid4().hex}.tmp')
+        self._archive = ZipFile(self._temporary_file, 'w', compression, compresslevel=compress_level)
+        self._names = set()
+        self.files_written = 0
+        self.files_skipped = 0
+        if path.lower().endswith('.jar'):
+            self.add('META-INF/MANIFEST.MF', (self.jar_manifest.encode(),))
+
+    def write(self, file_name, fragments):
+        """
+        Adds a document to the archive
+
+        :param file_name: The name of the file
+        :param fragments: The fragments of the document in order
+        :return: True
+        :raises ValueError: If the archive already holds a file of the same name
+        """
+        with self._lock:
+            if file_name in self._names:
+                raise ValueError(f'{file_name} is already in {self._path}')
+            self.add(file_name, (fragment.encode() for fragment in fragments))
+            self.files_written += 1
+        return True
+
+    def add(self, file_name, blocks):
+        """
+        Adds an entry to the archive, streaming its content into the archive without joining it
+
+        :param file_name: The name of the entry
+        :param blocks: The bytes of the entry in order
+        """
+        entry = ZipInfo(file_name, self.date_time)
+        entry.compress_type = self._compression
+        # An entry written through a ZipInfo takes its level from the ZipInfo rather than the archive, the
+        # attribute only became public in Python 3.13
+        if hasattr(ZipInfo, 'compress_level'):
+            entry.compress_level = self._compress_level
+        else:
+            entry._compresslevel = self._compress_level
+        entry.external_attr = 0o644 << 16
+        with self._archive.open(entry, 'w') as file:
+            for block in blocks:
+                file.write(block)
+        self._names.add(file_name)
+
+    def close(self):
+        """
+        Completes the archive and moves it into place
+        """
+        if self._archive is None:
+            return
+        self._archive.close()
+        self._archive = None
+        os.replace(self._temporary_file, self._path)
+
+    def discard(self):
+        """
+        Abandons the archive, leaving any archive already at its path as it was
+        """
+        if self._archive is None:
+            return
+        self._archive.close()
+        self._archive = None
+        os.unlink(self._temporary_file)
+
+
+class NullSink(Sink):
+    """
+    Reads every document and discards it, for generating only to find errors or to measure the generators
+    """
+
+    def write(self, file_name, fragments):
+        """
+        Reads a document to the end and discards it
+
+        :param file_name: The name of the file
+        :param fragments: The fragments of the document in order
+        :return: True
+        """
+        for _ in fragments:
+            pass
+        self.files_written += 1
+        return True
+
+
+class MemorySink(Sink):
+    """
+    Keeps each generated document in memory instead of writing it to a file
+    """
+
+    def __init__(self):
+        """
+        Constructs an empty memory sink
+        """
+        self._lock = Lock()
+        self.documents = dict()
+        self.files_written = 0
+        self.files_skipped = 0
+
+    def write(self, file_name, fragments):
+        """
+        Keeps a document, replacing an earlier document of the same name
+
+        :param file_name: The name of the file
+        :param fragments: The fragments of the document in order
+        :return: True
+        """
+        document = ''.join(fragments)
+        with self._lock:
+            self.documents[file_name] = document
+            self.files_written += 1
+        return True
+
+
+class BackgroundWriter(Sink):
+    """
+    Writes documents to a sink on a background thread so generation overlaps with file I/O, a bounded queue
+    blocks the generator when the writer falls behind
+    """
+
+    def __init__(self, sink, queue_size=64):
+        """
+        Constructs a background writer and starts its thread
+
+        :param sink: The sink the documents are written to
+        :param queue_size: The number of documents that can wait to be written
+        """
+        self._sink = sink
+        self._queue = Queue(maxsize=queue_size)
+        self._error = None
+        self._thread = Thread(target=self._run, name='BackgroundWriter', daemon=True)
+        self._thread.start()
+
+    @property
+    def sink(self):
+        return self._sink
+
+    @property
+    def files_written(self):
+        return self._sink.files_written
+
+    @property
+    def files_skipped(self):
+        return self._sink.files_skipped
+
+    def write(self, file_name, fragments):
+        """
+        Queues a document to be written, blocking while the queue is full
+
+        :param file_name: The name of the file
+        :param fragments: The fragments of the document in order
+        :raises Exception: The error of an earlier write that failed
+        """
+        self.raise_error()
+        self._queue.put((file_name, fragments))
+
+    def flush(self):
+        """
+        Waits for every queued document to be written
+
+        :raises Exception: The error of a write that failed
+        """
+        self._queue.join()
+        self.raise_error()
+
+    def close(self):
+        """
+        Writes the queued documents and stops the thread
+
+        :raises Exception: The error of a write that failed
+        """
+        if self._thread.is_alive():
+            self._queue.put(None)
+            self._thread.join()
+        self.raise_error()
+
+    def raise_error(self):
+        """
+        Raises the error of the first write that failed since the last error was raised
+
+        :raises Exception: The error
+        """
+        error = self._error
+        if error is not None:
+            self._error = None
+            raise error
+
+    def _run(self):
+        """
+        Drains the queue into the sink until the writer is closed
+        """
+        while True:
+            document = self._queue.get()
+            try:
+                if document is None:
+                    return
+                self._sink.write(*document)
+            except BaseException as error:
+                if self._error is None:
+                    self._error = error
+            finally:
+                self._queue.task_done()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        # An error raised by the caller takes precedence over a failed write
+        try:
+            self.close()
+        except Exception:
+            if exc_type is None:
+                raise
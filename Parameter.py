@@ -1,14 +1,21 @@
+from sys import intern
+
+
 class Parameter:
+    # Parameters are created in their hundreds of thousands, slots drop the per instance dict and the
+    # interned type and name strings are shared by every parameter that uses them
+    __slots__ = ('_data_type', '_name', '_value')
+
     def __init__(self, data_type, name, value=None):
         if isinstance(data_type, str):
-            self._data_type = data_type
+            self._data_type = intern(str(data_type))
         else:
-            raise TypeError(f'data_type must be a {type(str)} but instead is {type(name)}')
+            raise TypeError(f'data_type must be a {type(str)} but instead is {type(data_type)}')
 
         if isinstance(name, str):
-            self._name = name
+            self._name = intern(str(name))
         else:
-            raise TypeError(f'fame must be a {type(str)} but instead is {type(name)}')
+            raise TypeError(f'name must be a {type(str)} but instead is {type(name)}')
 
         self._value = value
 
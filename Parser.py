@@ -1,264 +1,700 @@
+from Cache import BuildCache, SpecCache
 from Generator import *
+from Model import ClassNode, MemberNode
+from Output import ArchiveSink, BackgroundWriter, FileSink, NullSink, ShardedSink
 from Parameter import Parameter
-from sys import argv
+from Profiler import Instrumentation
+from Reader import SpecReader
+from argparse import ArgumentParser, ArgumentTypeError
+from cProfile import Profile
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import nullcontext, redirect_stdout
+import json
+import os
+import re
+import sys
 
 
 class Parser:
-    generator_commands = dict(JAVA=Java('', False))
-
-    def __init__(self, input_file):
+    generator_commands = dict(JAVA=Java, CSHARP=CSharp)
+    # The handler, description, minimum and maximum number of values on the line of each class command
+    class_commands = dict(C=('class_command', 'class', 2, 2),
+                          S=('superclass_command', 'superclass', 2, 2),
+                          I=('interface_command', 'interface', 2, 2),
+                          CV=('class_variable_command', 'class variable', 3, 4),
+                          CT=('constant_command', 'constant', 4, 4),
+                          CR=('constructor_command', 'constructor', 1, 2),
+                          M=('method_command', 'method', 4, 5),
+                          E=('end_command', 'end', 1, 1))
+    language_arity = (2, 3)
+    # Whether a getter and setter are generated for each class variable option
+    accessor_options = dict(G=(True, False), S=(False, True), GS=(True, True), SG=(True, True))
+    access_levels = frozenset(('PUB', 'PRI', 'PRO'))
+    parameter_pattern = re.compile(r'([^,:]+):([^,:]+)(?:,(?=.)|$)')
+    # The number of classes the backends can fall behind the parser by when fanning out
+    fan_out_window = 16
+
+    def __init__(self, input_file, verbose=False, cache=None, sink=None, instrumentation=None, generators=None,
+                 languages=None, spec_cache=None, memory_budget=None):
         """
         Constructs the Parser
 
         :param input_file: The name of the input file
+        :param verbose: Whether each line is printed as it is parsed
+        :param cache: The build cache used to skip unchanged classes, every class is parsed if there's none
+        :param sink: The sink the generators write to, each generator writes its own files if there's none
+        :param instrumentation: The instrumentation the parser and its generators record their phases in
+        :param generators: The generator of each language, shared with other parsers so they stay warm, the parser
+        creates its own if there's none
+        :param languages: The languages every class is generated in, each class is only generated in the language of
+        its language command if there's none
+        :param spec_cache: The spec cache the parsed classes are loaded from while the input file is unchanged, the
+        input file is always parsed if there's none
+        :param memory_budget: The characters of each section the generators hold in memory before spilling them to
+        temporary files, there's no limit if it's None
+        :raises ValueError: If a language isn't known
         """
         self._input_file = input_file
+        self._verbose = verbose
+        self._cache = cache
+        self._spec_cache = spec_cache
+        self._memory_budget = memory_budget
+        self._sink = sink
+        self._skipped_classes = 0
         self._line_number = 1
-        self._generator = None
+        self._class = None
+        self._generators = dict() if generators is None else generators
+        self._instrumentation = instrumentation
+        self._languages = None
+        if languages:
+            for language in languages:
+                if language not in self.generator_commands:
+                    raise ValueError(f'Unknown language: {language}')
+            self._languages = tuple(languages)
+        self._executors = dict()
+        self._pending = deque()
+        self._commands = self.build_commands()
+        if instrumentation is not None:
+            self.parse_file = instrumentation.timed('Parser.parse_file', self.parse_file)
+            self.generate = instrumentation.timed('Parser.generate', self.generate)
+            self.drain = instrumentation.timed('Parser.drain', self.drain)
+
+    @property
+    def skipped_classes(self):
+        return self._skipped_classes
 
     def parse_file(self):
         """
         Parses the input file and calls upon the generator to create the output
         """
-        with open(self._input_file, 'rt') as file:
-            for line in file:
-                line_values = line.split()
-                print(line_values)
-                # If there's no values in the line
-                if not line_values:
-                    raise TypeError()
+        self.generate_all(self.parse())
 
-                # If command is a language command
-                if line_values[0] in self.generator_commands.keys():
-                    self.language_command(line_values)
+    def generate_all(self, class_nodes):
+        """
+        Calls upon the generators to create the output of every class, waiting for the classes still being
+        generated when fanning out
 
-                # If command is class command
-                elif line_values[0] == 'C':
-                    self.class_command(line_values)
+        :param class_nodes: The parsed classes
+        """
+        try:
+            for class_node in class_nodes:
+                self.generate(class_node)
+            self.drain()
+        finally:
+            self.close_executors()
+
+    def drain(self):
+        """
+        Waits for the classes still being generated when fanning out
+        """
+        while self._pending:
+            self.wait(self._pending.popleft())
 
-                # If command is superclass command
-                elif line_values[0] == 'S':
-                    self.superclass_command(line_values)
+    def generate(self, class_node):
+        """
+        Calls upon the generator for the language of a class to create its output, when fanning out the class is
+        handed to the generator of every language at once and the parser moves on to the next class
 
-                # If command is interface commands
-                elif line_values[0] == 'I':
-                    self.interface_command(line_values)
+        :param class_node: The parsed class
+        """
+        if self._languages is None:
+            class_node.generate(self.language_generator(class_node.language))
+            return
+
+        futures = [self.language_executor(language).submit(class_node.generate, self.language_generator(language))
+                   for language in self._languages]
+        # A cached class is only recorded once it has been generated, so it's waited for straight away
+        if self._cache is not None:
+            self.wait(futures)
+            return
+        self._pending.append(futures)
+        while len(self._pending) > self.fan_out_window:
+            self.wait(self._pending.popleft())
+
+    @staticmethod
+    def wait(futures):
+        """
+        Waits for the generation of a class in every language
 
-                # If command is class variable command
-                elif line_values[0] == 'CV':
-                    self.class_variable_command(line_values)
+        :param futures: The future of each language
+        :raises Exception: The error of a generator that failed
+        """
+        for future in futures:
+            future.result()
 
-                # If command is constant command
-                elif line_values[0] == 'CT':
-                    self.constant_command(line_values)
+    def language_executor(self, language):
+        """
+        Gets the executor for a language, a single thread so its generator only ever outputs one class at a time
 
-                # If command is constructor command
-                elif line_values[0] == 'CR':
-                    self.constructor_command(line_values)
+        :param language: The language command
+        :return: The executor for the language
+        """
+        executor = self._executors.get(language)
+        if executor is None:
+            executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix=f'Generator-{language}')
+            self._executors[language] = executor
+        return executor
 
-                # If the command is method command
-                elif line_values[0] == 'M':
-                    self.method_command(line_values)
+    def close_executors(self):
+        """
+        Waits for the classes still being generated and stops the executors
+        """
+        for executor in self._executors.values():
+            executor.shutdown()
+        self._executors.clear()
+        self._pending.clear()
 
-                # If command is end command
-                elif line_values[0] == 'E':
-                    self._generator.end()
+    def parse(self):
+        """
+        Parses the input file into classes, each class is produced as soon as its end command is read
+
+        :return: A generator of the parsed classes
+        :raises TypeError: If a line is invalid
+        """
+        # The build cache skips unchanged blocks itself, so the spec cache only stands in for a full parse
+        if self._spec_cache is not None and self._cache is None:
+            yield from self.parse_cached()
+            return
+        with SpecReader.open(self._input_file) as reader:
+            if self._cache is None:
+                yield from self.parse_lines(reader.lines())
+            else:
+                yield from self.parse_changed(reader)
 
-                # Invalid command
-                else:
-                    raise TypeError(f'Invalid command on line {self._line_number}')
+    def parse_cached(self):
+        """
+        Loads the classes of the input file from the spec cache, parsing and storing them if they're stale
 
-                self._line_number += 1
+        :return: A generator of the parsed classes
+        :raises TypeError: If a line is invalid
+        """
+        classes = self._spec_cache.load(self._input_file)
+        if classes is not None:
+            yield from classes
+            return
+
+        # Taken before reading so a change made while parsing makes the entry stale
+        status = os.stat(self._input_file)
+        classes = list()
+        with SpecReader.open(self._input_file) as reader:
+            for class_node in self.parse_lines(reader.lines()):
+                classes.append(class_node)
+                yield class_node
+            digest = reader.digest()
+        # Only a spec file that parsed and generated without errors is stored
+        self._spec_cache.store(self._input_file, status, digest, classes)
+
+    def parse_lines(self, lines):
+        """
+        Parses tokenized lines of input into classes
+
+        :param lines: The fields of each line
+        :return: A generator of the parsed classes
+        :raises TypeError: If a line is invalid
+        """
+        for line_values in lines:
+            class_node = self.parse_line(line_values)
+            # The end command completes a class
+            if class_node is not None:
+                yield class_node
+
+    def parse_line(self, line_values):
+        """
+        Parses a tokenized line of input
+
+        :param line_values: The fields of the line
+        :return: The class completed by the line, None if the line didn't complete one
+        :raises TypeError: If the line is invalid
+        """
+        if self._verbose:
+            print(line_values)
+        # If there's no values in the line
+        if not line_values:
+            raise TypeError(f'No command on line: {self._line_number}')
+
+        command = self._commands.get(line_values[0])
+        # Invalid command
+        if command is None:
+            raise TypeError(f'Invalid command on line {self._line_number}')
+
+        handler, description, minimum, maximum, opens_class = command
+        # Error if a class command comes before a language command
+        if self._class is None and not opens_class:
+            raise TypeError(f'No language command before line: {self._line_number}')
+        # Error if the arguments don't match the arity of the command
+        if len(line_values) < minimum:
+            raise TypeError(f'Not enough arguments in the {description} command on line: '
+                            f'{self._line_number}')
+        if len(line_values) > maximum:
+            raise TypeError(f'Too many arguments in the {description} command on line: '
+                            f'{self._line_number}')
+
+        class_node = handler(line_values)
+        self._line_number += 1
+        return class_node
+
+    def check(self):
+        """
+        Validates the input file without writing anything, every line is checked so that all of the errors
+        are reported rather than just the first, each class is also generated into a null sink so the conflicts
+        between its members are found
+
+        :return: The message of each error in line order
+        """
+        errors = list()
+        generators = dict()
+        sink = NullSink()
+        with SpecReader.open(self._input_file) as reader:
+            for line_values in reader.lines():
+                try:
+                    class_node = self.parse_line(line_values)
+                    # A class whose language command was invalid has no file name to generate
+                    if class_node is not None and class_node.file_name is not None:
+                        errors.extend(self.check_class(class_node, generators, sink))
+                except TypeError as error:
+                    errors.append(str(error))
+                    # Keep a class open after a bad language command so its members are still checked
+                    if line_values and line_values[0] in self.generator_commands:
+                        file_name = line_values[1] if len(line_values) > 1 else None
+                        self._class = ClassNode(line_values[0], file_name, False, self._line_number)
+                    self._line_number += 1
+        if self._class is not None:
+            errors.append(f'No end command for the class opened on line: {self._class.line_number}')
+        return errors
+
+    def check_class(self, class_node, generators, sink):
+        """
+        Generates a class into a sink in every language it's generated in to find the conflicts between its members
+
+        :param class_node: The parsed class
+        :param generators: The generator of each language, created as they're needed
+        :param sink: The sink the classes are discarded into
+        :return: The message of each error
+        """
+        errors = list()
+        for language in self._languages or (class_node.language,):
+            generator = generators.get(language)
+            if generator is None:
+                generator = self.create_generator(language, sink)
+                generators[language] = generator
+            try:
+                class_node.generate(generator)
+            except ValueError as error:
+                # The same conflict in several languages is reported once
+                if str(error) not in errors:
+                    errors.append(str(error))
+        return errors
+
+    def parse_changed(self, reader):
+        """
+        Parses only the class blocks of the input that changed since they were last generated
+
+        :param reader: The reader of the input file
+        :return: A generator of the parsed classes
+        :raises TypeError: If a line is invalid
+        """
+        block = list()
+        for line in reader.raw_lines():
+            block.append(line)
+            if reader.is_end(line):
+                yield from self.parse_block(block)
+                block = list()
+        # Anything after the last end command can't be skipped, parsing it reports its errors
+        yield from self.parse_lines(map(SpecReader.tokens, block))
+
+    def parse_block(self, block):
+        """
+        Parses a class block unless the build cache shows it is unchanged
+
+        :param block: The bytes of each line from the language command to the end command
+        :return: A generator of the parsed classes
+        """
+        lines = map(SpecReader.tokens, block)
+        language_values = SpecReader.tokens(block[0])
+        generator_class = self.generator_commands.get(language_values[0]) if language_values else None
+        # Blocks without a valid language command are parsed so that their errors are reported
+        if generator_class is None or len(language_values) < 2:
+            yield from self.parse_lines(lines)
+            return
+
+        data = b''.join(block)
+        generator_classes = [generator_class] if self._languages is None else \
+            [self.generator_commands[language] for language in self._languages]
+        # The block is only skipped if the output of every language it's generated in is fresh
+        outputs = [(f'{language_values[1]}.{output_class.extension}', self._cache.digest(output_class, data))
+                   for output_class in generator_classes]
+        if all(self._cache.is_fresh(output_file, digest) for output_file, digest in outputs):
+            self._line_number += len(block)
+            self._skipped_classes += 1
+            return
+
+        for class_node in self.parse_lines(lines):
+            yield class_node
+            # Resumed once the class has been generated, a failed class is never recorded
+            for output_file, digest in outputs:
+                self._cache.update(output_file, digest)
 
     def language_command(self, line_values):
         """
-        Calls the language command in the generator
+        Opens a class for the language command
 
         :param line_values: A line of the input file
-        :raises TypeError: If less than 2 arguments in the line_values or more than 3
-        """
-        # Error if less than 2 arguments
-        if len(line_values) < 2:
-            raise TypeError(f'Not enough arguments in the language command on line: {self._line_number}')
-        # Open generator without comments
-        elif len(line_values) == 2:
-            self._generator = self.generator_commands[line_values[0]]
-            self._generator.file_name = line_values[1]
-        # Open generator with comments
-        elif len(line_values) == 3 and line_values[2] == 'GC':
-            self._generator = self.generator_commands[line_values[0]]
-            self._generator.file_name = line_values[1]
-            self._generator.generate_comments = True
-        # Error if more than 3 arguments
+        :raises TypeError: If a class is still open or the option isn't the comment option
+        """
+        # Error if the previous class wasn't ended, it would be lost
+        if self._class is not None:
+            raise TypeError(f'No end command before line: {self._line_number}')
+        # Open class without comments
+        if len(line_values) == 2:
+            self._class = ClassNode(line_values[0], line_values[1], False, self._line_number)
+        # Open class with comments
+        elif line_values[2] == 'GC':
+            self._class = ClassNode(line_values[0], line_values[1], True, self._line_number)
+        # Error if the option isn't known
         else:
-            raise TypeError(f'Too many arguments in language command on line: {self._line_number}')
+            raise TypeError(f'Invalid option in the language command on line: {self._line_number}')
+
+    def build_commands(self):
+        """
+        Builds the dispatch table from each command to its bound handler and arity
+
+        :return: The dispatch table
+        """
+        commands = dict()
+        for language in self.generator_commands:
+            commands[language] = (self.language_command, 'language', *self.language_arity, True)
+        for command, (handler, description, minimum, maximum) in self.class_commands.items():
+            commands[command] = (getattr(self, handler), description, minimum, maximum, False)
+        if self._instrumentation is not None:
+            for command, (handler, *arity) in commands.items():
+                commands[command] = (self._instrumentation.timed(f'Parser.command.{command}', handler), *arity)
+        return commands
+
+    @classmethod
+    def create_generator(cls, language, sink=None, memory_budget=None, generate_comments=False, announce=False):
+        """
+        Creates a generator for a language, every generator the parser, renderer, pool and type graph use is
+        created here
+
+        :param language: The language command
+        :param sink: The sink the generator writes to, it writes its own files if there's none
+        :param memory_budget: The characters of each section the generator holds in memory, there's no limit if it's
+        None
+        :param generate_comments: Whether comments are generated until a class sets it
+        :param announce: Whether the completion of each document is printed, only the command line announces them
+        :return: The generator
+        :raises KeyError: If the language isn't known
+        """
+        generator = cls.generator_commands[language]('', generate_comments)
+        generator.announce = announce
+        if sink is not None:
+            generator.sink = sink
+        if memory_budget is not None:
+            generator.memory_budget = memory_budget
+        return generator
+
+    def language_generator(self, language):
+        """
+        Gets the generator for a language, creating it the first time the language is used
+
+        :param language: The language command
+        :return: The generator for the language
+        """
+        generator = self._generators.get(language)
+        if generator is None:
+            generator = self.create_generator(language, self._sink, self._memory_budget, announce=True)
+            if self._instrumentation is not None:
+                self._instrumentation.instrument_generator(generator)
+            self._generators[language] = generator
+        return generator
 
     def class_command(self, line_values):
         """
-        Calls the class command in the generator
+        Adds the class command to the class
 
         :param line_values: A line of the input file
-        :raises TypeError: If less than 2 arguments in the line_values or more than 2
-        """
-        # Error if less than 2 arguments
-        if len(line_values) < 2:
-            raise TypeError(f'Not enough arguments in the class command on line: {self._line_number}')
-        # Generate class name
-        elif len(line_values) == 2:
-            self._generator.class_name(line_values[1])
-        # Error if more than 2 arguments
-        else:
-            raise TypeError(f'Too many arguments in the class command on line: {self._line_number}')
+        :raises TypeError: If the class name doesn't match the file name of the language command
+        """
+        file_name = self._class.file_name
+        # The file name is unknown if the language command was invalid
+        if file_name is not None and line_values[1] != file_name:
+            raise TypeError(f'Class name {line_values[1]} doesn\'t match the file name {file_name} on line: '
+                            f'{self._line_number}')
+        self._class.add(MemberNode.CLASS_NAME, self._line_number, line_values[1])
 
     def superclass_command(self, line_values):
         """
-        Calls upon the superclass command in the generator
+        Adds the superclass command to the class
 
         :param line_values: A line of the input file
-        :raises TypeError: If less 2 arguments in the line_values or more than 2
-        """
-        # Error is less than 2 errors
-        if len(line_values) < 2:
-            raise TypeError(f'Not enough arguments in the superclass command on line: {self._line_number}')
-        # Generate superclass
-        elif len(line_values) == 2:
-            self._generator.superclass(line_values[1])
-        # Error if more than 2 arguments
-        else:
-            raise TypeError(f'Too many arguments in the superclass command on line: {self._line_number}')
+        """
+        self._class.add(MemberNode.SUPERCLASS, self._line_number, line_values[1])
 
     def interface_command(self, line_values):
         """
-        Calls upon the interface command in the generator
+        Adds the interface command to the class
 
         :param line_values: A line of the input file
-        :raises TypeError: If less than 2 arguments in the line_values or more than 2
-        """
-        # Error if less than 2 arguments
-        if len(line_values) < 2:
-            raise TypeError(f'Not enough arguments in the interface commands on line: {self._line_number}')
-        # Generate interface
-        elif len(line_values) == 2:
-            self._generator.interface(*line_values[1].split(','))
-        # Error if more than 2 arguments
-        else:
-            raise TypeError(f'Too many arguments in the interface commands on line: {self._line_number}')
+        """
+        self._class.add(MemberNode.INTERFACE, self._line_number, *line_values[1].split(','))
 
     def class_variable_command(self, line_values):
         """
-        Calls upon the class variable command in the generator
+        Adds the class variable command to the class
 
         :param line_values: A line of the input file
-        :raises TypeError: If less than 3 arguments in the line_values or more than 4
+        :raises TypeError: If the getter/setter option isn't known
         """
-        # Error if less than 3 arguments
-        if len(line_values) < 3:
-            raise TypeError(f'Not enough arguments in the class variable command on line: {self._line_number}')
         # Generate class variable
-        elif len(line_values) == 3:
-            self._generator.variable(True, False, False, 'PUB', Parameter(line_values[1], line_values[2]))
+        if len(line_values) == 3:
+            getter, setter = False, False
         # Generate class variable and getters/setters
-        elif len(line_values) == 4:
-            getter = False
-            setter = False
-            if 'G' == line_values[3]:
-                getter = True
-            elif 'S' == line_values[3]:
-                setter = True
-            elif 'GS' == line_values[3]:
-                getter = True
-                setter = True
-            elif 'SG' == line_values[3]:
-                getter = True
-                setter = True
-            else:
-                raise TypeError(f'Invalid command in class variable command on line: {self._line_number}')
-            self._generator.variable(True, getter, setter, 'PUB', Parameter(line_values[1], line_values[2]))
-
-        # Error if more than 4 arguments
         else:
-            raise TypeError(f'Too many arguments in the class variable command on line: {self._line_number}')
+            accessors = self.accessor_options.get(line_values[3])
+            if accessors is None:
+                raise TypeError(f'Invalid command in class variable command on line: {self._line_number}')
+            getter, setter = accessors
+        self._class.add(MemberNode.VARIABLE, self._line_number, True, getter, setter, 'PUB',
+                        Parameter(line_values[1], line_values[2]))
 
     def constant_command(self, line_values):
         """
-        Calls upon the constant command in the generator
+        Adds the constant command to the class
 
         :param line_values: A line of the input file
-        :raises TypeError: If less than 4 arguments in the line_values or more than 4
-        """
-        # Error if less than 4 arguments
-        if len(line_values) < 4:
-            raise TypeError(f'Not enough argument in the constant command on line: {self._line_number}')
-        # Generate constant
-        elif len(line_values) == 4:
-            self._generator.constant('PUB', Parameter(line_values[1], line_values[2], line_values[3]))
-        # Error if more than 4 arguments
-        else:
-            raise TypeError(f'Too many arguments in the constant command on line: {self._line_number}')
+        """
+        self._class.add(MemberNode.CONSTANT, self._line_number, 'PUB',
+                        Parameter(line_values[1], line_values[2], line_values[3]))
 
     def constructor_command(self, line_values):
         """
-        Calls upon the constructor command in the generator
+        Adds the constructor command to the class
 
         :param line_values: A line of the input file
-        :raises TypeError: If more than 2 arguments in the line_values
         """
         # Generate constructor with no arguments
         if len(line_values) == 1:
-            self._generator.constructor()
+            self._class.add(MemberNode.CONSTRUCTOR, self._line_number)
         # Generate constructor with arguments
-        elif len(line_values) == 2:
-            parameter_list = self.generate_parameter_list(line_values[1])
-            self._generator.constructor(*parameter_list)
-        # Error if more than 2 arguments
         else:
-            raise TypeError(f'Too many arguments in the constructor command on line: {self._line_number}')
+            parameter_list = self.generate_parameter_list(line_values[1])
+            self._class.add(MemberNode.CONSTRUCTOR, self._line_number, *parameter_list)
 
     def method_command(self, line_values):
         """
-        Calls upon the method command in the generator
+        Adds the method command to the class
 
         :param line_values: A line of the input file
-        :raises TypeError: If less than 4 arguments in the line_values or more than 5
+        :raises TypeError: If the access level isn't known
         """
-        # Error if  less than 4 commands
-        if len(line_values) < 4:
-            raise TypeError(f'Not enough arguments in the method command on line: {self._line_number}')
+        if line_values[1] not in self.access_levels:
+            raise TypeError(f'Invalid access level in method command on line: {self._line_number}')
         # Generate method with no arguments
-        elif len(line_values) == 4:
-            self._generator.method(line_values[1], line_values[2], line_values[3])
+        if len(line_values) == 4:
+            self._class.add(MemberNode.METHOD, self._line_number, line_values[1], line_values[2], line_values[3])
         # Generate method with arguments
-        elif len(line_values) == 5:
-            parameter_list = self.generate_parameter_list(line_values[4])
-            self._generator.method(line_values[1], line_values[2], line_values[3], *parameter_list)
-        # Error if more than 5 arguments
         else:
-            raise TypeError(f'Too many arguments in the method command on line: {self._line_number}')
+            parameter_list = self.generate_parameter_list(line_values[4])
+            self._class.add(MemberNode.METHOD, self._line_number, line_values[1], line_values[2], line_values[3],
+                            *parameter_list)
+
+    def end_command(self, line_values):
+        """
+        Completes the open class
+
+        :param line_values: A line of the input file
+        :return: The completed class
+        """
+        class_node = self._class
+        self._class = None
+        return class_node
 
     def generate_parameter_list(self, input_parameters):
         """
-        Generates a parameter list from a set of parameters
+        Generates a parameter list from a set of parameters in a single pass over the type:name pairs
 
         :param input_parameters: A set of parameters
-        :return:
+        :return: The parameters
+        :raises TypeError: If the set of parameters isn't a list of type:name pairs
         """
-        parameters = input_parameters.split(',')
         parameter_list = list()
-        for value in parameters:
-            parameter = value.split(':')
-            parameter_list.append(Parameter(parameter[0], parameter[1]))
+        match_parameter = self.parameter_pattern.match
+        position = 0
+        length = len(input_parameters)
+        while position < length:
+            match = match_parameter(input_parameters, position)
+            if match is None:
+                raise TypeError(f'Invalid parameter list on line: {self._line_number}')
+            parameter_list.append(Parameter(match[1], match[2]))
+            position = match.end()
 
         return parameter_list
 
 
+def language_list(value):
+    """
+    Parses a comma separated list of language commands given on the command line
+
+    :param value: The argument
+    :return: The language commands, in upper case
+    :raises ArgumentTypeError: If a language command isn't known
+    """
+    languages = value.upper().split(',')
+    unknown = [language for language in languages if language not in Parser.generator_commands]
+    if unknown:
+        raise ArgumentTypeError(f'unknown languages: {", ".join(unknown)}')
+    return languages
+
+
+def add_languages_argument(argument_parser, description):
+    """
+    Adds the option choosing the languages every class is generated in to a command line
+
+    :param argument_parser: The argument parser
+    :param description: What the option does, the known languages are appended to it
+    """
+    argument_parser.add_argument('-l', '--languages', type=language_list, metavar='LANGUAGE,...',
+                                 help=f'{description}, any of {", ".join(Parser.generator_commands)}')
+
+
+def add_cache_arguments(argument_parser, manifest_file, description):
+    """
+    Adds the options turning on the build cache to a command line, the manifest has an option of its own so the bare
+    flag never takes the positional arguments that follow it
+
+    :param argument_parser: The argument parser
+    :param manifest_file: The manifest the bare flag records the cache in
+    :param description: What the cache does
+    """
+    argument_parser.add_argument('-c', '--cache', action='store_const', const=manifest_file,
+                                 help=f'{description}, recorded in {manifest_file}')
+    argument_parser.add_argument('--cache-file', dest='cache', metavar='MANIFEST',
+                                 help='Use the cache as --cache does, recorded in this manifest')
+
+
 def main():
-    if len(argv) == 1:
-        parser = Parser('ExampleInput.txt')
+    argument_parser = ArgumentParser(description='Generates classes from a spec file')
+    argument_parser.add_argument('input_file', nargs='?', default='ExampleInput.txt', help='The spec file')
+    argument_parser.add_argument('-v', '--verbose', action='store_true', help='Print each line as it is parsed')
+    argument_parser.add_argument('--check', action='store_true',
+                                 help='Only validate the spec file, reporting every error without generating')
+    add_cache_arguments(argument_parser, '.codegen-cache.json', 'Skip classes unchanged since the last run')
+    # Like the cache manifest, each value below has an option of its own apart from its bare flag
+    argument_parser.add_argument('--spec-cache', action='store_const', const='.codegen-specs',
+                                 help='Load the parsed classes of an unchanged spec file from .codegen-specs')
+    argument_parser.add_argument('--spec-cache-dir', dest='spec_cache', metavar='DIRECTORY',
+                                 help='Load parsed classes as --spec-cache does, from this directory')
+    argument_parser.add_argument('-w', '--write-if-changed', action='store_true',
+                                 help='Only write files whose content changed, keeping the mtime of the rest')
+    argument_parser.add_argument('-o', '--output', metavar='PATH',
+                                 help='The directory the files are written to, or a .zip or .jar archive they are all '
+                                      'written into')
+    argument_parser.add_argument('--shard', action='store_const', const=2,
+                                 help='Write the files into a tree of directories named by a hash of the file name')
+    argument_parser.add_argument('--shard-depth', dest='shard', type=int, metavar='DEPTH',
+                                 help='Shard the files as --shard does, into this many levels of directories')
+    argument_parser.add_argument('--memory-budget', type=int, metavar='CHARACTERS',
+                                 help='Spill the sections of a class to temporary files once they hold more than this')
+    argument_parser.add_argument('-b', '--background-writes', action='store_const', const=64,
+                                 help='Write files on a background thread while the next classes are generated')
+    argument_parser.add_argument('--queue-size', dest='background_writes', type=int, metavar='QUEUE_SIZE',
+                                 help='Write files in the background as --background-writes does, with up to this '
+                                      'many files queued')
+    add_languages_argument(argument_parser, 'Generate every class in each of these languages at once from one parse')
+    argument_parser.add_argument('--profile', action='store_const', const='-',
+                                 help='Write the calls, time and bytes emitted of each phase as JSON to stdout')
+    argument_parser.add_argument('--profile-file', dest='profile', metavar='FILE',
+                                 help='Write the profile as --profile does, to this file, - for stdout')
+    argument_parser.add_argument('--cprofile', metavar='FILE', help='Capture a cProfile of the run to this file')
+    arguments = argument_parser.parse_args()
+    archive = arguments.output is not None and arguments.output.lower().endswith(('.zip', '.jar'))
+    if archive and (arguments.shard or arguments.write_if_changed):
+        argument_parser.error('an archive can\'t be sharded or written if changed')
+    # The build cache looks for the output files in the current directory
+    if arguments.cache and (arguments.output or arguments.shard):
+        argument_parser.error('the build cache only supports the default output')
+    if arguments.check:
+        errors = Parser(arguments.input_file, arguments.verbose, languages=arguments.languages).check()
+        for error in errors:
+            print(f'{arguments.input_file}: {error}')
+        return 1 if errors else 0
+
+    cache = BuildCache(arguments.cache) if arguments.cache else None
+    if archive:
+        output = ArchiveSink(arguments.output)
+    elif arguments.shard:
+        output = ShardedSink(arguments.output or '', arguments.shard, write_if_changed=arguments.write_if_changed)
     else:
-        parser = Parser(argv[1])
-
-    parser.parse_file()
+        output = FileSink(arguments.output or '', write_if_changed=arguments.write_if_changed)
+    sink = output
+    if arguments.background_writes:
+        sink = BackgroundWriter(output, arguments.background_writes)
+    instrumentation = Instrumentation() if arguments.profile else None
+    # A report written to stdout has it to itself, the progress lines go to stderr instead
+    progress = redirect_stdout(sys.stderr) if arguments.profile == '-' else nullcontext()
+    with progress:
+        parser = Parser(arguments.input_file, arguments.verbose, cache, sink, instrumentation,
+                        languages=arguments.languages, memory_budget=arguments.memory_budget,
+                        spec_cache=SpecCache(arguments.spec_cache) if arguments.spec_cache else None)
+        profile = Profile() if arguments.cprofile else None
+        completed = False
+        try:
+            if profile:
+                profile.runcall(parser.parse_file)
+            else:
+                parser.parse_file()
+            completed = True
+        finally:
+            if profile:
+                profile.dump_stats(arguments.cprofile)
+            # Every queued file is written before the cache records it, a failed write leaves the cache unsaved
+            try:
+                if arguments.background_writes:
+                    sink.close()
+            except BaseException:
+                output.discard()
+                raise
+            # A failed run leaves an earlier archive in place
+            if completed:
+                output.close()
+            else:
+                output.discard()
+            if cache:
+                cache.save()
+        if cache:
+            print(f'{parser.skipped_classes} unchanged classes skipped')
+        if arguments.write_if_changed:
+            print(f'{sink.files_written} files written, {sink.files_skipped} unchanged files skipped')
+    if instrumentation:
+        report = json.dumps(instrumentation.report(), indent=2)
+        if arguments.profile == '-':
+            print(report)
+        else:
+            with open(arguments.profile, 'wt') as file:
+                file.write(report)
+    return 0
 
 
 if __name__ == '__main__':
-    main()
+    sys.exit(main())
@@ -0,0 +1,121 @@
+from Output import NullSink
+from Parser import Parser
+from contextlib import contextmanager
+from threading import Lock
+
+
+class GeneratorPool:
+    """
+    Keeps warm generators for reuse, keyed by their language and options, so a service generating thousands of
+    classes a second checks out a generator whose section buffers are already allocated instead of building one
+    per class, checkout and check in are safe from any thread and a generator is only used by one thread at a time
+    """
+
+    def __init__(self, memory_budget=None, max_idle=None):
+        """
+        Constructs an empty generator pool
+
+        :param memory_budget: The characters of each section the pooled generators hold in memory, there's no limit
+        if it's None
+        :param max_idle: The number of idle generators kept for each key, there's no limit if it's None
+        """
+        self._memory_budget = memory_budget
+        self._max_idle = max_idle
+        self._idle = dict()
+        self._languages = {generator_class: language for language, generator_class in Parser.generator_commands.items()}
+        self._lock = Lock()
+        self.created = 0
+        self.reused = 0
+
+    @staticmethod
+    def key(language, generate_comments):
+        """
+        Gets the key generators are pooled under
+
+        :param language: The language command
+        :param generate_comments: Whether comments are generated
+        :return: The key
+        """
+        return language, bool(generate_comments)
+
+    def checkout(self, language, generate_comments=False, sink=None):
+        """
+        Takes a generator out of the pool, creating one if none is idle
+
+        :param language: The language command
+        :param generate_comments: Whether comments are generated
+        :param sink: The sink the generator writes to, a reused generator writes nowhere if there's none
+        :return: The generator, reset and ready for a document
+        :raises KeyError: If the language isn't known
+        """
+        key = self.key(language, generate_comments)
+        with self._lock:
+            idle = self._idle.get(key)
+            generator = idle.pop() if idle else None
+            if generator is None:
+                self.created += 1
+            else:
+                self.reused += 1
+
+        if generator is None:
+            generator = Parser.create_generator(language, memory_budget=self._memory_budget,
+                                                generate_comments=generate_comments)
+        if sink is not None:
+            generator.sink = sink
+        return generator
+
+    def checkin(self, generator):
+        """
+        Resets a generator and puts it back in the pool, the generator mustn't be used again until it is checked out
+
+        :param generator: The generator
+        :raises ValueError: If the generator isn't of a language command's generator class
+        """
+        language = self._languages.get(type(generator))
+        if language is None:
+            raise ValueError(f'{type(generator).__name__} is not the generator class of a language command')
+        # Dropping the document and the caller's sink, so an idle generator holds neither
+        generator.reset()
+        generator.sink = NullSink()
+        key = self.key(language, generator.generate_comments)
+        with self._lock:
+            idle = self._idle.setdefault(key, list())
+            if self._max_idle is None or len(idle) < self._max_idle:
+                idle.append(generator)
+
+    @contextmanager
+    def generator(self, language, generate_comments=False, sink=None):
+        """
+        Checks out a generator for the duration of a block
+
+        :param language: The language command
+        :param generate_comments: Whether comments are generated
+        :param sink: The sink the generator writes to
+        :return: A context manager giving the generator
+        """
+        generator = self.checkout(language, generate_comments, sink)
+        try:
+            yield generator
+        finally:
+            self.checkin(generator)
+
+    def generate(self, class_node, sink=None, language=None):
+        """
+        Generates a class with a pooled generator
+
+        :param class_node: The parsed class
+        :param sink: The sink the class is written to
+        :param language: The language the class is generated in, the language of its language command if there's
+        none
+        """
+        with self.generator(language or class_node.language, class_node.generate_comments, sink) as generator:
+            class_node.generate(generator)
+
+    def idle(self):
+        """
+        Counts the idle generators
+
+        :return: The number of idle generators
+        """
+        with self._lock:
+            return sum(len(idle) for idle in self._idle.values())
@@ -0,0 +1,180 @@
+from threading import Lock
+from time import perf_counter
+
+
+class Instrumentation:
+    """
+    Records the number of calls, cumulative time and bytes emitted of each phase of a generation run, parsers
+    and generators are only instrumented when they are given one so there's no overhead otherwise
+    """
+    # The generator methods that are timed
+    GENERATOR_METHODS = ('class_name', 'superclass', 'interface', 'constructor', 'method', 'variable', 'constant',
+                         'end')
+
+    def __init__(self):
+        """
+        Constructs an empty instrumentation
+        """
+        self._phases = dict()
+        # The sink counters are shared by the generators of every language when a parse fans out
+        self._lock = Lock()
+
+    def phase(self, name):
+        """
+        Gets the counters of a phase
+
+        :param name: The name of the phase
+        :return: The number of calls, the cumulative time and the bytes emitted
+        """
+        with self._lock:
+            counters = self._phases.get(name)
+            if counters is None:
+                counters = [0, 0.0, 0]
+                self._phases[name] = counters
+            return counters
+
+    def record(self, name, seconds, size=0):
+        """
+        Records a call of a phase
+
+        :param name: The name of the phase
+        :param seconds: The time taken by the call
+        :param size: The bytes emitted by the call
+        """
+        counters = self.phase(name)
+        with self._lock:
+            counters[0] += 1
+            counters[1] += seconds
+            counters[2] += size
+
+    def record_bytes(self, name, size):
+        """
+        Adds bytes emitted to a phase without counting a call
+
+        :param name: The name of the phase
+        :param size: The bytes emitted
+        """
+        counters = self.phase(name)
+        with self._lock:
+            counters[2] += size
+
+    def timed(self, name, function, running=None):
+        """
+        Wraps a function so that every call is recorded, the phase must only be called from one thread at a time
+
+        :param name: The name of the phase
+        :param function: The function
+        :param running: The calls in progress of a group of functions calling each other, a call made while another
+        of the group is running is left to the outer call's record, every call is recorded if it's None
+        :return: The wrapped function
+        """
+        counters = self.phase(name)
+
+        def timed_function(*args):
+            start = perf_counter()
+            try:
+                return function(*args)
+            finally:
+                counters[0] += 1
+                counters[1] += perf_counter() - start
+
+        def outermost_function(*args):
+            if running:
+                return function(*args)
+            running.append(name)
+            start = perf_counter()
+            try:
+                return function(*args)
+            finally:
+                running.pop()
+                counters[0] += 1
+                counters[1] += perf_counter() - start
+
+        return timed_function if running is None else outermost_function
+
+    def instrument_generator(self, generator):
+        """
+        Times the emission methods of a generator and counts the bytes it writes to its sink
+
+        :param generator: The generator
+        """
+        prefix = type(generator).__name__
+        # A method calling another, as constant calls variable, is only recorded under the outer method
+        running = list()
+        for name in self.GENERATOR_METHODS:
+            setattr(generator, name, self.timed(f'{prefix}.{name}', getattr(generator, name), running))
+        generator.sink = InstrumentedSink(generator.sink, self)
+
+    def report(self):
+        """
+        Builds a report of every phase, the time the parser spent outside of its command handlers and the
+        generators is reported as tokenizing
+
+        :return: The report
+        """
+        phases = {name: dict(count=count, seconds=seconds, bytes=size)
+                  for name, (count, seconds, size) in sorted(self._phases.items())}
+        report = dict(phases=phases)
+        parse_file = phases.get('Parser.parse_file')
+        if parse_file:
+            accounted = sum(phase['seconds'] for name, phase in phases.items()
+                            if name.startswith('Parser.command.') or name in ('Parser.generate', 'Parser.drain'))
+            report['tokenize_seconds'] = max(parse_file['seconds'] - accounted, 0)
+            report['total_seconds'] = parse_file['seconds']
+        report['bytes_emitted'] = sum(phase['bytes'] for phase in phases.values())
+        return report
+
+
+class InstrumentedSink:
+    """
+    Times the writes to a sink and counts the bytes written
+    """
+
+    def __init__(self, sink, instrumentation):
+        """
+        Constructs an instrumented sink
+
+        :param sink: The sink
+        :param instrumentation: The instrumentation the writes are recorded in
+        """
+        self._sink = sink
+        self._instrumentation = instrumentation
+
+    def write(self, file_name, fragments):
+        """
+        Writes a document to the sink, recording the time taken and its size
+
+        :param file_name: The name of the file
+        :param fragments: The fragments of the document in order
+        :return: The result of the sink's write
+        """
+        name = f'{type(self._sink).__name__}.write'
+        if not isinstance(fragments, list):
+            # A streamed document is counted as the sink reads it
+            fragments = self.counted(name, fragments)
+            size = 0
+        else:
+            size = sum(len(fragment.encode()) for fragment in fragments)
+        start = perf_counter()
+        result = self._sink.write(file_name, fragments)
+        self._instrumentation.record(name, perf_counter() - start, size)
+        return result
+
+    def counted(self, name, fragments):
+        """
+        Counts the bytes of a streamed document as it is read
+
+        :param name: The name of the phase the bytes are recorded in
+        :param fragments: The fragments of the document
+        :return: A generator of the fragments
+        """
+        size = 0
+        try:
+            for fragment in fragments:
+                size += len(fragment.encode())
+                yield fragment
+        finally:
+            self._instrumentation.record_bytes(name, size)
+
+    def __getattr__(self, name):
+        return getattr(self._sink, name)
@@ -0,0 +1,106 @@
+from contextlib import contextmanager
+from hashlib import sha256
+import io
+import mmap
+import re
+
+
+class SpecReader:
+    """
+    Reads a spec file through a memory map, so files of any size are read line by line straight from the
+    mapped pages without being loaded whole or passing through a text mode file
+    """
+    end_pattern = re.compile(rb'[ \t\f\v]*E(?:\s|$)')
+
+    def __init__(self, buffer):
+        """
+        Constructs a reader
+
+        :param buffer: The content of the spec file, a memory map or any binary file or stream
+        """
+        self._buffer = buffer
+
+    @classmethod
+    @contextmanager
+    def open(cls, path):
+        """
+        Opens a reader over a memory map of a spec file
+
+        :param path: The path of the spec file
+        :return: A context manager giving the reader
+        """
+        with open(path, 'rb') as file:
+            try:
+                buffer = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+            except ValueError:
+                # An empty file can't be mapped
+                yield cls(io.BytesIO())
+                return
+            with buffer:
+                yield cls(buffer)
+
+    @classmethod
+    def from_source(cls, source, encoding='utf-8'):
+        """
+        Creates a reader over spec text held in memory
+
+        :param source: The spec as a str, bytes or a text or binary stream
+        :param encoding: The encoding str specs are encoded with
+        :return: The reader
+        """
+        if hasattr(source, 'read'):
+            source = source.read()
+        if isinstance(source, str):
+            source = source.encode(encoding)
+        return cls(io.BytesIO(source))
+
+    def digest(self):
+        """
+        Hashes the content of the buffer, a memory map is hashed in place without being copied
+
+        :return: The digest
+        """
+        buffer = self._buffer
+        if isinstance(buffer, mmap.mmap):
+            return sha256(buffer).digest()
+        buffer.seek(0)
+        return sha256(buffer.read()).digest()
+
+    def raw_lines(self):
+        """
+        Reads every line of the buffer as it is
+
+        :return: A generator of the bytes of each line, including its line ending
+        """
+        # A pipe is read from where it is, lines are read as they arrive
+        if getattr(self._buffer, 'seekable', lambda: True)():
+            self._buffer.seek(0)
+        return iter(self._buffer.readline, b'')
+
+    def lines(self):
+        """
+        Tokenizes every line of the buffer
+
+        :return: A generator of the fields of each line
+        """
+        for line in self.raw_lines():
+            yield line.decode().split()
+
+    @staticmethod
+    def tokens(line):
+        """
+        Tokenizes a line
+
+        :param line: The bytes of the line
+        :return: The fields of the line
+        """
+        return line.decode().split()
+
+    def is_end(self, line):
+        """
+        Checks whether a line is an end command without tokenizing it
+
+        :param line: The bytes of the line
+        :return: True if the line's command is the end command
+        """
+        return self.end_pattern.match(line) is not None
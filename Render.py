@@ -0,0 +1,44 @@
+from Output import MemorySink
+from Parser import Parser
+from Reader import SpecReader
+
+
+def create_generators(sink):
+    """
+    Creates a quiet generator for every language, writing to a sink
+
+    :param sink: The sink
+    :return: The generator of each language
+    """
+    return {language: Parser.create_generator(language, sink) for language in Parser.generator_commands}
+
+
+def render(source, languages=None, encoding=None, name='<spec>', memory_budget=None, pool=None):
+    """
+    Generates the classes of a spec in memory without touching the disk, every call uses its own parser,
+    generators and sink so calls are safe to make concurrently from many threads
+
+    :param source: The spec as a str, bytes or a text or binary stream
+    :param languages: The languages every class is generated in, each class is only generated in the language of
+    its language command if there's none
+    :param encoding: The encoding the rendered sources are returned in, they are returned as str if there's none
+    :param name: The name of the spec, used in place of the input file
+    :param memory_budget: The characters of each section the generators hold in memory, there's no limit if it's
+    None
+    :param pool: The generator pool the classes are generated with one after another, under the pool's memory
+    budget, the call creates its own generators if there's none
+    :return: The rendered source of each output file
+    :raises TypeError: If a line of the spec is invalid
+    """
+    sink = MemorySink()
+    lines = SpecReader.from_source(source).lines()
+    if pool is None:
+        parser = Parser(name, generators=create_generators(sink), languages=languages, memory_budget=memory_budget)
+        parser.generate_all(parser.parse_lines(lines))
+    else:
+        for class_node in Parser(name, languages=languages).parse_lines(lines):
+            for language in languages or (class_node.language,):
+                pool.generate(class_node, sink, language)
+    if encoding is None:
+        return sink.documents
+    return {file_name: document.encode(encoding) for file_name, document in sink.documents.items()}
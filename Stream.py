@@ -0,0 +1,176 @@
+from Output import FileSink, Sink
+from Parser import Parser, add_languages_argument
+from Reader import SpecReader
+from Render import create_generators
+from argparse import ArgumentParser
+from threading import Lock
+import os
+import sys
+
+
+class StreamSink(Sink):
+    """
+    Writes each generated document to a binary stream as soon as it is complete, either one after another or
+    framed so a consumer can split them back into files, a document is copied in chunks so it is never joined
+    """
+
+    def __init__(self, stream, framed=False, chunk_size=1 << 16):
+        """
+        Constructs a stream sink
+
+        :param stream: The binary stream the documents are written to
+        :param framed: Whether each document is framed with its file name and chunk sizes
+        :param chunk_size: The bytes gathered into each chunk written to the stream
+        """
+        self._stream = stream
+        self._framed = framed
+        self._chunk_size = chunk_size
+        self._lock = Lock()
+        self.files_written = 0
+        self.files_skipped = 0
+
+    def write(self, file_name, fragments):
+        """
+        Writes a document to the stream and flushes it, a framed document is its file name on a FILE line followed
+        by each chunk's size on a line of its own before the chunk, and ends with a size of 0
+
+        :param file_name: The name of the file
+        :param fragments: The fragments of the document in order, any iterable of them
+        :return: True
+        """
+        with self._lock:
+            write = self._stream.write
+            if self._framed:
+                write(f'FILE {file_name}\n'.encode())
+                for chunk in self.chunks(fragments):
+                    write(b'%d\n' % len(chunk))
+                    write(chunk)
+                write(b'0\n')
+            else:
+                for chunk in self.chunks(fragments):
+                    write(chunk)
+                write(b'\n')
+            self._stream.flush()
+            self.files_written += 1
+        return True
+
+    def chunks(self, fragments):
+        """
+        Encodes the fragments of a document into chunks of about the chunk size
+
+        :param fragments: The fragments of the document
+        :return: A generator of the chunks
+        """
+        chunk = list()
+        size = 0
+        for fragment in fragments:
+            data = fragment.encode()
+            chunk.append(data)
+            size += len(data)
+            if size >= self._chunk_size:
+                yield b''.join(chunk)
+                chunk = list()
+                size = 0
+        if chunk:
+            yield b''.join(chunk)
+
+
+def read_frames(stream):
+    """
+    Reads the framed documents written by a stream sink
+
+    :param stream: The binary stream
+    :return: A generator of the file name and content of each document
+    :raises ValueError: If the stream isn't framed correctly
+    """
+    for header in iter(stream.readline, b''):
+        if not header.startswith(b'FILE ') or not header.endswith(b'\n'):
+            raise ValueError(f'Invalid frame header: {header[:80]!r}')
+        file_name = header[5:-1].decode()
+        chunks = list()
+        while True:
+            size_line = stream.readline()
+            if not size_line.rstrip(b'\n').isdigit():
+                raise ValueError(f'Invalid chunk size in {file_name}: {size_line[:80]!r}')
+            size = int(size_line)
+            if size == 0:
+                break
+            chunk = stream.read(size)
+            if len(chunk) != size:
+                raise ValueError(f'Truncated chunk in {file_name}')
+            chunks.append(chunk)
+        yield file_name, b''.join(chunks)
+
+
+def stream(input_stream, output_stream, framed=False, languages=None, memory_budget=None):
+    """
+    Generates the classes of a spec read from a binary stream, writing each class to another stream as soon as its
+    end command is read
+
+    :param input_stream: The binary stream the spec is read from, such as stdin
+    :param output_stream: The binary stream the classes are written to, such as stdout
+    :param framed: Whether each class is framed with its file name and chunk sizes
+    :param languages: The languages every class is generated in, each class is only generated in the language of
+    its language command if there's none
+    :param memory_budget: The characters of each section the generators hold in memory, there's no limit if it's
+    None
+    :return: The number of classes written
+    :raises TypeError: If a line of the spec is invalid
+    """
+    sink = StreamSink(output_stream, framed)
+    parser = Parser('<stdin>', generators=create_generators(sink), languages=languages,
+                    memory_budget=memory_budget)
+    parser.generate_all(parser.parse_lines(SpecReader(input_stream).lines()))
+    return sink.files_written
+
+
+def unpack(input_stream, directory='', write_if_changed=False):
+    """
+    Writes the framed documents read from a binary stream to files
+
+    :param input_stream: The binary stream
+    :param directory: The directory the files are written to, created if it doesn't exist
+    :param write_if_changed: Whether a file is only written if its content changed
+    :return: The sink the files were written with
+    :raises ValueError: If the stream isn't framed correctly or a file name isn't a plain name
+    """
+    sink = FileSink(directory, write_if_changed)
+    for file_name, data in read_frames(input_stream):
+        # A frame can only name a file in the directory
+        if os.path.basename(file_name) != file_name or file_name in ('', '.', '..'):
+            raise ValueError(f'Invalid file name: {file_name}')
+        sink.write(file_name, (data.decode(),))
+    return sink
+
+
+def main():
+    argument_parser = ArgumentParser(description='Generates classes from a spec read on stdin, writing each class '
+                                                 'to stdout as soon as its end command arrives')
+    argument_parser.add_argument('-f', '--framed', action='store_true',
+                                 help='Frame each class with its file name so a consumer can split them into files')
+    add_languages_argument(argument_parser, 'Generate every class in each of these languages')
+    argument_parser.add_argument('--memory-budget', type=int, metavar='CHARACTERS',
+                                 help='Spill the sections of a class to temporary files once they hold more than this')
+    argument_parser.add_argument('-u', '--unpack', metavar='DIRECTORY',
+                                 help='Read framed classes on stdin and write them to files in this directory instead')
+    argument_parser.add_argument('-w', '--write-if-changed', action='store_true',
+                                 help='Only write unpacked files whose content changed')
+    arguments = argument_parser.parse_args()
+    try:
+        if arguments.unpack is not None:
+            unpack(sys.stdin.buffer, arguments.unpack, arguments.write_if_changed)
+        else:
+            stream(sys.stdin.buffer, sys.stdout.buffer, arguments.framed, arguments.languages,
+                   arguments.memory_budget)
+    except (TypeError, ValueError) as error:
+        print(f'{type(error).__name__}: {error}', file=sys.stderr)
+        return 1
+    except BrokenPipeError:
+        # The consumer stopped reading, stdout is pointed at devnull so the interpreter can't fail flushing it
+        os.dup2(os.open(os.devnull, os.O_WRONLY), sys.stdout.fileno())
+        return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,372 @@
+from Batch import add_source_arguments, generate_class, initialise_worker, read_entries, source_spec_files
+from Cache import BuildCache
+from Model import MemberNode
+from Parser import Parser, add_cache_arguments
+from argparse import ArgumentParser
+from concurrent.futures import ProcessPoolExecutor
+from time import perf_counter
+import json
+import os
+import sys
+
+# Types a class may extend or implement without them being declared by a spec
+EXTERNAL_TYPES = frozenset(('Object', 'Cloneable', 'Serializable', 'Comparable', 'Iterable', 'Runnable',
+                            'AutoCloseable', 'Exception', 'RuntimeException', 'Thread'))
+
+
+class TypeGraph:
+    """
+    A project wide index of the classes declared across spec files and of the superclass and interfaces each one
+    refers to, used to find missing types and inheritance cycles and to order generation so that a class is only
+    generated after the classes it depends on, classes are known by their output file so each language has types
+    of its own
+    """
+
+    def __init__(self, external_types=EXTERNAL_TYPES):
+        """
+        Constructs an empty type graph
+
+        :param external_types: The types classes may refer to without them being declared
+        """
+        self._external_types = frozenset(external_types)
+        self._classes = dict()
+        self._spec_files = dict()
+        self._dependencies = dict()
+        self._duplicates = set()
+        self._errors = list()
+
+    def add(self, spec_file, class_node):
+        """
+        Adds a class to the index
+
+        :param spec_file: The spec file the class is declared in
+        :param class_node: The parsed class
+        """
+        name = output_file(class_node)
+        if name in self._classes:
+            self._duplicates.add(name)
+            self._errors.append(f'{spec_file}: Class {class_node.file_name} on line: {class_node.line_number} is '
+                                f'already declared in {self._spec_files[name]}')
+            return
+        extension = Parser.generator_commands[class_node.language].extension
+        dependencies = list()
+        for member in class_node.members:
+            if member.kind == MemberNode.SUPERCLASS or member.kind == MemberNode.INTERFACE:
+                dependencies.extend((f'{dependency}.{extension}', dependency, member.line_number)
+                                    for dependency in member.arguments)
+        self._classes[name] = class_node
+        self._spec_files[name] = spec_file
+        self._dependencies[name] = dependencies
+
+    def __contains__(self, name):
+        return name in self._classes
+
+    def __len__(self):
+        return len(self._classes)
+
+    def class_node(self, name):
+        """
+        Gets a declared class
+
+        :param name: The output file of the class
+        :return: The parsed class
+        """
+        return self._classes[name]
+
+    def dependencies(self, name):
+        """
+        Gets the declared classes a class extends or implements
+
+        :param name: The output file of the class
+        :return: The output files of the classes
+        """
+        return [dependency for dependency, data_type, line_number in self._dependencies[name]
+                if dependency in self._classes]
+
+    def check(self):
+        """
+        Finds the classes declared twice, the types that are referred to but never declared and the inheritance
+        cycles
+
+        :return: The message of each error
+        """
+        errors = list(self._errors)
+        for name in self._classes:
+            for dependency, line_number in self.unknown_types(name):
+                errors.append(f'{self._spec_files[name]}: Unknown type {dependency} on line: {line_number}')
+        for cycle in self.cycles():
+            errors.append(f'{self._spec_files[cycle[0]]}: Inheritance cycle {" -> ".join(cycle)}')
+        return errors
+
+    def unknown_types(self, name):
+        """
+        Finds the types a class extends or implements that are neither declared nor external
+
+        :param name: The output file of the class
+        :return: The unknown types and the line each one is referred to on
+        """
+        return [(data_type, line_number) for dependency, data_type, line_number in self._dependencies[name]
+                if dependency not in self._classes and data_type not in self._external_types]
+
+    def blocked(self):
+        """
+        Finds the classes that can't be generated, the classes declared twice, referring to an unknown type or in
+        an inheritance cycle and every class depending on them, every other class can still be generated
+
+        :return: The output files of the classes
+        """
+        invalid = set(self._duplicates)
+        invalid.update(name for name in self._classes if self.unknown_types(name))
+        ordered = {name for level in self.levels() for name in level}
+        invalid.update(name for name in self._classes if name not in ordered)
+        return self.dependents(invalid)
+
+    def levels(self):
+        """
+        Orders the classes into levels where every class only depends on classes of earlier levels, so the
+        classes of a level can be generated in parallel, classes in or depending on a cycle are left out
+
+        :return: The output files of the classes of each level
+        """
+        remaining = {name: len(set(self.dependencies(name))) for name in self._classes}
+        dependents = self.dependent_map()
+        levels = list()
+        level = sorted(name for name, count in remaining.items() if count == 0)
+        while level:
+            levels.append(level)
+            next_level = list()
+            for name in level:
+                del remaining[name]
+                for dependent in dependents[name]:
+                    remaining[dependent] -= 1
+                    if remaining[dependent] == 0:
+                        next_level.append(dependent)
+            level = sorted(next_level)
+        return levels
+
+    def cycles(self):
+        """
+        Finds the inheritance cycles
+
+        :return: The output files of the classes around each cycle, starting and ending with the same class
+        """
+        ordered = {name for level in self.levels() for name in level}
+        cycles = list()
+        visited = set()
+        for start in sorted(self._classes):
+            if start in ordered or start in visited:
+                continue
+            # Walk the unordered classes until one repeats, every unordered class leads into a cycle
+            path = list()
+            positions = dict()
+            name = start
+            while name not in positions and name not in visited:
+                positions[name] = len(path)
+                path.append(name)
+                name = next(dependency for dependency in sorted(self.dependencies(name))
+                            if dependency not in ordered)
+            visited.update(path)
+            if name in positions:
+                cycles.append(path[positions[name]:] + [name])
+        return cycles
+
+    def dependent_map(self):
+        """
+        Maps each class to the classes that extend or implement it
+
+        :return: The output files of the dependents of each class
+        """
+        dependents = {name: set() for name in self._classes}
+        for name in self._classes:
+            for dependency in self.dependencies(name):
+                dependents[dependency].add(name)
+        return dependents
+
+    def dependents(self, names):
+        """
+        Finds every class that depends on some classes, directly or through other classes
+
+        :param names: The output files of the classes
+        :return: The output files of the classes and all of their dependents
+        """
+        dependents = self.dependent_map()
+        found = set(names)
+        pending = list(found)
+        while pending:
+            for dependent in dependents.get(pending.pop(), ()):
+                if dependent not in found:
+                    found.add(dependent)
+                    pending.append(dependent)
+        return found
+
+
+def describe_class(class_node):
+    """
+    Encodes everything about a class that affects its output, line numbers are left out so moving a class
+    within its spec file doesn't change it
+
+    :param class_node: The parsed class
+    :return: The encoded class
+    """
+    members = list()
+    for member in class_node.members:
+        arguments = [(argument.data_type, argument.name, argument.value) if hasattr(argument, 'data_type')
+                     else argument for argument in member.arguments]
+        members.append((member.kind, arguments))
+    return repr((class_node.language, class_node.file_name, class_node.generate_comments, members)).encode()
+
+
+def output_file(class_node):
+    """
+    Gets the output file of a class
+
+    :param class_node: The parsed class
+    :return: The name of the output file
+    """
+    return f'{class_node.file_name}.{Parser.generator_commands[class_node.language].extension}'
+
+
+def read_external_types(files):
+    """
+    Reads the types listed in allowlist files
+
+    :param files: The allowlist files, listing one type per line
+    :return: The types
+    """
+    external_types = set()
+    for allowlist in files:
+        external_types.update(read_entries(allowlist))
+    return external_types
+
+
+def parse_spec(spec_file):
+    """
+    Parses a single spec file, this runs inside a worker process
+
+    :param spec_file: The spec file
+    :return: The spec file, its classes and the error if it couldn't be parsed
+    """
+    try:
+        return spec_file, list(Parser(spec_file).parse()), None
+    except Exception as error:
+        return spec_file, list(), f'{type(error).__name__}: {error}'
+
+
+def build(spec_files, workers=None, cache=None, write_if_changed=False, check_only=False,
+          external_types=EXTERNAL_TYPES):
+    """
+    Parses a set of spec files into a type graph and generates the changed classes and their dependents level by
+    level across a process pool, the classes an error blocks and their dependents are left out while the rest are
+    still generated
+
+    :param spec_files: The spec files
+    :param workers: The number of worker processes, defaults to the number of CPUs
+    :param cache: The build cache of the classes' content, every class is generated if there's none
+    :param write_if_changed: Whether files are only written if their content changed
+    :param check_only: Whether the graph is only checked without generating anything
+    :param external_types: The types classes may refer to without them being declared
+    :return: The summary of the build
+    """
+    workers = workers or os.cpu_count() or 1
+    graph = TypeGraph(external_types)
+    errors = list()
+    generated = list()
+    failed = dict()
+    # The workers share Batch's worker state, without a build cache of their own or background writes
+    with ProcessPoolExecutor(max_workers=workers, initializer=initialise_worker,
+                             initargs=(None, write_if_changed, None)) as executor:
+        chunk_size = max(1, len(spec_files) // (workers * 4))
+        for spec_file, classes, error in executor.map(parse_spec, spec_files, chunksize=chunk_size):
+            if error:
+                errors.append(f'{spec_file}: {error}')
+            for class_node in classes:
+                graph.add(spec_file, class_node)
+        errors.extend(graph.check())
+        levels = graph.levels()
+        blocked = graph.blocked()
+        if check_only:
+            return dict(classes=len(graph), levels=levels, errors=errors, blocked=sorted(blocked),
+                        generated=generated, failed=failed, skipped_classes=0)
+
+        digests = dict()
+        for level in levels:
+            for name in level:
+                if name in blocked:
+                    continue
+                class_node = graph.class_node(name)
+                digests[name] = cache.digest(Parser.generator_commands[class_node.language],
+                                             describe_class(class_node)) if cache else None
+        changed = [name for name, digest in digests.items()
+                   if cache is None or not cache.is_fresh(name, digest)]
+        # A class is regenerated whenever a class it extends or implements is
+        scheduled = graph.dependents(changed) - blocked
+
+        for level in levels:
+            # A class whose dependency failed isn't generated
+            batch = [name for name in level if name in scheduled and
+                     not any(dependency in failed for dependency in graph.dependencies(name))]
+            chunk_size = max(1, len(batch) // (workers * 4))
+            errors_by_class = executor.map(generate_class, map(graph.class_node, batch), chunksize=chunk_size)
+            for name, error in zip(batch, errors_by_class):
+                if error:
+                    failed[name] = error
+                    continue
+                generated.append(name)
+                if cache:
+                    cache.update(name, digests[name])
+            for name in level:
+                if name in scheduled and name not in failed and name not in generated:
+                    failed[name] = 'Not generated because a class it depends on failed'
+
+    return dict(classes=len(graph), levels=levels, errors=errors, blocked=sorted(blocked), generated=generated,
+                failed=failed, skipped_classes=len(graph) - len(blocked) - len(scheduled))
+
+
+def main():
+    argument_parser = ArgumentParser(description='Checks the classes declared across spec files refer to each other '
+                                                 'correctly and generates them in dependency order')
+    add_source_arguments(argument_parser)
+    argument_parser.add_argument('--check', action='store_true',
+                                 help='Only check for missing types and cycles, printing the generation levels')
+    argument_parser.add_argument('-e', '--external', action='append', default=[],
+                                 type=lambda value: value.split(','), metavar='TYPE,...',
+                                 help='Types classes may extend or implement without them being declared, added to '
+                                      f'{", ".join(sorted(EXTERNAL_TYPES))}')
+    argument_parser.add_argument('--external-file', action='append', default=[], metavar='FILE',
+                                 help='A file listing one external type per line')
+    add_cache_arguments(argument_parser, '.codegen-graph.json',
+                        'Only generate classes that changed since the last run and the classes depending on them')
+    argument_parser.add_argument('-w', '--write-if-changed', action='store_true',
+                                 help='Only write files whose content changed, keeping the mtime of the rest')
+    arguments = argument_parser.parse_args()
+
+    spec_files = source_spec_files(argument_parser, arguments)
+    cache = BuildCache(arguments.cache) if arguments.cache else None
+    start = perf_counter()
+    external_types = EXTERNAL_TYPES.union(*arguments.external, read_external_types(arguments.external_file))
+    summary = build(spec_files, arguments.workers, cache, arguments.write_if_changed, arguments.check,
+                    external_types)
+    summary['seconds'] = perf_counter() - start
+    if cache:
+        cache.save()
+
+    for error in summary['errors']:
+        print(error)
+    if arguments.check:
+        for index, level in enumerate(summary['levels']):
+            print(f'Level {index}: {" ".join(level)}')
+    for name, error in summary['failed'].items():
+        print(f'FAILED {name}: {error}')
+    print(f'{summary["classes"]} classes in {len(summary["levels"])} levels, {len(summary["generated"])} generated, '
+          f'{summary["skipped_classes"]} unchanged classes skipped, {len(summary["blocked"])} classes blocked by '
+          f'{len(summary["errors"])} errors in {summary["seconds"]:.3f}s')
+
+    if arguments.summary:
+        with open(arguments.summary, 'wt') as file:
+            json.dump(summary, file, indent=2)
+
+    return 1 if summary['errors'] or summary['failed'] else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,171 @@
+from Batch import collect_spec_files
+from Cache import BuildCache
+from Output import FileSink
+from Parser import Parser
+from argparse import ArgumentParser
+from socketserver import StreamRequestHandler, ThreadingUnixStreamServer
+from threading import Lock, Thread
+from time import perf_counter, sleep
+import json
+import os
+
+
+class Watcher:
+    """
+    Keeps the generators warm in one long running process and regenerates spec files as they change, changes are
+    found by polling so no platform notifier is needed and the build cache limits the work to the changed classes
+    """
+
+    def __init__(self, sources, pattern='*.txt', manifest_file='.codegen-cache.json', write_if_changed=True):
+        """
+        Constructs a watcher
+
+        :param sources: The spec files, directories or glob patterns watched
+        :param pattern: The pattern spec files in a directory must match
+        :param manifest_file: The manifest of the build cache
+        :param write_if_changed: Whether files are only written if their content changed
+        """
+        self._sources = sources
+        self._pattern = pattern
+        self._cache = BuildCache(manifest_file)
+        self._sink = FileSink(write_if_changed=write_if_changed)
+        self._generators = dict()
+        self._stamps = dict()
+        self._lock = Lock()
+
+    def scan(self):
+        """
+        Finds the spec files that are new or changed since the last scan
+
+        :return: The changed spec files
+        """
+        try:
+            spec_files = collect_spec_files(self._sources, pattern=self._pattern)
+        except FileNotFoundError:
+            spec_files = list()
+
+        changed = list()
+        stamps = dict()
+        for spec_file in spec_files:
+            try:
+                status = os.stat(spec_file)
+            except FileNotFoundError:
+                continue
+            stamps[spec_file] = (status.st_mtime_ns, status.st_size)
+            if self._stamps.get(spec_file) != stamps[spec_file]:
+                changed.append(spec_file)
+        self._stamps = stamps
+        return changed
+
+    def compile(self, spec_file):
+        """
+        Regenerates the changed classes of a spec file
+
+        :param spec_file: The spec file
+        :return: The result of compiling the spec file
+        """
+        with self._lock:
+            start = perf_counter()
+            files_written = self._sink.files_written
+            parser = Parser(spec_file, cache=self._cache, sink=self._sink, generators=self._generators)
+            result = dict(file=spec_file, success=True, error=None)
+            try:
+                parser.parse_file()
+            except Exception as error:
+                result.update(success=False, error=f'{type(error).__name__}: {error}')
+            finally:
+                self._cache.save()
+            result.update(seconds=perf_counter() - start, skipped_classes=parser.skipped_classes,
+                          files_written=self._sink.files_written - files_written)
+            return result
+
+    def poll(self):
+        """
+        Regenerates every spec file changed since the last poll
+
+        :return: The result of each changed spec file
+        """
+        return [self.compile(spec_file) for spec_file in self.scan()]
+
+    def watch(self, interval=0.25):
+        """
+        Polls for changes until interrupted, reporting each regenerated spec file
+
+        :param interval: The seconds between polls
+        """
+        while True:
+            for result in self.poll():
+                report(result)
+            sleep(interval)
+
+    def serve(self, socket_path):
+        """
+        Accepts requests over a local Unix socket on a background thread, a client sends one spec file per line
+        and gets back one JSON result per line, each client is served on a thread of its own so an idle client
+        doesn't hold up the others or the shutdown
+
+        :param socket_path: The path of the socket
+        :return: The server
+        """
+        watcher = self
+
+        class RequestHandler(StreamRequestHandler):
+            def handle(self):
+                for line in self.rfile:
+                    spec_file = line.decode().strip()
+                    if spec_file:
+                        self.wfile.write(json.dumps(watcher.compile(spec_file)).encode() + b'\n')
+
+        if os.path.exists(socket_path):
+            os.unlink(socket_path)
+        server = ThreadingUnixStreamServer(socket_path, RequestHandler)
+        # Clients still connected at shutdown don't keep the process alive
+        server.daemon_threads = True
+        Thread(target=server.serve_forever, name='WatchServer', daemon=True).start()
+        return server
+
+
+def report(result):
+    """
+    Prints the result of compiling a spec file
+
+    :param result: The result
+    """
+    if result['success']:
+        print(f'OK {result["file"]} in {result["seconds"] * 1000:.1f}ms, {result["files_written"]} files written, '
+              f'{result["skipped_classes"]} unchanged classes skipped')
+    else:
+        print(f'FAILED {result["file"]}: {result["error"]}')
+
+
+def main():
+    argument_parser = ArgumentParser(description='Regenerates spec files as they change')
+    argument_parser.add_argument('sources', nargs='+', help='Spec files, directories or glob patterns to watch')
+    argument_parser.add_argument('-p', '--pattern', default='*.txt',
+                                 help='The pattern spec files in a directory must match')
+    argument_parser.add_argument('-c', '--cache', default='.codegen-cache.json', help='The build cache manifest')
+    argument_parser.add_argument('-i', '--interval', type=float, default=0.25, help='The seconds between polls')
+    argument_parser.add_argument('-s', '--socket', help='Also accept spec files over this Unix socket')
+    argument_parser.add_argument('--once', action='store_true', help='Regenerate changed spec files once and exit')
+    arguments = argument_parser.parse_args()
+
+    watcher = Watcher(arguments.sources, arguments.pattern, arguments.cache)
+    if arguments.once:
+        for result in watcher.poll():
+            report(result)
+        return
+
+    server = watcher.serve(arguments.socket) if arguments.socket else None
+    try:
+        watcher.watch(arguments.interval)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        if server:
+            server.shutdown()
+            server.server_close()
+            os.unlink(arguments.socket)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,41 @@
+/// <summary>
+/// </summary>
+public class Class0Commented 
+{
+
+	/// <summary>
+	/// </summary>
+	public int value0;
+
+	/// <summary>
+	/// </summary>
+	public const string NAME0 = "Class0Commented";
+
+	/// <summary>
+	/// </summary>
+	public Class0Commented(int value0)
+	{
+
+	}
+
+	/// <summary>
+	/// </summary>
+	public int GetValue0()
+	{
+		return 0;
+	}
+
+	/// <summary>
+	/// </summary>
+	public void SetValue0(int value)
+	{
+
+	}
+
+	/// <summary>
+	/// </summary>
+	public string describe0(int first, string second)
+	{
+		return null;
+	}
+}
\ No newline at end of file
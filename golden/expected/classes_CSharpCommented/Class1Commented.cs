@@ -0,0 +1,41 @@
+/// <summary>
+/// </summary>
+public class Class1Commented 
+{
+
+	/// <summary>
+	/// </summary>
+	public int value1;
+
+	/// <summary>
+	/// </summary>
+	public const string NAME1 = "Class1Commented";
+
+	/// <summary>
+	/// </summary>
+	public Class1Commented(int value1)
+	{
+
+	}
+
+	/// <summary>
+	/// </summary>
+	public int GetValue1()
+	{
+		return 0;
+	}
+
+	/// <summary>
+	/// </summary>
+	public void SetValue1(int value)
+	{
+
+	}
+
+	/// <summary>
+	/// </summary>
+	public string describe1(int first, string second)
+	{
+		return null;
+	}
+}
\ No newline at end of file
@@ -0,0 +1,41 @@
+/// <summary>
+/// </summary>
+public class Class2Commented 
+{
+
+	/// <summary>
+	/// </summary>
+	public int value2;
+
+	/// <summary>
+	/// </summary>
+	public const string NAME2 = "Class2Commented";
+
+	/// <summary>
+	/// </summary>
+	public Class2Commented(int value2)
+	{
+
+	}
+
+	/// <summary>
+	/// </summary>
+	public int GetValue2()
+	{
+		return 0;
+	}
+
+	/// <summary>
+	/// </summary>
+	public void SetValue2(int value)
+	{
+
+	}
+
+	/// <summary>
+	/// </summary>
+	public string describe2(int first, string second)
+	{
+		return null;
+	}
+}
\ No newline at end of file
@@ -0,0 +1,41 @@
+/// <summary>
+/// </summary>
+public class Class3Commented 
+{
+
+	/// <summary>
+	/// </summary>
+	public int value3;
+
+	/// <summary>
+	/// </summary>
+	public const string NAME3 = "Class3Commented";
+
+	/// <summary>
+	/// </summary>
+	public Class3Commented(int value3)
+	{
+
+	}
+
+	/// <summary>
+	/// </summary>
+	public int GetValue3()
+	{
+		return 0;
+	}
+
+	/// <summary>
+	/// </summary>
+	public void SetValue3(int value)
+	{
+
+	}
+
+	/// <summary>
+	/// </summary>
+	public string describe3(int first, string second)
+	{
+		return null;
+	}
+}
\ No newline at end of file
@@ -0,0 +1,25 @@
+public class Class0Plain 
+{
+	public int value0;
+	public const string NAME0 = "Class0Plain";
+
+	public Class0Plain(int value0)
+	{
+
+	}
+
+	public int GetValue0()
+	{
+		return 0;
+	}
+
+	public void SetValue0(int value)
+	{
+
+	}
+
+	public string describe0(int first, string second)
+	{
+		return null;
+	}
+}
\ No newline at end of file
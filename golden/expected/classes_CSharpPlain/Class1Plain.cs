@@ -0,0 +1,25 @@
+public class Class1Plain 
+{
+	public int value1;
+	public const string NAME1 = "Class1Plain";
+
+	public Class1Plain(int value1)
+	{
+
+	}
+
+	public int GetValue1()
+	{
+		return 0;
+	}
+
+	public void SetValue1(int value)
+	{
+
+	}
+
+	public string describe1(int first, string second)
+	{
+		return null;
+	}
+}
\ No newline at end of file
@@ -0,0 +1,25 @@
+public class Class2Plain 
+{
+	public int value2;
+	public const string NAME2 = "Class2Plain";
+
+	public Class2Plain(int value2)
+	{
+
+	}
+
+	public int GetValue2()
+	{
+		return 0;
+	}
+
+	public void SetValue2(int value)
+	{
+
+	}
+
+	public string describe2(int first, string second)
+	{
+		return null;
+	}
+}
\ No newline at end of file
@@ -0,0 +1,25 @@
+public class Class3Plain 
+{
+	public int value3;
+	public const string NAME3 = "Class3Plain";
+
+	public Class3Plain(int value3)
+	{
+
+	}
+
+	public int GetValue3()
+	{
+		return 0;
+	}
+
+	public void SetValue3(int value)
+	{
+
+	}
+
+	public string describe3(int first, string second)
+	{
+		return null;
+	}
+}
\ No newline at end of file
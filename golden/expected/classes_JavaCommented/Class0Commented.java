@@ -0,0 +1,48 @@
+/**
+ *
+ */
+public class Class0Commented 
+{
+
+	/**
+	 *
+	 */
+	public int value0;
+
+	/**
+	 *
+	 */
+	public static final String NAME0 = "Class0Commented";
+
+	/**
+	 *
+	 */
+	public Class0Commented(int value0)
+	{
+
+	}
+
+	/**
+	 *
+	 */
+	public int getValue0()
+	{
+		return 0;
+	}
+
+	/**
+	 *
+	 */
+	public void setValue0(int value)
+	{
+
+	}
+
+	/**
+	 *
+	 */
+	public String describe0(int first, String second)
+	{
+		return null;
+	}
+}
\ No newline at end of file
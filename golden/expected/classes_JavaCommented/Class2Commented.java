@@ -0,0 +1,48 @@
+/**
+ *
+ */
+public class Class2Commented 
+{
+
+	/**
+	 *
+	 */
+	public int value2;
+
+	/**
+	 *
+	 */
+	public static final String NAME2 = "Class2Commented";
+
+	/**
+	 *
+	 */
+	public Class2Commented(int value2)
+	{
+
+	}
+
+	/**
+	 *
+	 */
+	public int getValue2()
+	{
+		return 0;
+	}
+
+	/**
+	 *
+	 */
+	public void setValue2(int value)
+	{
+
+	}
+
+	/**
+	 *
+	 */
+	public String describe2(int first, String second)
+	{
+		return null;
+	}
+}
\ No newline at end of file
@@ -0,0 +1,48 @@
+/**
+ *
+ */
+public class Class3Commented 
+{
+
+	/**
+	 *
+	 */
+	public int value3;
+
+	/**
+	 *
+	 */
+	public static final String NAME3 = "Class3Commented";
+
+	/**
+	 *
+	 */
+	public Class3Commented(int value3)
+	{
+
+	}
+
+	/**
+	 *
+	 */
+	public int getValue3()
+	{
+		return 0;
+	}
+
+	/**
+	 *
+	 */
+	public void setValue3(int value)
+	{
+
+	}
+
+	/**
+	 *
+	 */
+	public String describe3(int first, String second)
+	{
+		return null;
+	}
+}
\ No newline at end of file
@@ -0,0 +1,25 @@
+public class Class1Plain 
+{
+	public int value1;
+	public static final String NAME1 = "Class1Plain";
+
+	public Class1Plain(int value1)
+	{
+
+	}
+
+	public int getValue1()
+	{
+		return 0;
+	}
+
+	public void setValue1(int value)
+	{
+
+	}
+
+	public String describe1(int first, String second)
+	{
+		return null;
+	}
+}
\ No newline at end of file
@@ -0,0 +1,25 @@
+public class Class3Plain 
+{
+	public int value3;
+	public static final String NAME3 = "Class3Plain";
+
+	public Class3Plain(int value3)
+	{
+
+	}
+
+	public int getValue3()
+	{
+		return 0;
+	}
+
+	public void setValue3(int value)
+	{
+
+	}
+
+	public String describe3(int first, String second)
+	{
+		return null;
+	}
+}
\ No newline at end of file
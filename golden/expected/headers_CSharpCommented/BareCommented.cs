@@ -0,0 +1,5 @@
+/// <summary>
+/// </summary>
+public class BareCommented 
+{
+}
\ No newline at end of file
@@ -0,0 +1,5 @@
+/// <summary>
+/// </summary>
+public class ExtendsCommented : Base 
+{
+}
\ No newline at end of file
@@ -0,0 +1,5 @@
+/// <summary>
+/// </summary>
+public class ExtendsImplementsCommented : Base, First, Second
+{
+}
\ No newline at end of file
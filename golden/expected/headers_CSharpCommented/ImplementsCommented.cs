@@ -0,0 +1,5 @@
+/// <summary>
+/// </summary>
+public class ImplementsCommented : First
+{
+}
\ No newline at end of file
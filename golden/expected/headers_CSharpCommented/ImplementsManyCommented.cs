@@ -0,0 +1,5 @@
+/// <summary>
+/// </summary>
+public class ImplementsManyCommented : First, Second, Third
+{
+}
\ No newline at end of file
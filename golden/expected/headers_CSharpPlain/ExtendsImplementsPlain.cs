@@ -0,0 +1,3 @@
+public class ExtendsImplementsPlain : Base, First, Second
+{
+}
\ No newline at end of file
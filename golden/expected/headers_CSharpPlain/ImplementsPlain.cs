@@ -0,0 +1,3 @@
+public class ImplementsPlain : First
+{
+}
\ No newline at end of file
@@ -0,0 +1,6 @@
+/**
+ *
+ */
+public class BareCommented 
+{
+}
\ No newline at end of file
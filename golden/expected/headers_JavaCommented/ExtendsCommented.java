@@ -0,0 +1,6 @@
+/**
+ *
+ */
+public class ExtendsCommented extends Base 
+{
+}
\ No newline at end of file
@@ -0,0 +1,6 @@
+/**
+ *
+ */
+public class ExtendsImplementsCommented extends Base implements First, Second
+{
+}
\ No newline at end of file
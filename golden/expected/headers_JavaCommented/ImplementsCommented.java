@@ -0,0 +1,6 @@
+/**
+ *
+ */
+public class ImplementsCommented implements First
+{
+}
\ No newline at end of file
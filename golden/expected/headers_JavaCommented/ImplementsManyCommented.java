@@ -0,0 +1,6 @@
+/**
+ *
+ */
+public class ImplementsManyCommented implements First, Second, Third
+{
+}
\ No newline at end of file
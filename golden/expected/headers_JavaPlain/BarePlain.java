@@ -0,0 +1,3 @@
+public class BarePlain 
+{
+}
\ No newline at end of file
@@ -0,0 +1,3 @@
+public class ExtendsImplementsPlain extends Base implements First, Second
+{
+}
\ No newline at end of file
@@ -0,0 +1,3 @@
+public class ExtendsPlain extends Base 
+{
+}
\ No newline at end of file
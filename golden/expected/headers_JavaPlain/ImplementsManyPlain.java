@@ -0,0 +1,3 @@
+public class ImplementsManyPlain implements First, Second, Third
+{
+}
\ No newline at end of file
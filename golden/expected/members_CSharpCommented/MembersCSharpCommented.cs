@@ -0,0 +1,1279 @@
+/// <summary>
+/// </summary>
+public class MembersCSharpCommented : Base, First, Second
+{
+
+	/// <summary>
+	/// </summary>
+	public byte byteplain;
+
+	/// <summary>
+	/// </summary>
+	public byte byteg;
+
+	/// <summary>
+	/// </summary>
+	public byte bytes;
+
+	/// <summary>
+	/// </summary>
+	public byte bytegs;
+
+	/// <summary>
+	/// </summary>
+	public byte bytesg;
+
+	/// <summary>
+	/// </summary>
+	public const byte BYTE_CONSTANT = 1;
+
+	/// <summary>
+	/// </summary>
+	public short shortplain;
+
+	/// <summary>
+	/// </summary>
+	public short shortg;
+
+	/// <summary>
+	/// </summary>
+	public short shorts;
+
+	/// <summary>
+	/// </summary>
+	public short shortgs;
+
+	/// <summary>
+	/// </summary>
+	public short shortsg;
+
+	/// <summary>
+	/// </summary>
+	public const short SHORT_CONSTANT = 2;
+
+	/// <summary>
+	/// </summary>
+	public int intplain;
+
+	/// <summary>
+	/// </summary>
+	public int intg;
+
+	/// <summary>
+	/// </summary>
+	public int ints;
+
+	/// <summary>
+	/// </summary>
+	public int intgs;
+
+	/// <summary>
+	/// </summary>
+	public int intsg;
+
+	/// <summary>
+	/// </summary>
+	public const int INT_CONSTANT = 3;
+
+	/// <summary>
+	/// </summary>
+	public long longplain;
+
+	/// <summary>
+	/// </summary>
+	public long longg;
+
+	/// <summary>
+	/// </summary>
+	public long longs;
+
+	/// <summary>
+	/// </summary>
+	public long longgs;
+
+	/// <summary>
+	/// </summary>
+	public long longsg;
+
+	/// <summary>
+	/// </summary>
+	public const long LONG_CONSTANT = 4L;
+
+	/// <summary>
+	/// </summary>
+	public float floatplain;
+
+	/// <summary>
+	/// </summary>
+	public float floatg;
+
+	/// <summary>
+	/// </summary>
+	public float floats;
+
+	/// <summary>
+	/// </summary>
+	public float floatgs;
+
+	/// <summary>
+	/// </summary>
+	public float floatsg;
+
+	/// <summary>
+	/// </summary>
+	public const float FLOAT_CONSTANT = 5.0f;
+
+	/// <summary>
+	/// </summary>
+	public double doubleplain;
+
+	/// <summary>
+	/// </summary>
+	public double doubleg;
+
+	/// <summary>
+	/// </summary>
+	public double doubles;
+
+	/// <summary>
+	/// </summary>
+	public double doublegs;
+
+	/// <summary>
+	/// </summary>
+	public double doublesg;
+
+	/// <summary>
+	/// </summary>
+	public const double DOUBLE_CONSTANT = 6.0;
+
+	/// <summary>
+	/// </summary>
+	public boolean booleanplain;
+
+	/// <summary>
+	/// </summary>
+	public boolean booleang;
+
+	/// <summary>
+	/// </summary>
+	public boolean booleans;
+
+	/// <summary>
+	/// </summary>
+	public boolean booleangs;
+
+	/// <summary>
+	/// </summary>
+	public boolean booleansg;
+
+	/// <summary>
+	/// </summary>
+	public const boolean BOOLEAN_CONSTANT = true;
+
+	/// <summary>
+	/// </summary>
+	public bool boolplain;
+
+	/// <summary>
+	/// </summary>
+	public bool boolg;
+
+	/// <summary>
+	/// </summary>
+	public bool bools;
+
+	/// <summary>
+	/// </summary>
+	public bool boolgs;
+
+	/// <summary>
+	/// </summary>
+	public bool boolsg;
+
+	/// <summary>
+	/// </summary>
+	public const bool BOOL_CONSTANT = false;
+
+	/// <summary>
+	/// </summary>
+	public char charplain;
+
+	/// <summary>
+	/// </summary>
+	public char charg;
+
+	/// <summary>
+	/// </summary>
+	public char chars;
+
+	/// <summary>
+	/// </summary>
+	public char chargs;
+
+	/// <summary>
+	/// </summary>
+	public char charsg;
+
+	/// <summary>
+	/// </summary>
+	public const char CHAR_CONSTANT = 'c';
+
+	/// <summary>
+	/// </summary>
+	public string strplain;
+
+	/// <summary>
+	/// </summary>
+	public string strg;
+
+	/// <summary>
+	/// </summary>
+	public string strs;
+
+	/// <summary>
+	/// </summary>
+	public string strgs;
+
+	/// <summary>
+	/// </summary>
+	public string strsg;
+
+	/// <summary>
+	/// </summary>
+	public const string STR_CONSTANT = "text";
+
+	/// <summary>
+	/// </summary>
+	public String stringplain;
+
+	/// <summary>
+	/// </summary>
+	public String stringg;
+
+	/// <summary>
+	/// </summary>
+	public String strings;
+
+	/// <summary>
+	/// </summary>
+	public String stringgs;
+
+	/// <summary>
+	/// </summary>
+	public String stringsg;
+
+	/// <summary>
+	/// </summary>
+	public const String STRING_CONSTANT = "text";
+
+	/// <summary>
+	/// </summary>
+	public object objectplain;
+
+	/// <summary>
+	/// </summary>
+	public object objectg;
+
+	/// <summary>
+	/// </summary>
+	public object objects;
+
+	/// <summary>
+	/// </summary>
+	public object objectgs;
+
+	/// <summary>
+	/// </summary>
+	public object objectsg;
+
+	/// <summary>
+	/// </summary>
+	public const object OBJECT_CONSTANT = null;
+
+	/// <summary>
+	/// </summary>
+	public int integerplain;
+
+	/// <summary>
+	/// </summary>
+	public int integerg;
+
+	/// <summary>
+	/// </summary>
+	public int integers;
+
+	/// <summary>
+	/// </summary>
+	public int integergs;
+
+	/// <summary>
+	/// </summary>
+	public int integersg;
+
+	/// <summary>
+	/// </summary>
+	public const int INTEGER_CONSTANT = 7;
+
+	/// <summary>
+	/// </summary>
+	public Custom customplain;
+
+	/// <summary>
+	/// </summary>
+	public Custom customg;
+
+	/// <summary>
+	/// </summary>
+	public Custom customs;
+
+	/// <summary>
+	/// </summary>
+	public Custom customgs;
+
+	/// <summary>
+	/// </summary>
+	public Custom customsg;
+
+	/// <summary>
+	/// </summary>
+	public const Custom CUSTOM_CONSTANT = null;
+
+	/// <summary>
+	/// </summary>
+	public MembersCSharpCommented()
+	{
+
+	}
+
+	/// <summary>
+	/// </summary>
+	public MembersCSharpCommented(byte byteArgument, short shortArgument, int intArgument, long longArgument, float floatArgument, double doubleArgument, boolean booleanArgument, bool boolArgument, char charArgument, string strArgument, String stringArgument, object objectArgument, int integerArgument, Custom customArgument)
+	{
+
+	}
+
+	/// <summary>
+	/// </summary>
+	public byte GetByteg()
+	{
+		return 0;
+	}
+
+	/// <summary>
+	/// </summary>
+	public void SetBytes(byte value)
+	{
+
+	}
+
+	/// <summary>
+	/// </summary>
+	public byte GetBytegs()
+	{
+		return 0;
+	}
+
+	/// <summary>
+	/// </summary>
+	public void SetBytegs(byte value)
+	{
+
+	}
+
+	/// <summary>
+	/// </summary>
+	public byte GetBytesg()
+	{
+		return 0;
+	}
+
+	/// <summary>
+	/// </summary>
+	public void SetBytesg(byte value)
+	{
+
+	}
+
+	/// <summary>
+	/// </summary>
+	public short GetShortg()
+	{
+		return 0;
+	}
+
+	/// <summary>
+	/// </summary>
+	public void SetShorts(short value)
+	{
+
+	}
+
+	/// <summary>
+	/// </summary>
+	public short GetShortgs()
+	{
+		return 0;
+	}
+
+	/// <summary>
+	/// </summary>
+	public void SetShortgs(short value)
+	{
+
+	}
+
+	/// <summary>
+	/// </summary>
+	public short GetShortsg()
+	{
+		return 0;
+	}
+
+	/// <summary>
+	/// </summary>
+	public void SetShortsg(short value)
+	{
+
+	}
+
+	/// <summary>
+	/// </summary>
+	public int GetIntg()
+	{
+		return 0;
+	}
+
+	/// <summary>
+	/// </summary>
+	public void SetInts(int value)
+	{
+
+	}
+
+	/// <summary>
+	/// </summary>
+	public int GetIntgs()
+	{
+		return 0;
+	}
+
+	/// <summary>
+	/// </summary>
+	public void SetIntgs(int value)
+	{
+
+	}
+
+	/// <summary>
+	/// </summary>
+	public int GetIntsg()
+	{
+		return 0;
+	}
+
+	/// <summary>
+	/// </summary>
+	public void SetIntsg(int value)
+	{
+
+	}
+
+	/// <summary>
+	/// </summary>
+	public long GetLongg()
+	{
+		return 0;
+	}
+
+	/// <summary>
+	/// </summary>
+	public void SetLongs(long value)
+	{
+
+	}
+
+	/// <summary>
+	/// </summary>
+	public long GetLonggs()
+	{
+		return 0;
+	}
+
+	/// <summary>
+	/// </summary>
+	public void SetLonggs(long value)
+	{
+
+	}
+
+	/// <summary>
+	/// </summary>
+	public long GetLongsg()
+	{
+		return 0;
+	}
+
+	/// <summary>
+	/// </summary>
+	public void SetLongsg(long value)
+	{
+
+	}
+
+	/// <summary>
+	/// </summary>
+	public float GetFloatg()
+	{
+		return 0;
+	}
+
+	/// <summary>
+	/// </summary>
+	public void SetFloats(float value)
+	{
+
+	}
+
+	/// <summary>
+	/// </summary>
+	public float GetFloatgs()
+	{
+		return 0;
+	}
+
+	/// <summary>
+	/// </summary>
+	public void SetFloatgs(float value)
+	{
+
+	}
+
+	/// <summary>
+	/// </summary>
+	public float GetFloatsg()
+	{
+		return 0;
+	}
+
+	/// <summary>
+	/// </summary>
+	public void SetFloatsg(float value)
+	{
+
+	}
+
+	/// <summary>
+	/// </summary>
+	public double GetDoubleg()
+	{
+		return 0;
+	}
+
+	/// <summary>
+	/// </summary>
+	public void SetDoubles(double value)
+	{
+
+	}
+
+	/// <summary>
+	/// </summary>
+	public double GetDoublegs()
+	{
+		return 0;
+	}
+
+	/// <summary>
+	/// </summary>
+	public void SetDoublegs(double value)
+	{
+
+	}
+
+	/// <summary>
+	/// </summary>
+	public double GetDoublesg()
+	{
+		return 0;
+	}
+
+	/// <summary>
+	/// </summary>
+	public void SetDoublesg(double value)
+	{
+
+	}
+
+	/// <summary>
+	/// </summary>
+	public boolean GetBooleang()
+	{
+		return null;
+	}
+
+	/// <summary>
+	/// </summary>
+	public void SetBooleans(boolean value)
+	{
+
+	}
+
+	/// <summary>
+	/// </summary>
+	public boolean GetBooleangs()
+	{
+		return null;
+	}
+
+	/// <summary>
+	/// </summary>
+	public void SetBooleangs(boolean value)
+	{
+
+	}
+
+	/// <summary>
+	/// </summary>
+	public boolean GetBooleansg()
+	{
+		return null;
+	}
+
+	/// <summary>
+	/// </summary>
+	public void SetBooleansg(boolean value)
+	{
+
+	}
+
+	/// <summary>
+	/// </summary>
+	public bool GetBoolg()
+	{
+		return false;
+	}
+
+	/// <summary>
+	/// </summary>
+	public void SetBools(bool value)
+	{
+
+	}
+
+	/// <summary>
+	/// </summary>
+	public bool GetBoolgs()
+	{
+		return false;
+	}
+
+	/// <summary>
+	/// </summary>
+	public void SetBoolgs(bool value)
+	{
+
+	}
+
+	/// <summary>
+	/// </summary>
+	public bool GetBoolsg()
+	{
+		return false;
+	}
+
+	/// <summary>
+	/// </summary>
+	public void SetBoolsg(bool value)
+	{
+
+	}
+
+	/// <summary>
+	/// </summary>
+	public char GetCharg()
+	{
+		return '\0';
+	}
+
+	/// <summary>
+	/// </summary>
+	public void SetChars(char value)
+	{
+
+	}
+
+	/// <summary>
+	/// </summary>
+	public char GetChargs()
+	{
+		return '\0';
+	}
+
+	/// <summary>
+	/// </summary>
+	public void SetChargs(char value)
+	{
+
+	}
+
+	/// <summary>
+	/// </summary>
+	public char GetCharsg()
+	{
+		return '\0';
+	}
+
+	/// <summary>
+	/// </summary>
+	public void SetCharsg(char value)
+	{
+
+	}
+
+	/// <summary>
+	/// </summary>
+	public string GetStrg()
+	{
+		return null;
+	}
+
+	/// <summary>
+	/// </summary>
+	public void SetStrs(string value)
+	{
+
+	}
+
+	/// <summary>
+	/// </summary>
+	public string GetStrgs()
+	{
+		return null;
+	}
+
+	/// <summary>
+	/// </summary>
+	public void SetStrgs(string value)
+	{
+
+	}
+
+	/// <summary>
+	/// </summary>
+	public string GetStrsg()
+	{
+		return null;
+	}
+
+	/// <summary>
+	/// </summary>
+	public void SetStrsg(string value)
+	{
+
+	}
+
+	/// <summary>
+	/// </summary>
+	public String GetStringg()
+	{
+		return null;
+	}
+
+	/// <summary>
+	/// </summary>
+	public void SetStrings(String value)
+	{
+
+	}
+
+	/// <summary>
+	/// </summary>
+	public String GetStringgs()
+	{
+		return null;
+	}
+
+	/// <summary>
+	/// </summary>
+	public void SetStringgs(String value)
+	{
+
+	}
+
+	/// <summary>
+	/// </summary>
+	public String GetStringsg()
+	{
+		return null;
+	}
+
+	/// <summary>
+	/// </summary>
+	public void SetStringsg(String value)
+	{
+
+	}
+
+	/// <summary>
+	/// </summary>
+	public object GetObjectg()
+	{
+		return null;
+	}
+
+	/// <summary>
+	/// </summary>
+	public void SetObjects(object value)
+	{
+
+	}
+
+	/// <summary>
+	/// </summary>
+	public object GetObjectgs()
+	{
+		return null;
+	}
+
+	/// <summary>
+	/// </summary>
+	public void SetObjectgs(object value)
+	{
+
+	}
+
+	/// <summary>
+	/// </summary>
+	public object GetObjectsg()
+	{
+		return null;
+	}
+
+	/// <summary>
+	/// </summary>
+	public void SetObjectsg(object value)
+	{
+
+	}
+
+	/// <summary>
+	/// </summary>
+	public int GetIntegerg()
+	{
+		return 0;
+	}
+
+	/// <summary>
+	/// </summary>
+	public void SetIntegers(int value)
+	{
+
+	}
+
+	/// <summary>
+	/// </summary>
+	public int GetIntegergs()
+	{
+		return 0;
+	}
+
+	/// <summary>
+	/// </summary>
+	public void SetIntegergs(int value)
+	{
+
+	}
+
+	/// <summary>
+	/// </summary>
+	public int GetIntegersg()
+	{
+		return 0;
+	}
+
+	/// <summary>
+	/// </summary>
+	public void SetIntegersg(int value)
+	{
+
+	}
+
+	/// <summary>
+	/// </summary>
+	public Custom GetCustomg()
+	{
+		return null;
+	}
+
+	/// <summary>
+	/// </summary>
+	public void SetCustoms(Custom value)
+	{
+
+	}
+
+	/// <summary>
+	/// </summary>
+	public Custom GetCustomgs()
+	{
+		return null;
+	}
+
+	/// <summary>
+	/// </summary>
+	public void SetCustomgs(Custom value)
+	{
+
+	}
+
+	/// <summary>
+	/// </summary>
+	public Custom GetCustomsg()
+	{
+		return null;
+	}
+
+	/// <summary>
+	/// </summary>
+	public void SetCustomsg(Custom value)
+	{
+
+	}
+
+	/// <summary>
+	/// </summary>
+	public byte pubByte()
+	{
+		return 0;
+	}
+
+	/// <summary>
+	/// </summary>
+	public short pubShort()
+	{
+		return 0;
+	}
+
+	/// <summary>
+	/// </summary>
+	public int pubInt()
+	{
+		return 0;
+	}
+
+	/// <summary>
+	/// </summary>
+	public long pubLong()
+	{
+		return 0;
+	}
+
+	/// <summary>
+	/// </summary>
+	public float pubFloat()
+	{
+		return 0;
+	}
+
+	/// <summary>
+	/// </summary>
+	public double pubDouble()
+	{
+		return 0;
+	}
+
+	/// <summary>
+	/// </summary>
+	public boolean pubBoolean()
+	{
+		return null;
+	}
+
+	/// <summary>
+	/// </summary>
+	public bool pubBool()
+	{
+		return false;
+	}
+
+	/// <summary>
+	/// </summary>
+	public char pubChar()
+	{
+		return '\0';
+	}
+
+	/// <summary>
+	/// </summary>
+	public string pubStr()
+	{
+		return null;
+	}
+
+	/// <summary>
+	/// </summary>
+	public String pubString()
+	{
+		return null;
+	}
+
+	/// <summary>
+	/// </summary>
+	public object pubObject()
+	{
+		return null;
+	}
+
+	/// <summary>
+	/// </summary>
+	public int pubInteger()
+	{
+		return 0;
+	}
+
+	/// <summary>
+	/// </summary>
+	public Custom pubCustom()
+	{
+		return null;
+	}
+
+	/// <summary>
+	/// </summary>
+	public void pubVoid()
+	{
+
+	}
+
+	/// <summary>
+	/// </summary>
+	public int pubParameters(int first, string second, Custom third)
+	{
+		return 0;
+	}
+
+	/// <summary>
+	/// </summary>
+	private byte priByte()
+	{
+		return 0;
+	}
+
+	/// <summary>
+	/// </summary>
+	private short priShort()
+	{
+		return 0;
+	}
+
+	/// <summary>
+	/// </summary>
+	private int priInt()
+	{
+		return 0;
+	}
+
+	/// <summary>
+	/// </summary>
+	private long priLong()
+	{
+		return 0;
+	}
+
+	/// <summary>
+	/// </summary>
+	private float priFloat()
+	{
+		return 0;
+	}
+
+	/// <summary>
+	/// </summary>
+	private double priDouble()
+	{
+		return 0;
+	}
+
+	/// <summary>
+	/// </summary>
+	private boolean priBoolean()
+	{
+		return null;
+	}
+
+	/// <summary>
+	/// </summary>
+	private bool priBool()
+	{
+		return false;
+	}
+
+	/// <summary>
+	/// </summary>
+	private char priChar()
+	{
+		return '\0';
+	}
+
+	/// <summary>
+	/// </summary>
+	private string priStr()
+	{
+		return null;
+	}
+
+	/// <summary>
+	/// </summary>
+	private String priString()
+	{
+		return null;
+	}
+
+	/// <summary>
+	/// </summary>
+	private object priObject()
+	{
+		return null;
+	}
+
+	/// <summary>
+	/// </summary>
+	private int priInteger()
+	{
+		return 0;
+	}
+
+	/// <summary>
+	/// </summary>
+	private Custom priCustom()
+	{
+		return null;
+	}
+
+	/// <summary>
+	/// </summary>
+	private void priVoid()
+	{
+
+	}
+
+	/// <summary>
+	/// </summary>
+	private int priParameters(int first, string second, Custom third)
+	{
+		return 0;
+	}
+
+	/// <summary>
+	/// </summary>
+	protected byte proByte()
+	{
+		return 0;
+	}
+
+	/// <summary>
+	/// </summary>
+	protected short proShort()
+	{
+		return 0;
+	}
+
+	/// <summary>
+	/// </summary>
+	protected int proInt()
+	{
+		return 0;
+	}
+
+	/// <summary>
+	/// </summary>
+	protected long proLong()
+	{
+		return 0;
+	}
+
+	/// <summary>
+	/// </summary>
+	protected float proFloat()
+	{
+		return 0;
+	}
+
+	/// <summary>
+	/// </summary>
+	protected double proDouble()
+	{
+		return 0;
+	}
+
+	/// <summary>
+	/// </summary>
+	protected boolean proBoolean()
+	{
+		return null;
+	}
+
+	/// <summary>
+	/// </summary>
+	protected bool proBool()
+	{
+		return false;
+	}
+
+	/// <summary>
+	/// </summary>
+	protected char proChar()
+	{
+		return '\0';
+	}
+
+	/// <summary>
+	/// </summary>
+	protected string proStr()
+	{
+		return null;
+	}
+
+	/// <summary>
+	/// </summary>
+	protected String proString()
+	{
+		return null;
+	}
+
+	/// <summary>
+	/// </summary>
+	protected object proObject()
+	{
+		return null;
+	}
+
+	/// <summary>
+	/// </summary>
+	protected int proInteger()
+	{
+		return 0;
+	}
+
+	/// <summary>
+	/// </summary>
+	protected Custom proCustom()
+	{
+		return null;
+	}
+
+	/// <summary>
+	/// </summary>
+	protected void proVoid()
+	{
+
+	}
+
+	/// <summary>
+	/// </summary>
+	protected int proParameters(int first, string second, Custom third)
+	{
+		return 0;
+	}
+}
\ No newline at end of file
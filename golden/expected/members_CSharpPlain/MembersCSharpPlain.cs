@@ -0,0 +1,757 @@
+public class MembersCSharpPlain : Base, First, Second
+{
+	public byte byteplain;
+	public byte byteg;
+	public byte bytes;
+	public byte bytegs;
+	public byte bytesg;
+	public const byte BYTE_CONSTANT = 1;
+	public short shortplain;
+	public short shortg;
+	public short shorts;
+	public short shortgs;
+	public short shortsg;
+	public const short SHORT_CONSTANT = 2;
+	public int intplain;
+	public int intg;
+	public int ints;
+	public int intgs;
+	public int intsg;
+	public const int INT_CONSTANT = 3;
+	public long longplain;
+	public long longg;
+	public long longs;
+	public long longgs;
+	public long longsg;
+	public const long LONG_CONSTANT = 4L;
+	public float floatplain;
+	public float floatg;
+	public float floats;
+	public float floatgs;
+	public float floatsg;
+	public const float FLOAT_CONSTANT = 5.0f;
+	public double doubleplain;
+	public double doubleg;
+	public double doubles;
+	public double doublegs;
+	public double doublesg;
+	public const double DOUBLE_CONSTANT = 6.0;
+	public boolean booleanplain;
+	public boolean booleang;
+	public boolean booleans;
+	public boolean booleangs;
+	public boolean booleansg;
+	public const boolean BOOLEAN_CONSTANT = true;
+	public bool boolplain;
+	public bool boolg;
+	public bool bools;
+	public bool boolgs;
+	public bool boolsg;
+	public const bool BOOL_CONSTANT = false;
+	public char charplain;
+	public char charg;
+	public char chars;
+	public char chargs;
+	public char charsg;
+	public const char CHAR_CONSTANT = 'c';
+	public string strplain;
+	public string strg;
+	public string strs;
+	public string strgs;
+	public string strsg;
+	public const string STR_CONSTANT = "text";
+	public String stringplain;
+	public String stringg;
+	public String strings;
+	public String stringgs;
+	public String stringsg;
+	public const String STRING_CONSTANT = "text";
+	public object objectplain;
+	public object objectg;
+	public object objects;
+	public object objectgs;
+	public object objectsg;
+	public const object OBJECT_CONSTANT = null;
+	public int integerplain;
+	public int integerg;
+	public int integers;
+	public int integergs;
+	public int integersg;
+	public const int INTEGER_CONSTANT = 7;
+	public Custom customplain;
+	public Custom customg;
+	public Custom customs;
+	public Custom customgs;
+	public Custom customsg;
+	public const Custom CUSTOM_CONSTANT = null;
+
+	public MembersCSharpPlain()
+	{
+
+	}
+
+	public MembersCSharpPlain(byte byteArgument, short shortArgument, int intArgument, long longArgument, float floatArgument, double doubleArgument, boolean booleanArgument, bool boolArgument, char charArgument, string strArgument, String stringArgument, object objectArgument, int integerArgument, Custom customArgument)
+	{
+
+	}
+
+	public byte GetByteg()
+	{
+		return 0;
+	}
+
+	public void SetBytes(byte value)
+	{
+
+	}
+
+	public byte GetBytegs()
+	{
+		return 0;
+	}
+
+	public void SetBytegs(byte value)
+	{
+
+	}
+
+	public byte GetBytesg()
+	{
+		return 0;
+	}
+
+	public void SetBytesg(byte value)
+	{
+
+	}
+
+	public short GetShortg()
+	{
+		return 0;
+	}
+
+	public void SetShorts(short value)
+	{
+
+	}
+
+	public short GetShortgs()
+	{
+		return 0;
+	}
+
+	public void SetShortgs(short value)
+	{
+
+	}
+
+	public short GetShortsg()
+	{
+		return 0;
+	}
+
+	public void SetShortsg(short value)
+	{
+
+	}
+
+	public int GetIntg()
+	{
+		return 0;
+	}
+
+	public void SetInts(int value)
+	{
+
+	}
+
+	public int GetIntgs()
+	{
+		return 0;
+	}
+
+	public void SetIntgs(int value)
+	{
+
+	}
+
+	public int GetIntsg()
+	{
+		return 0;
+	}
+
+	public void SetIntsg(int value)
+	{
+
+	}
+
+	public long GetLongg()
+	{
+		return 0;
+	}
+
+	public void SetLongs(long value)
+	{
+
+	}
+
+	public long GetLonggs()
+	{
+		return 0;
+	}
+
+	public void SetLonggs(long value)
+	{
+
+	}
+
+	public long GetLongsg()
+	{
+		return 0;
+	}
+
+	public void SetLongsg(long value)
+	{
+
+	}
+
+	public float GetFloatg()
+	{
+		return 0;
+	}
+
+	public void SetFloats(float value)
+	{
+
+	}
+
+	public float GetFloatgs()
+	{
+		return 0;
+	}
+
+	public void SetFloatgs(float value)
+	{
+
+	}
+
+	public float GetFloatsg()
+	{
+		return 0;
+	}
+
+	public void SetFloatsg(float value)
+	{
+
+	}
+
+	public double GetDoubleg()
+	{
+		return 0;
+	}
+
+	public void SetDoubles(double value)
+	{
+
+	}
+
+	public double GetDoublegs()
+	{
+		return 0;
+	}
+
+	public void SetDoublegs(double value)
+	{
+
+	}
+
+	public double GetDoublesg()
+	{
+		return 0;
+	}
+
+	public void SetDoublesg(double value)
+	{
+
+	}
+
+	public boolean GetBooleang()
+	{
+		return null;
+	}
+
+	public void SetBooleans(boolean value)
+	{
+
+	}
+
+	public boolean GetBooleangs()
+	{
+		return null;
+	}
+
+	public void SetBooleangs(boolean value)
+	{
+
+	}
+
+	public boolean GetBooleansg()
+	{
+		return null;
+	}
+
+	public void SetBooleansg(boolean value)
+	{
+
+	}
+
+	public bool GetBoolg()
+	{
+		return false;
+	}
+
+	public void SetBools(bool value)
+	{
+
+	}
+
+	public bool GetBoolgs()
+	{
+		return false;
+	}
+
+	public void SetBoolgs(bool value)
+	{
+
+	}
+
+	public bool GetBoolsg()
+	{
+		return false;
+	}
+
+	public void SetBoolsg(bool value)
+	{
+
+	}
+
+	public char GetCharg()
+	{
+		return '\0';
+	}
+
+	public void SetChars(char value)
+	{
+
+	}
+
+	public char GetChargs()
+	{
+		return '\0';
+	}
+
+	public void SetChargs(char value)
+	{
+
+	}
+
+	public char GetCharsg()
+	{
+		return '\0';
+	}
+
+	public void SetCharsg(char value)
+	{
+
+	}
+
+	public string GetStrg()
+	{
+		return null;
+	}
+
+	public void SetStrs(string value)
+	{
+
+	}
+
+	public string GetStrgs()
+	{
+		return null;
+	}
+
+	public void SetStrgs(string value)
+	{
+
+	}
+
+	public string GetStrsg()
+	{
+		return null;
+	}
+
+	public void SetStrsg(string value)
+	{
+
+	}
+
+	public String GetStringg()
+	{
+		return null;
+	}
+
+	public void SetStrings(String value)
+	{
+
+	}
+
+	public String GetStringgs()
+	{
+		return null;
+	}
+
+	public void SetStringgs(String value)
+	{
+
+	}
+
+	public String GetStringsg()
+	{
+		return null;
+	}
+
+	public void SetStringsg(String value)
+	{
+
+	}
+
+	public object GetObjectg()
+	{
+		return null;
+	}
+
+	public void SetObjects(object value)
+	{
+
+	}
+
+	public object GetObjectgs()
+	{
+		return null;
+	}
+
+	public void SetObjectgs(object value)
+	{
+
+	}
+
+	public object GetObjectsg()
+	{
+		return null;
+	}
+
+	public void SetObjectsg(object value)
+	{
+
+	}
+
+	public int GetIntegerg()
+	{
+		return 0;
+	}
+
+	public void SetIntegers(int value)
+	{
+
+	}
+
+	public int GetIntegergs()
+	{
+		return 0;
+	}
+
+	public void SetIntegergs(int value)
+	{
+
+	}
+
+	public int GetIntegersg()
+	{
+		return 0;
+	}
+
+	public void SetIntegersg(int value)
+	{
+
+	}
+
+	public Custom GetCustomg()
+	{
+		return null;
+	}
+
+	public void SetCustoms(Custom value)
+	{
+
+	}
+
+	public Custom GetCustomgs()
+	{
+		return null;
+	}
+
+	public void SetCustomgs(Custom value)
+	{
+
+	}
+
+	public Custom GetCustomsg()
+	{
+		return null;
+	}
+
+	public void SetCustomsg(Custom value)
+	{
+
+	}
+
+	public byte pubByte()
+	{
+		return 0;
+	}
+
+	public short pubShort()
+	{
+		return 0;
+	}
+
+	public int pubInt()
+	{
+		return 0;
+	}
+
+	public long pubLong()
+	{
+		return 0;
+	}
+
+	public float pubFloat()
+	{
+		return 0;
+	}
+
+	public double pubDouble()
+	{
+		return 0;
+	}
+
+	public boolean pubBoolean()
+	{
+		return null;
+	}
+
+	public bool pubBool()
+	{
+		return false;
+	}
+
+	public char pubChar()
+	{
+		return '\0';
+	}
+
+	public string pubStr()
+	{
+		return null;
+	}
+
+	public String pubString()
+	{
+		return null;
+	}
+
+	public object pubObject()
+	{
+		return null;
+	}
+
+	public int pubInteger()
+	{
+		return 0;
+	}
+
+	public Custom pubCustom()
+	{
+		return null;
+	}
+
+	public void pubVoid()
+	{
+
+	}
+
+	public int pubParameters(int first, string second, Custom third)
+	{
+		return 0;
+	}
+
+	private byte priByte()
+	{
+		return 0;
+	}
+
+	private short priShort()
+	{
+		return 0;
+	}
+
+	private int priInt()
+	{
+		return 0;
+	}
+
+	private long priLong()
+	{
+		return 0;
+	}
+
+	private float priFloat()
+	{
+		return 0;
+	}
+
+	private double priDouble()
+	{
+		return 0;
+	}
+
+	private boolean priBoolean()
+	{
+		return null;
+	}
+
+	private bool priBool()
+	{
+		return false;
+	}
+
+	private char priChar()
+	{
+		return '\0';
+	}
+
+	private string priStr()
+	{
+		return null;
+	}
+
+	private String priString()
+	{
+		return null;
+	}
+
+	private object priObject()
+	{
+		return null;
+	}
+
+	private int priInteger()
+	{
+		return 0;
+	}
+
+	private Custom priCustom()
+	{
+		return null;
+	}
+
+	private void priVoid()
+	{
+
+	}
+
+	private int priParameters(int first, string second, Custom third)
+	{
+		return 0;
+	}
+
+	protected byte proByte()
+	{
+		return 0;
+	}
+
+	protected short proShort()
+	{
+		return 0;
+	}
+
+	protected int proInt()
+	{
+		return 0;
+	}
+
+	protected long proLong()
+	{
+		return 0;
+	}
+
+	protected float proFloat()
+	{
+		return 0;
+	}
+
+	protected double proDouble()
+	{
+		return 0;
+	}
+
+	protected boolean proBoolean()
+	{
+		return null;
+	}
+
+	protected bool proBool()
+	{
+		return false;
+	}
+
+	protected char proChar()
+	{
+		return '\0';
+	}
+
+	protected string proStr()
+	{
+		return null;
+	}
+
+	protected String proString()
+	{
+		return null;
+	}
+
+	protected object proObject()
+	{
+		return null;
+	}
+
+	protected int proInteger()
+	{
+		return 0;
+	}
+
+	protected Custom proCustom()
+	{
+		return null;
+	}
+
+	protected void proVoid()
+	{
+
+	}
+
+	protected int proParameters(int first, string second, Custom third)
+	{
+		return 0;
+	}
+}
\ No newline at end of file
@@ -0,0 +1,1498 @@
+/**
+ *
+ */
+public class MembersJavaCommented extends Base implements First, Second
+{
+
+	/**
+	 *
+	 */
+	public byte byteplain;
+
+	/**
+	 *
+	 */
+	public byte byteg;
+
+	/**
+	 *
+	 */
+	public byte bytes;
+
+	/**
+	 *
+	 */
+	public byte bytegs;
+
+	/**
+	 *
+	 */
+	public byte bytesg;
+
+	/**
+	 *
+	 */
+	public static final byte BYTE_CONSTANT = 1;
+
+	/**
+	 *
+	 */
+	public short shortplain;
+
+	/**
+	 *
+	 */
+	public short shortg;
+
+	/**
+	 *
+	 */
+	public short shorts;
+
+	/**
+	 *
+	 */
+	public short shortgs;
+
+	/**
+	 *
+	 */
+	public short shortsg;
+
+	/**
+	 *
+	 */
+	public static final short SHORT_CONSTANT = 2;
+
+	/**
+	 *
+	 */
+	public int intplain;
+
+	/**
+	 *
+	 */
+	public int intg;
+
+	/**
+	 *
+	 */
+	public int ints;
+
+	/**
+	 *
+	 */
+	public int intgs;
+
+	/**
+	 *
+	 */
+	public int intsg;
+
+	/**
+	 *
+	 */
+	public static final int INT_CONSTANT = 3;
+
+	/**
+	 *
+	 */
+	public long longplain;
+
+	/**
+	 *
+	 */
+	public long longg;
+
+	/**
+	 *
+	 */
+	public long longs;
+
+	/**
+	 *
+	 */
+	public long longgs;
+
+	/**
+	 *
+	 */
+	public long longsg;
+
+	/**
+	 *
+	 */
+	public static final long LONG_CONSTANT = 4L;
+
+	/**
+	 *
+	 */
+	public float floatplain;
+
+	/**
+	 *
+	 */
+	public float floatg;
+
+	/**
+	 *
+	 */
+	public float floats;
+
+	/**
+	 *
+	 */
+	public float floatgs;
+
+	/**
+	 *
+	 */
+	public float floatsg;
+
+	/**
+	 *
+	 */
+	public static final float FLOAT_CONSTANT = 5.0f;
+
+	/**
+	 *
+	 */
+	public double doubleplain;
+
+	/**
+	 *
+	 */
+	public double doubleg;
+
+	/**
+	 *
+	 */
+	public double doubles;
+
+	/**
+	 *
+	 */
+	public double doublegs;
+
+	/**
+	 *
+	 */
+	public double doublesg;
+
+	/**
+	 *
+	 */
+	public static final double DOUBLE_CONSTANT = 6.0;
+
+	/**
+	 *
+	 */
+	public boolean booleanplain;
+
+	/**
+	 *
+	 */
+	public boolean booleang;
+
+	/**
+	 *
+	 */
+	public boolean booleans;
+
+	/**
+	 *
+	 */
+	public boolean booleangs;
+
+	/**
+	 *
+	 */
+	public boolean booleansg;
+
+	/**
+	 *
+	 */
+	public static final boolean BOOLEAN_CONSTANT = true;
+
+	/**
+	 *
+	 */
+	public boolean boolplain;
+
+	/**
+	 *
+	 */
+	public boolean boolg;
+
+	/**
+	 *
+	 */
+	public boolean bools;
+
+	/**
+	 *
+	 */
+	public boolean boolgs;
+
+	/**
+	 *
+	 */
+	public boolean boolsg;
+
+	/**
+	 *
+	 */
+	public static final boolean BOOL_CONSTANT = false;
+
+	/**
+	 *
+	 */
+	public char charplain;
+
+	/**
+	 *
+	 */
+	public char charg;
+
+	/**
+	 *
+	 */
+	public char chars;
+
+	/**
+	 *
+	 */
+	public char chargs;
+
+	/**
+	 *
+	 */
+	public char charsg;
+
+	/**
+	 *
+	 */
+	public static final char CHAR_CONSTANT = 'c';
+
+	/**
+	 *
+	 */
+	public String strplain;
+
+	/**
+	 *
+	 */
+	public String strg;
+
+	/**
+	 *
+	 */
+	public String strs;
+
+	/**
+	 *
+	 */
+	public String strgs;
+
+	/**
+	 *
+	 */
+	public String strsg;
+
+	/**
+	 *
+	 */
+	public static final String STR_CONSTANT = "text";
+
+	/**
+	 *
+	 */
+	public String stringplain;
+
+	/**
+	 *
+	 */
+	public String stringg;
+
+	/**
+	 *
+	 */
+	public String strings;
+
+	/**
+	 *
+	 */
+	public String stringgs;
+
+	/**
+	 *
+	 */
+	public String stringsg;
+
+	/**
+	 *
+	 */
+	public static final String STRING_CONSTANT = "text";
+
+	/**
+	 *
+	 */
+	public Object objectplain;
+
+	/**
+	 *
+	 */
+	public Object objectg;
+
+	/**
+	 *
+	 */
+	public Object objects;
+
+	/**
+	 *
+	 */
+	public Object objectgs;
+
+	/**
+	 *
+	 */
+	public Object objectsg;
+
+	/**
+	 *
+	 */
+	public static final Object OBJECT_CONSTANT = null;
+
+	/**
+	 *
+	 */
+	public Integer integerplain;
+
+	/**
+	 *
+	 */
+	public Integer integerg;
+
+	/**
+	 *
+	 */
+	public Integer integers;
+
+	/**
+	 *
+	 */
+	public Integer integergs;
+
+	/**
+	 *
+	 */
+	public Integer integersg;
+
+	/**
+	 *
+	 */
+	public static final Integer INTEGER_CONSTANT = 7;
+
+	/**
+	 *
+	 */
+	public Custom customplain;
+
+	/**
+	 *
+	 */
+	public Custom customg;
+
+	/**
+	 *
+	 */
+	public Custom customs;
+
+	/**
+	 *
+	 */
+	public Custom customgs;
+
+	/**
+	 *
+	 */
+	public Custom customsg;
+
+	/**
+	 *
+	 */
+	public static final Custom CUSTOM_CONSTANT = null;
+
+	/**
+	 *
+	 */
+	public MembersJavaCommented()
+	{
+
+	}
+
+	/**
+	 *
+	 */
+	public MembersJavaCommented(byte byteArgument, short shortArgument, int intArgument, long longArgument, float floatArgument, double doubleArgument, boolean booleanArgument, boolean boolArgument, char charArgument, String strArgument, String stringArgument, Object objectArgument, Integer integerArgument, Custom customArgument)
+	{
+
+	}
+
+	/**
+	 *
+	 */
+	public byte getByteg()
+	{
+		return 0;
+	}
+
+	/**
+	 *
+	 */
+	public void setBytes(byte value)
+	{
+
+	}
+
+	/**
+	 *
+	 */
+	public byte getBytegs()
+	{
+		return 0;
+	}
+
+	/**
+	 *
+	 */
+	public void setBytegs(byte value)
+	{
+
+	}
+
+	/**
+	 *
+	 */
+	public byte getBytesg()
+	{
+		return 0;
+	}
+
+	/**
+	 *
+	 */
+	public void setBytesg(byte value)
+	{
+
+	}
+
+	/**
+	 *
+	 */
+	public short getShortg()
+	{
+		return 0;
+	}
+
+	/**
+	 *
+	 */
+	public void setShorts(short value)
+	{
+
+	}
+
+	/**
+	 *
+	 */
+	public short getShortgs()
+	{
+		return 0;
+	}
+
+	/**
+	 *
+	 */
+	public void setShortgs(short value)
+	{
+
+	}
+
+	/**
+	 *
+	 */
+	public short getShortsg()
+	{
+		return 0;
+	}
+
+	/**
+	 *
+	 */
+	public void setShortsg(short value)
+	{
+
+	}
+
+	/**
+	 *
+	 */
+	public int getIntg()
+	{
+		return 0;
+	}
+
+	/**
+	 *
+	 */
+	public void setInts(int value)
+	{
+
+	}
+
+	/**
+	 *
+	 */
+	public int getIntgs()
+	{
+		return 0;
+	}
+
+	/**
+	 *
+	 */
+	public void setIntgs(int value)
+	{
+
+	}
+
+	/**
+	 *
+	 */
+	public int getIntsg()
+	{
+		return 0;
+	}
+
+	/**
+	 *
+	 */
+	public void setIntsg(int value)
+	{
+
+	}
+
+	/**
+	 *
+	 */
+	public long getLongg()
+	{
+		return 0;
+	}
+
+	/**
+	 *
+	 */
+	public void setLongs(long value)
+	{
+
+	}
+
+	/**
+	 *
+	 */
+	public long getLonggs()
+	{
+		return 0;
+	}
+
+	/**
+	 *
+	 */
+	public void setLonggs(long value)
+	{
+
+	}
+
+	/**
+	 *
+	 */
+	public long getLongsg()
+	{
+		return 0;
+	}
+
+	/**
+	 *
+	 */
+	public void setLongsg(long value)
+	{
+
+	}
+
+	/**
+	 *
+	 */
+	public float getFloatg()
+	{
+		return 0;
+	}
+
+	/**
+	 *
+	 */
+	public void setFloats(float value)
+	{
+
+	}
+
+	/**
+	 *
+	 */
+	public float getFloatgs()
+	{
+		return 0;
+	}
+
+	/**
+	 *
+	 */
+	public void setFloatgs(float value)
+	{
+
+	}
+
+	/**
+	 *
+	 */
+	public float getFloatsg()
+	{
+		return 0;
+	}
+
+	/**
+	 *
+	 */
+	public void setFloatsg(float value)
+	{
+
+	}
+
+	/**
+	 *
+	 */
+	public double getDoubleg()
+	{
+		return 0;
+	}
+
+	/**
+	 *
+	 */
+	public void setDoubles(double value)
+	{
+
+	}
+
+	/**
+	 *
+	 */
+	public double getDoublegs()
+	{
+		return 0;
+	}
+
+	/**
+	 *
+	 */
+	public void setDoublegs(double value)
+	{
+
+	}
+
+	/**
+	 *
+	 */
+	public double getDoublesg()
+	{
+		return 0;
+	}
+
+	/**
+	 *
+	 */
+	public void setDoublesg(double value)
+	{
+
+	}
+
+	/**
+	 *
+	 */
+	public boolean getBooleang()
+	{
+		return false;
+	}
+
+	/**
+	 *
+	 */
+	public void setBooleans(boolean value)
+	{
+
+	}
+
+	/**
+	 *
+	 */
+	public boolean getBooleangs()
+	{
+		return false;
+	}
+
+	/**
+	 *
+	 */
+	public void setBooleangs(boolean value)
+	{
+
+	}
+
+	/**
+	 *
+	 */
+	public boolean getBooleansg()
+	{
+		return false;
+	}
+
+	/**
+	 *
+	 */
+	public void setBooleansg(boolean value)
+	{
+
+	}
+
+	/**
+	 *
+	 */
+	public boolean getBoolg()
+	{
+		return false;
+	}
+
+	/**
+	 *
+	 */
+	public void setBools(boolean value)
+	{
+
+	}
+
+	/**
+	 *
+	 */
+	public boolean getBoolgs()
+	{
+		return false;
+	}
+
+	/**
+	 *
+	 */
+	public void setBoolgs(boolean value)
+	{
+
+	}
+
+	/**
+	 *
+	 */
+	public boolean getBoolsg()
+	{
+		return false;
+	}
+
+	/**
+	 *
+	 */
+	public void setBoolsg(boolean value)
+	{
+
+	}
+
+	/**
+	 *
+	 */
+	public char getCharg()
+	{
+		return '';
+	}
+
+	/**
+	 *
+	 */
+	public void setChars(char value)
+	{
+
+	}
+
+	/**
+	 *
+	 */
+	public char getChargs()
+	{
+		return '';
+	}
+
+	/**
+	 *
+	 */
+	public void setChargs(char value)
+	{
+
+	}
+
+	/**
+	 *
+	 */
+	public char getCharsg()
+	{
+		return '';
+	}
+
+	/**
+	 *
+	 */
+	public void setCharsg(char value)
+	{
+
+	}
+
+	/**
+	 *
+	 */
+	public String getStrg()
+	{
+		return null;
+	}
+
+	/**
+	 *
+	 */
+	public void setStrs(String value)
+	{
+
+	}
+
+	/**
+	 *
+	 */
+	public String getStrgs()
+	{
+		return null;
+	}
+
+	/**
+	 *
+	 */
+	public void setStrgs(String value)
+	{
+
+	}
+
+	/**
+	 *
+	 */
+	public String getStrsg()
+	{
+		return null;
+	}
+
+	/**
+	 *
+	 */
+	public void setStrsg(String value)
+	{
+
+	}
+
+	/**
+	 *
+	 */
+	public String getStringg()
+	{
+		return null;
+	}
+
+	/**
+	 *
+	 */
+	public void setStrings(String value)
+	{
+
+	}
+
+	/**
+	 *
+	 */
+	public String getStringgs()
+	{
+		return null;
+	}
+
+	/**
+	 *
+	 */
+	public void setStringgs(String value)
+	{
+
+	}
+
+	/**
+	 *
+	 */
+	public String getStringsg()
+	{
+		return null;
+	}
+
+	/**
+	 *
+	 */
+	public void setStringsg(String value)
+	{
+
+	}
+
+	/**
+	 *
+	 */
+	public Object getObjectg()
+	{
+		return null;
+	}
+
+	/**
+	 *
+	 */
+	public void setObjects(Object value)
+	{
+
+	}
+
+	/**
+	 *
+	 */
+	public Object getObjectgs()
+	{
+		return null;
+	}
+
+	/**
+	 *
+	 */
+	public void setObjectgs(Object value)
+	{
+
+	}
+
+	/**
+	 *
+	 */
+	public Object getObjectsg()
+	{
+		return null;
+	}
+
+	/**
+	 *
+	 */
+	public void setObjectsg(Object value)
+	{
+
+	}
+
+	/**
+	 *
+	 */
+	public Integer getIntegerg()
+	{
+		return null;
+	}
+
+	/**
+	 *
+	 */
+	public void setIntegers(Integer value)
+	{
+
+	}
+
+	/**
+	 *
+	 */
+	public Integer getIntegergs()
+	{
+		return null;
+	}
+
+	/**
+	 *
+	 */
+	public void setIntegergs(Integer value)
+	{
+
+	}
+
+	/**
+	 *
+	 */
+	public Integer getIntegersg()
+	{
+		return null;
+	}
+
+	/**
+	 *
+	 */
+	public void setIntegersg(Integer value)
+	{
+
+	}
+
+	/**
+	 *
+	 */
+	public Custom getCustomg()
+	{
+		return null;
+	}
+
+	/**
+	 *
+	 */
+	public void setCustoms(Custom value)
+	{
+
+	}
+
+	/**
+	 *
+	 */
+	public Custom getCustomgs()
+	{
+		return null;
+	}
+
+	/**
+	 *
+	 */
+	public void setCustomgs(Custom value)
+	{
+
+	}
+
+	/**
+	 *
+	 */
+	public Custom getCustomsg()
+	{
+		return null;
+	}
+
+	/**
+	 *
+	 */
+	public void setCustomsg(Custom value)
+	{
+
+	}
+
+	/**
+	 *
+	 */
+	public byte pubByte()
+	{
+		return 0;
+	}
+
+	/**
+	 *
+	 */
+	public short pubShort()
+	{
+		return 0;
+	}
+
+	/**
+	 *
+	 */
+	public int pubInt()
+	{
+		return 0;
+	}
+
+	/**
+	 *
+	 */
+	public long pubLong()
+	{
+		return 0;
+	}
+
+	/**
+	 *
+	 */
+	public float pubFloat()
+	{
+		return 0;
+	}
+
+	/**
+	 *
+	 */
+	public double pubDouble()
+	{
+		return 0;
+	}
+
+	/**
+	 *
+	 */
+	public boolean pubBoolean()
+	{
+		return false;
+	}
+
+	/**
+	 *
+	 */
+	public boolean pubBool()
+	{
+		return false;
+	}
+
+	/**
+	 *
+	 */
+	public char pubChar()
+	{
+		return '';
+	}
+
+	/**
+	 *
+	 */
+	public String pubStr()
+	{
+		return null;
+	}
+
+	/**
+	 *
+	 */
+	public String pubString()
+	{
+		return null;
+	}
+
+	/**
+	 *
+	 */
+	public Object pubObject()
+	{
+		return null;
+	}
+
+	/**
+	 *
+	 */
+	public Integer pubInteger()
+	{
+		return null;
+	}
+
+	/**
+	 *
+	 */
+	public Custom pubCustom()
+	{
+		return null;
+	}
+
+	/**
+	 *
+	 */
+	public void pubVoid()
+	{
+
+	}
+
+	/**
+	 *
+	 */
+	public int pubParameters(int first, String second, Custom third)
+	{
+		return 0;
+	}
+
+	/**
+	 *
+	 */
+	private byte priByte()
+	{
+		return 0;
+	}
+
+	/**
+	 *
+	 */
+	private short priShort()
+	{
+		return 0;
+	}
+
+	/**
+	 *
+	 */
+	private int priInt()
+	{
+		return 0;
+	}
+
+	/**
+	 *
+	 */
+	private long priLong()
+	{
+		return 0;
+	}
+
+	/**
+	 *
+	 */
+	private float priFloat()
+	{
+		return 0;
+	}
+
+	/**
+	 *
+	 */
+	private double priDouble()
+	{
+		return 0;
+	}
+
+	/**
+	 *
+	 */
+	private boolean priBoolean()
+	{
+		return false;
+	}
+
+	/**
+	 *
+	 */
+	private boolean priBool()
+	{
+		return false;
+	}
+
+	/**
+	 *
+	 */
+	private char priChar()
+	{
+		return '';
+	}
+
+	/**
+	 *
+	 */
+	private String priStr()
+	{
+		return null;
+	}
+
+	/**
+	 *
+	 */
+	private String priString()
+	{
+		return null;
+	}
+
+	/**
+	 *
+	 */
+	private Object priObject()
+	{
+		return null;
+	}
+
+	/**
+	 *
+	 */
+	private Integer priInteger()
+	{
+		return null;
+	}
+
+	/**
+	 *
+	 */
+	private Custom priCustom()
+	{
+		return null;
+	}
+
+	/**
+	 *
+	 */
+	private void priVoid()
+	{
+
+	}
+
+	/**
+	 *
+	 */
+	private int priParameters(int first, String second, Custom third)
+	{
+		return 0;
+	}
+
+	/**
+	 *
+	 */
+	protected byte proByte()
+	{
+		return 0;
+	}
+
+	/**
+	 *
+	 */
+	protected short proShort()
+	{
+		return 0;
+	}
+
+	/**
+	 *
+	 */
+	protected int proInt()
+	{
+		return 0;
+	}
+
+	/**
+	 *
+	 */
+	protected long proLong()
+	{
+		return 0;
+	}
+
+	/**
+	 *
+	 */
+	protected float proFloat()
+	{
+		return 0;
+	}
+
+	/**
+	 *
+	 */
+	protected double proDouble()
+	{
+		return 0;
+	}
+
+	/**
+	 *
+	 */
+	protected boolean proBoolean()
+	{
+		return false;
+	}
+
+	/**
+	 *
+	 */
+	protected boolean proBool()
+	{
+		return false;
+	}
+
+	/**
+	 *
+	 */
+	protected char proChar()
+	{
+		return '';
+	}
+
+	/**
+	 *
+	 */
+	protected String proStr()
+	{
+		return null;
+	}
+
+	/**
+	 *
+	 */
+	protected String proString()
+	{
+		return null;
+	}
+
+	/**
+	 *
+	 */
+	protected Object proObject()
+	{
+		return null;
+	}
+
+	/**
+	 *
+	 */
+	protected Integer proInteger()
+	{
+		return null;
+	}
+
+	/**
+	 *
+	 */
+	protected Custom proCustom()
+	{
+		return null;
+	}
+
+	/**
+	 *
+	 */
+	protected void proVoid()
+	{
+
+	}
+
+	/**
+	 *
+	 */
+	protected int proParameters(int first, String second, Custom third)
+	{
+		return 0;
+	}
+}
\ No newline at end of file